@@ -1,9 +1,15 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple, Deque
+from typing import List, Dict, Optional, Tuple, Deque, Callable
 from collections import deque
 from enum import Enum
+import random
 import time
-from packet import Packet
+from packet import Packet, PacketState, scheduled_hop, PACKET_HISTORY_SIZE
+
+# Packet states bound once for the per-packet transitions below
+QUEUED = PacketState.QUEUED
+IN_TRANSIT = PacketState.IN_TRANSIT
+DROPPED = PacketState.DROPPED
 
 # ============================================================================
 # 1. QUEUE DISCIPLINE
@@ -16,7 +22,7 @@ class DropPolicy(Enum):
     RANDOM_DROP = "random_drop"      # Drop random packet
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkQueue:
     """
     Queue buffer for a network link
@@ -26,13 +32,27 @@ class LinkQueue:
     link_id: str
     capacity: int                    # Max packets in queue
     drop_policy: DropPolicy = DropPolicy.TAIL_DROP
-    queue: Deque = field(default_factory=deque)
+    queue: Deque = field(default_factory=deque)  # (packet, enqueue_time) tuples
     
     packets_enqueued: int = 0        # Total packets attempted
     packets_dequeued: int = 0        # Total packets successfully sent
     packets_dropped: int = 0         # Total packets dropped
     total_queue_delay: float = 0.0   # Sum of all queuing delays
     
+    # Drop handler for the configured policy, resolved once
+    _drop_fn: Callable = field(init=False, repr=False, compare=False)
+    # Utilization decile the link color was last computed for (-1 = never)
+    _color_bucket: int = field(default=-1, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Bound the queue to capacity and bind the drop handler for this queue's policy"""
+        self.queue = deque(self.queue, maxlen=self.capacity)
+        self._drop_fn = {
+            DropPolicy.TAIL_DROP: self._tail_drop,
+            DropPolicy.HEAD_DROP: self._head_drop,
+            DropPolicy.RANDOM_DROP: self._random_drop,
+        }[self.drop_policy]
+    
     def enqueue(self, packet, current_time: float) -> bool:
         """
         Add packet to queue
@@ -45,48 +65,37 @@ class LinkQueue:
             True if accepted, False if dropped
         """
         self.packets_enqueued += 1
+        q = self.queue
         
         # Queue has space
-        if len(self.queue) < self.capacity:
-            self.queue.append({
-                'packet': packet,
-                'enqueue_time': current_time
-            })
+        if len(q) < self.capacity:
+            q.append((packet, current_time))
             return True
         
         # Queue is full - apply drop policy
         self.packets_dropped += 1
-        
-        if self.drop_policy == DropPolicy.TAIL_DROP:
-            # Drop newest (don't add it)
-            return False
-        
-        elif self.drop_policy == DropPolicy.HEAD_DROP:
-            # Drop oldest from queue
-            if self.queue:
-                self.queue.popleft()
-                self.queue.append({
-                    'packet': packet,
-                    'enqueue_time': current_time
-                })
-            return True
-        
-        elif self.drop_policy == DropPolicy.RANDOM_DROP:
-            # Drop random from queue
-            import random
-            if self.queue:
-                idx = random.randint(0, len(self.queue) - 1)
-                queue_list = list(self.queue)
-                queue_list.pop(idx)
-                self.queue = deque(queue_list)
-                self.queue.append({
-                    'packet': packet,
-                    'enqueue_time': current_time
-                })
-            return True
-        
+        return self._drop_fn(packet, current_time)
+    
+    def _tail_drop(self, packet, current_time: float) -> bool:
+        """Drop newest (don't add it)"""
         return False
     
+    def _head_drop(self, packet, current_time: float) -> bool:
+        """Drop oldest from queue (the bounded deque evicts it on append)"""
+        self.queue.append((packet, current_time))
+        return True
+    
+    def _random_drop(self, packet, current_time: float) -> bool:
+        """Drop random from queue (rotate in place instead of copying)"""
+        q = self.queue
+        if q:
+            idx = random.randint(0, len(q) - 1)
+            q.rotate(-idx)
+            q.popleft()
+            q.rotate(idx)
+            q.append((packet, current_time))
+        return True
+    
     def dequeue(self, current_time: float) -> Optional[Tuple]:
         """
         Remove packet from front of queue
@@ -100,9 +109,7 @@ class LinkQueue:
         if not self.queue:
             return None
         
-        item = self.queue.popleft()
-        packet = item['packet']
-        enqueue_time = item['enqueue_time']
+        packet, enqueue_time = self.queue.popleft()
         
         # Calculate queuing delay
         queuing_delay = current_time - enqueue_time
@@ -117,9 +124,10 @@ class LinkQueue:
     
     def get_utilization(self) -> float:
         """Queue utilization (0.0 to 1.0)"""
-        if self.capacity == 0:
+        capacity = self.capacity
+        if capacity == 0:
             return 0.0
-        return len(self.queue) / self.capacity
+        return len(self.queue) / capacity
     
     def get_avg_delay(self) -> float:
         """Average queuing delay"""
@@ -131,9 +139,27 @@ class LinkQueue:
         """Check if queue is full"""
         return len(self.queue) >= self.capacity
     
+    def color_bucket_changed(self) -> bool:
+        """
+        Check whether utilization moved to a different 10% bucket
+        
+        Link colors only change at 50% and 90% utilization, so the link
+        color needs recomputing only when the bucket changes.
+        
+        Returns:
+            True if the bucket differs from the last call, False otherwise
+        """
+        capacity = self.capacity
+        bucket = len(self.queue) * 10 // capacity if capacity > 0 else 0
+        if bucket == self._color_bucket:
+            return False
+        self._color_bucket = bucket
+        return True
+    
     def clear(self) -> None:
         """Clear all packets from queue"""
         self.queue.clear()
+        self._color_bucket = -1
     
     def to_dict(self) -> dict:
         """Serialize to dictionary"""
@@ -170,12 +196,22 @@ class CongestionController:
         self.network_manager = network_manager
         self.animator_worker = animator_worker
         
-        self.link_queues: Dict[str, LinkQueue] = {}
-        self.congestion_windows: Dict[str, float] = {}  # TCP-like CWND
-        self.drop_history: List[dict] = []
-        self.congestion_events: List[dict] = []
+        self.link_queues: Dict[str, LinkQueue] = {}  # link_id -> queue (UI/export)
+        
+        # Per-link state indexed by link.idx (hot path)
+        self._queues: List[LinkQueue] = []
+        self._cwnds: List[float] = []       # TCP-like CWND
+        self._max_cwnds: List[float] = []   # CWND ceiling
+        
+        # Bumped on any queue activity; per-tick rollups are cached against it
+        self._queue_version = 0
+        self._history_cache: Dict[str, dict] = {}
+        self._history_version = -1
+        self._stats_cache: dict = {}
+        self._stats_version = -1
         
         self.total_packets_dropped = 0
+        self.total_congestion_events = 0  # CWND reductions
         self.enable_tcp_congestion = True  # TCP-like congestion control
     
     def create_link_queue(self, link_id: str, capacity: int,
@@ -197,12 +233,63 @@ class CongestionController:
             drop_policy=drop_policy
         )
         self.link_queues[link_id] = queue
+        self._queue_version += 1
+        
+        # Give the link an index into the per-link lists
+        idx = len(self._queues)
+        link = self.network_manager.links.get(link_id)
+        if link is not None:
+            link.idx = idx
+        self._queues.append(queue)
         
-        # Initialize congestion window
-        self.congestion_windows[link_id] = float(capacity)
+        # Initialize congestion window (starts at, and is capped by, capacity)
+        self._cwnds.append(float(capacity))
+        self._max_cwnds.append(float(capacity))
         
         return queue
     
+    def remove_link_queue(self, link_id: str) -> bool:
+        """
+        Remove a link's queue
+        
+        The last queue moves into the freed slot so the per-link lists
+        stay dense; the moved link's idx is updated to match. The caller
+        resets the removed link's own idx.
+        
+        Args:
+            link_id: Link identifier
+        
+        Returns:
+            True if the link had a queue, False otherwise
+        """
+        queue = self.link_queues.pop(link_id, None)
+        if queue is None:
+            return False
+        self._queue_version += 1
+        
+        idx = self._queues.index(queue)
+        last = len(self._queues) - 1
+        if idx != last:
+            moved = self._queues[idx] = self._queues[last]
+            self._cwnds[idx] = self._cwnds[last]
+            self._max_cwnds[idx] = self._max_cwnds[last]
+            moved_link = self.network_manager.links.get(moved.link_id)
+            if moved_link is not None:
+                moved_link.idx = idx
+        
+        self._queues.pop()
+        self._cwnds.pop()
+        self._max_cwnds.pop()
+        return True
+    
+    @property
+    def congestion_windows(self) -> Dict[str, float]:
+        """Current congestion window per link ID"""
+        return {
+            queue.link_id: cwnd
+            for queue, cwnd in zip(self._queues, self._cwnds)
+        }
+    
     def process_packet_on_link(self, packet, link, current_time: float) -> bool:
         """
         Process packet on link (queueing, dropping, etc.)
@@ -215,35 +302,38 @@ class CongestionController:
         Returns:
             True if packet accepted to queue, False if dropped
         """
-        if link.id not in self.link_queues:
+        idx = link.idx
+        if idx < 0:
             # No queue configured for this link
             return True
-        
-        queue = self.link_queues[link.id]
+        queue = self._queues[idx]
         
         # Try to enqueue
         accepted = queue.enqueue(packet, current_time)
+        self._queue_version += 1
+        tcp_enabled = self.enable_tcp_congestion
         
         if not accepted:
             # Packet dropped
             self.total_packets_dropped += 1
-            self._record_drop(packet.id, link.id, current_time)
             
             # Update link color to indicate congestion
-            link.update_queue_color()
+            if queue.color_bucket_changed():
+                link.update_queue_color()
             
             # TCP-like: reduce congestion window on drop
-            if self.enable_tcp_congestion:
-                self._handle_packet_drop(link.id)
+            if tcp_enabled:
+                self._handle_packet_drop(idx)
         
         else:
             # Packet accepted
-            link.current_queue = queue.get_size()
-            link.update_queue_color()
+            link.current_queue = len(queue.queue)
+            if queue.color_bucket_changed():
+                link.update_queue_color()
             
             # TCP-like: increase congestion window on success
-            if self.enable_tcp_congestion:
-                self._handle_packet_success(link.id)
+            if tcp_enabled:
+                self._handle_packet_success(idx)
         
         return accepted
     
@@ -258,92 +348,87 @@ class CongestionController:
         Returns:
             Tuple (packet, queuing_delay_ms) or None
         """
-        if link.id not in self.link_queues:
+        idx = link.idx
+        if idx < 0:
             return None
+        queue = self._queues[idx]
         
-        queue = self.link_queues[link.id]
         result = queue.dequeue(current_time)
         
         if result:
-            link.current_queue = queue.get_size()
-            link.update_queue_color()
+            self._queue_version += 1
+            link.current_queue = len(queue.queue)
+            if queue.color_bucket_changed():
+                link.update_queue_color()
         
         return result
     
-    def _handle_packet_drop(self, link_id: str) -> None:
+    def _handle_packet_drop(self, idx: int) -> None:
         """TCP-like: reduce congestion window on packet drop"""
-        if link_id in self.congestion_windows:
-            # TCP Reno: CWND = CWND / 2 (multiplicative decrease)
-            self.congestion_windows[link_id] = max(1.0, 
-                self.congestion_windows[link_id] / 2.0
-            )
-            self._record_congestion_event(link_id, "drop", 
-                self.congestion_windows[link_id])
+        # TCP Reno: CWND = CWND / 2 (multiplicative decrease)
+        cwnd = max(1.0, self._cwnds[idx] / 2.0)
+        self._cwnds[idx] = cwnd
+        self.total_congestion_events += 1
     
-    def _handle_packet_success(self, link_id: str) -> None:
+    def _handle_packet_success(self, idx: int) -> None:
         """TCP-like: increase congestion window on packet success"""
-        if link_id in self.congestion_windows:
-            # TCP Reno: CWND = CWND + 1 (additive increase)
-            max_cwnd = self.network_manager.links[link_id].queue_size
-            self.congestion_windows[link_id] = min(float(max_cwnd),
-                self.congestion_windows[link_id] + 0.1
-            )
-    
-    def _record_drop(self, packet_id: str, link_id: str, time_ms: float) -> None:
-        """Record dropped packet"""
-        self.drop_history.append({
-            "packet_id": packet_id,
-            "link_id": link_id,
-            "time_ms": time_ms
-        })
-    
-    def _record_congestion_event(self, link_id: str, event_type: str, 
-                                cwnd: float) -> None:
-        """Record congestion event"""
-        self.congestion_events.append({
-            "link_id": link_id,
-            "event_type": event_type,
-            "cwnd": cwnd,
-            "time_ms": self.animator_worker.sim_time
-        })
+        # TCP Reno: CWND = CWND + 1 (additive increase)
+        cwnd = self._cwnds[idx] + 0.1
+        max_cwnd = self._max_cwnds[idx]
+        self._cwnds[idx] = cwnd if cwnd < max_cwnd else max_cwnd
     
     def get_link_queue(self, link_id: str) -> Optional[LinkQueue]:
         """Get queue for specific link"""
         return self.link_queues.get(link_id)
     
     def get_statistics(self) -> dict:
-        """Get congestion statistics"""
-        total_dropped = sum(q.packets_dropped for q in self.link_queues.values())
-        total_enqueued = sum(q.packets_enqueued for q in self.link_queues.values())
+        """Get congestion statistics (cached until a queue changes)"""
+        if self._stats_version == self._queue_version:
+            return self._stats_cache
+        
+        total_dropped = 0
+        total_enqueued = 0
+        total_depth = 0
+        
+        # Single pass over all queues
+        for q in self.link_queues.values():
+            total_dropped += q.packets_dropped
+            total_enqueued += q.packets_enqueued
+            total_depth += len(q.queue)
         
         drop_rate = (total_dropped / total_enqueued * 100) if total_enqueued > 0 else 0
         
         avg_queue_depth = 0
         if self.link_queues:
-            avg_queue_depth = sum(q.get_size() for q in self.link_queues.values()) / len(self.link_queues)
+            avg_queue_depth = total_depth / len(self.link_queues)
         
-        return {
+        self._stats_cache = {
             "total_dropped": total_dropped,
             "total_enqueued": total_enqueued,
             "drop_rate": drop_rate,
             "avg_queue_depth": avg_queue_depth,
-            "congestion_events": len(self.congestion_events),
-        }
-    
-    def get_queue_history(self) -> Dict[str, List[dict]]:
-        """Get queue statistics for all links"""
-        return {
-            link_id: queue.to_dict() 
-            for link_id, queue in self.link_queues.items()
+            "congestion_events": self.total_congestion_events,
         }
+        self._stats_version = self._queue_version
+        return self._stats_cache
+    
+    def get_queue_history(self) -> Dict[str, dict]:
+        """Get queue statistics for all links (cached until a queue changes)"""
+        if self._history_version != self._queue_version:
+            self._history_cache = {
+                link_id: queue.to_dict() 
+                for link_id, queue in self.link_queues.items()
+            }
+            self._history_version = self._queue_version
+        return self._history_cache
     
     def clear_all(self) -> None:
         """Clear all congestion data"""
         for queue in self.link_queues.values():
             queue.clear()
-        self.drop_history.clear()
-        self.congestion_events.clear()
+        self._queue_version += 1
         self.total_packets_dropped = 0
+        self.total_congestion_events = 0
 
 
 # ============================================================================
@@ -374,11 +459,10 @@ class QueueAwarePacketManager:
         self.latency_engine = latency_engine
         self.congestion_controller = congestion_controller
         
-        self.all_packets: List = []
-        self.active_packets: Dict[str, 'Packet'] = {}
+        self.active_packets: Dict[int, 'Packet'] = {}  # Packets still in flight, by ID
         self.queued_packets: Dict[str, List] = {}  # link_id -> packets in queue
-        self.delivered_packets: List = []
-        self.dropped_packets: List = []
+        self.delivered_packets: Deque = deque(maxlen=PACKET_HISTORY_SIZE)  # Most recent only
+        self.dropped_packets: Deque = deque(maxlen=PACKET_HISTORY_SIZE)
         self.packet_counter = 0
     
     def create_packet(self, source_id: str, dest_id: str, size: int = 1024):
@@ -402,7 +486,7 @@ class QueueAwarePacketManager:
             return None
         
         self.packet_counter += 1
-        packet_id = f"PKT{self.packet_counter:04d}"
+        packet_id = self.packet_counter
         current_time = self.animator_worker.sim_time
         
         # Get path
@@ -411,8 +495,6 @@ class QueueAwarePacketManager:
         
         path_nodes = self.path_manager.get_current_path_nodes()
         
-        from packet import Packet, PacketState
-        
         packet = Packet(
             id=packet_id,
             source_node_id=source_id,
@@ -421,12 +503,12 @@ class QueueAwarePacketManager:
             sent_time=current_time,
             size=size,
             path=path_nodes,
-            state=PacketState.QUEUED
+            state=QUEUED
         )
         
         packet.current_node_id = source_id
+        packet.hop_schedule = self.path_manager.get_current_hop_schedule()
         
-        self.all_packets.append(packet)
         self.active_packets[packet_id] = packet
         
         # Create metrics
@@ -436,28 +518,87 @@ class QueueAwarePacketManager:
         
         return packet
     
-    def start_packet_animation(self, packet) -> bool:
+    def create_packets_batch(self, source_id: str, dest_id: str,
+                            sizes: List[int]) -> List['Packet']:
         """
-        Start animating a packet on first link
+        Create several packets between the same pair of nodes
+        
+        Validates the nodes and resolves the path once for the whole batch.
         
         Args:
-            packet: Packet to animate
+            source_id: Source node ID
+            dest_id: Destination node ID
+            sizes: Packet size (bytes) for each packet to create
         
         Returns:
-            True if animation started, False otherwise
+            List of created packets (empty if invalid)
+        """
+        # Validate nodes
+        if source_id not in self.network_manager.nodes or \
+           dest_id not in self.network_manager.nodes:
+            return []
+        
+        if source_id == dest_id or not sizes:
+            return []
+        
+        # Get path once for all packets
+        if not self.path_manager.set_path(source_id, dest_id):
+            return []
+        
+        path_nodes = self.path_manager.get_current_path_nodes()
+        hop_schedule = self.path_manager.get_current_hop_schedule()
+        current_time = self.animator_worker.sim_time
+        
+        first_id = self.packet_counter + 1
+        self.packet_counter += len(sizes)
+        
+        packets = [
+            Packet(
+                id=packet_id,
+                source_node_id=source_id,
+                destination_node_id=dest_id,
+                creation_time=current_time,
+                sent_time=current_time,
+                size=size,
+                path=path_nodes,
+                state=QUEUED
+            )
+            for packet_id, size in zip(range(first_id, self.packet_counter + 1), sizes)
+        ]
+        
+        active_packets = self.active_packets
+        create_metrics = self.latency_engine.create_packet_metrics
+        for packet in packets:
+            packet.current_node_id = source_id
+            packet.hop_schedule = hop_schedule
+            active_packets[packet.id] = packet
+            create_metrics(
+                packet.id, source_id, dest_id, path_nodes, packet.size, current_time
+            )
+        
+        return packets
+    
+    def _enter_first_link(self, packet) -> Optional[Tuple]:
+        """
+        Queue a packet onto the first link of its path
+        
+        Args:
+            packet: Packet to send
+        
+        Returns:
+            (packet, node_a_pos, node_b_pos, latency) for the animator,
+            or None if the packet was dropped
         """
         if len(packet.path) < 2:
             self.drop_packet(packet)
-            return False
+            return None
         
         # Get first link
-        node_a_id = packet.path[0]
-        node_b_id = packet.path[1]
-        
-        link = self.network_manager.get_link_by_nodes(node_a_id, node_b_id)
-        if not link:
+        hop = scheduled_hop(packet, 0, self.network_manager)
+        if hop is None:
             self.drop_packet(packet)
-            return False
+            return None
+        link, node_a, node_b = hop
         
         # ← NEW IN STAGE 5: Process through queue/congestion
         accepted = self.congestion_controller.process_packet_on_link(
@@ -467,29 +608,55 @@ class QueueAwarePacketManager:
         if not accepted:
             # Packet was dropped by queue
             self.drop_packet(packet)
-            return False
-        
-        node_a = self.network_manager.nodes[node_a_id]
-        node_b = self.network_manager.nodes[node_b_id]
+            return None
         
-        from packet import PacketState
-        packet.state = PacketState.IN_TRANSIT
+        packet.state = IN_TRANSIT
         packet.current_link_index = 0
         packet.link_latency = link.latency
         
         # Record sent time
         self.latency_engine.record_packet_sent(packet.id, self.animator_worker.sim_time)
         
-        # Add to animator
-        self.animator_worker.add_packet(
-            packet,
-            (node_a.x, node_a.y),
-            (node_b.x, node_b.y),
-            link.latency
-        )
+        return (packet, (node_a.x, node_a.y), (node_b.x, node_b.y), link.latency)
+    
+    def start_packet_animation(self, packet) -> bool:
+        """
+        Start animating a packet on first link
+        
+        Args:
+            packet: Packet to animate
+        
+        Returns:
+            True if animation started, False otherwise
+        """
+        item = self._enter_first_link(packet)
+        if item is None:
+            return False
         
+        # Add to animator
+        self.animator_worker.add_packet(*item)
         return True
     
+    def start_packet_animations(self, packets: List['Packet']) -> int:
+        """
+        Start animating several packets, handing them to the animator at once
+        
+        Args:
+            packets: Packets to animate
+        
+        Returns:
+            Number of packets whose animation started
+        """
+        items = []
+        for packet in packets:
+            item = self._enter_first_link(packet)
+            if item is not None:
+                items.append(item)
+        
+        if items:
+            self.animator_worker.add_packets(items)
+        return len(items)
+    
     def advance_packet(self, packet) -> bool:
         """
         Move packet to next link in path
@@ -501,57 +668,98 @@ class QueueAwarePacketManager:
             True if packet reached destination, False otherwise
         """
         current_time = self.animator_worker.sim_time
-        from packet import PacketState
         
         if packet.move_to_next_link(current_time):
             # Reached destination
             packet.mark_delivered(current_time)
             self.latency_engine.record_packet_delivery(packet.id, current_time)
             self.delivered_packets.append(packet)
-            if packet.id in self.active_packets:
-                del self.active_packets[packet.id]
+            self.active_packets.pop(packet.id, None)
             return True
         
         # Start animation on next link
-        if packet.path_index + 1 < len(packet.path):
-            node_a_id = packet.path[packet.path_index]
-            node_b_id = packet.path[packet.path_index + 1]
+        # move_to_next_link() returned False, so there is a next hop
+        hop = scheduled_hop(packet, packet.path_index, self.network_manager)
+        if hop is not None:
+            link, node_a, node_b = hop
             
-            link = self.network_manager.get_link_by_nodes(node_a_id, node_b_id)
-            if link:
-                # ← NEW IN STAGE 5: Process through queue/congestion
-                accepted = self.congestion_controller.process_packet_on_link(
-                    packet, link, current_time
-                )
-                
-                if not accepted:
-                    # Packet dropped
+            # ← NEW IN STAGE 5: Process through queue/congestion
+            accepted = self.congestion_controller.process_packet_on_link(
+                packet, link, current_time
+            )
+            
+            if not accepted:
+                # Packet dropped
+                self.drop_packet(packet)
+                return False
+            
+            packet.link_latency = link.latency
+            
+            self.animator_worker.add_packet(
+                packet,
+                (node_a.x, node_a.y),
+                (node_b.x, node_b.y),
+                link.latency
+            )
+        
+        return False
+    
+    def advance_batch(self, packets: List) -> int:
+        """
+        Advance several packets that finished their link in the same frame
+        
+        Same per-packet behaviour as advance_packet(), with lookups bound
+        once and the next-link animations added to the animator in one call.
+        
+        Args:
+            packets: Packets to advance
+        
+        Returns:
+            Number of packets that reached their destination
+        """
+        current_time = self.animator_worker.sim_time
+        record_delivery = self.latency_engine.record_packet_delivery
+        process_on_link = self.congestion_controller.process_packet_on_link
+        delivered_packets = self.delivered_packets
+        active_packets = self.active_packets
+        network_manager = self.network_manager
+        items = []
+        delivered = 0
+        
+        for packet in packets:
+            if packet.move_to_next_link(current_time):
+                # Reached destination
+                packet.mark_delivered(current_time)
+                record_delivery(packet.id, current_time)
+                delivered_packets.append(packet)
+                active_packets.pop(packet.id, None)
+                delivered += 1
+                continue
+            
+            # Queue animation on next link, through the link's queue
+            # move_to_next_link() returned False, so there is a next hop
+            hop = scheduled_hop(packet, packet.path_index, network_manager)
+            if hop is not None:
+                link, node_a, node_b = hop
+                if not process_on_link(packet, link, current_time):
                     self.drop_packet(packet)
-                    return False
-                
-                node_a = self.network_manager.nodes[node_a_id]
-                node_b = self.network_manager.nodes[node_b_id]
+                    continue
                 
                 packet.link_latency = link.latency
-                
-                self.animator_worker.add_packet(
-                    packet,
-                    (node_a.x, node_a.y),
-                    (node_b.x, node_b.y),
-                    link.latency
-                )
+                items.append((packet, (node_a.x, node_a.y),
+                              (node_b.x, node_b.y), link.latency))
         
-        return False
+        if items:
+            self.animator_worker.add_packets(items)
+        return delivered
     
     def drop_packet(self, packet, reason: str = "congestion") -> None:
         """Mark packet as dropped"""
-        from packet import PacketState
-        packet.state = PacketState.DROPPED
+        packet.state = DROPPED
         packet.mark_dropped()
         self.latency_engine.record_packet_drop(packet.id)
         self.dropped_packets.append(packet)
-        if packet.id in self.active_packets:
-            del self.active_packets[packet.id]
+        self.active_packets.pop(packet.id, None)
         self.animator_worker.remove_packet(packet.id)
     
     def get_statistics(self) -> dict:
@@ -562,11 +770,14 @@ class QueueAwarePacketManager:
         return {
             **latency_stats,
             **congestion_stats,
+            "active": len(self.active_packets),
         }
     
     def clear_all(self) -> None:
         """Clear all packets and metrics"""
-        self.all_packets.clear()
+        remove_from_animator = self.animator_worker.remove_packet
+        for packet_id in self.active_packets:
+            remove_from_animator(packet_id)
         self.active_packets.clear()
         self.queued_packets.clear()
         self.delivered_packets.clear()
@@ -585,6 +796,9 @@ class CongestionMetricsDisplay:
     Display for congestion and queue metrics
     """
     
+    BORDER = "═══════════════════════════════════════════════════════════"
+    HEADER = f"{BORDER}\n🔴 CONGESTION & QUEUE METRICS\n{BORDER}\n"
+    
     def __init__(self, label_widget, congestion_controller: CongestionController,
                  latency_engine):
         """
@@ -598,16 +812,28 @@ class CongestionMetricsDisplay:
         self.label = label_widget
         self.congestion_controller = congestion_controller
         self.latency_engine = latency_engine
+        self._last_key = None  # Displayed values from the last refresh
     
     def update_display(self) -> None:
-        """Update congestion metrics display"""
+        """Update congestion metrics display (skipped if nothing changed)"""
         stats = self.congestion_controller.get_statistics()
         latency_stats = self.latency_engine.get_summary_statistics()
         
+        key = (
+            stats['total_dropped'],
+            round(stats['drop_rate'], 1),
+            stats['congestion_events'],
+            round(stats['avg_queue_depth'], 1),
+            stats['total_enqueued'],
+            round(latency_stats['avg_latency_ms'], 2),
+            round(latency_stats['max_latency_ms'], 2),
+        )
+        if key == self._last_key:
+            return
+        self._last_key = key
+        
         display_text = (
-            f"═══════════════════════════════════════════════════════════\n"
-            f"🔴 CONGESTION & QUEUE METRICS\n"
-            f"═══════════════════════════════════════════════════════════\n"
+            f"{self.HEADER}"
             f"\n"
             f"📦 PACKET DROPPING\n"
             f"  Total Dropped:   {stats['total_dropped']} packets\n"
@@ -623,7 +849,7 @@ class CongestionMetricsDisplay:
             f"  Max Latency:     {latency_stats['max_latency_ms']:.2f} ms\n"
             f"  (Congestion increases latency!)\n"
             f"\n"
-            f"═══════════════════════════════════════════════════════════"
+            f"{self.BORDER}"
         )
         
         self.label.config(text=display_text)
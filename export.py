@@ -1,8 +1,65 @@
 import csv
 import json
 from datetime import datetime
-from typing import Dict, List
+from itertools import islice
+from operator import attrgetter
+from typing import Dict, List, Optional
 import os
+from concurrent.futures import ThreadPoolExecutor
+from packet import format_packet_id
+
+try:
+    import orjson  # Optional: much faster JSON encoder
+except ImportError:
+    orjson = None
+
+# Large write buffer: exports are big sequential writes made of many small pieces
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Columnar metrics export: column name -> PacketMetrics attribute
+# (same names as PacketMetrics.to_dict(), plus the joined path)
+METRICS_COLUMNS = (
+    ("packet_id", "packet_id"),
+    ("source", "source_node_id"),
+    ("destination", "destination_node_id"),
+    ("state", "state"),
+    ("size_bytes", "packet_size"),
+    ("hops", "hop_count"),
+    ("theoretical_latency_ms", "total_latency"),
+    ("actual_latency_ms", "actual_latency"),
+    ("bottleneck_bandwidth_mbps", "bottleneck_bandwidth"),
+    ("throughput_mbps", "throughput"),
+    ("creation_time_ms", "creation_time"),
+    ("delivery_time_ms", "delivery_time"),
+    ("path", "path_str"),
+)
+
+# Result of the first _import_pyarrow() call (module, or None if missing)
+_pyarrow = None
+_pyarrow_checked = False
+
+
+def _import_pyarrow():
+    """
+    Import pyarrow on first use (optional, and slow to import)
+    
+    The outcome is remembered, so a missing pyarrow costs one failed
+    import per process rather than one per export.
+    
+    Returns:
+        pyarrow module with parquet/feather loaded, or None if not installed
+    """
+    global _pyarrow, _pyarrow_checked
+    if not _pyarrow_checked:
+        try:
+            import pyarrow
+            import pyarrow.feather
+            import pyarrow.parquet
+            _pyarrow = pyarrow
+        except ImportError:
+            _pyarrow = None
+        _pyarrow_checked = True
+    return _pyarrow
 
 # ============================================================================
 # 1. DATA EXPORT ENGINE
@@ -25,27 +82,99 @@ class DataExportEngine:
         self.network_manager = network_manager
         self.latency_engine = latency_engine
         self.congestion_controller = congestion_controller
+        self._timestamp: Optional[datetime] = None  # Injected via set_timestamp()
     
-    def export_metrics_to_csv(self, filename: str = None) -> bool:
+    def set_timestamp(self, timestamp: Optional[datetime]) -> None:
+        """
+        Stamp subsequent exports with a fixed time
+        
+        Args:
+            timestamp: Time to use for default filenames and the topology
+                timestamp field, or None to use the current time per export
+        """
+        self._timestamp = timestamp
+    
+    def _now(self) -> datetime:
+        """Injected timestamp, or the current time"""
+        return self._timestamp or datetime.now()
+    
+    def _default_filename(self, prefix: str, extension: str) -> str:
+        """Build a timestamped default filename (e.g., metrics_20240101_120000.csv)"""
+        return f"{prefix}_{self._now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+    
+    # ------------------------------------------------------------------
+    # Snapshots: copies of live simulation state that writers can use
+    # off the UI thread while the simulation keeps changing
+    # ------------------------------------------------------------------
+    
+    def _metrics_rows(self) -> List[tuple]:
+        """Packet metrics as value tuples, one field per METRICS_COLUMNS entry"""
+        getter = attrgetter(*(attr for _, attr in METRICS_COLUMNS))
+        return list(map(getter, self.latency_engine.iter_metrics()))
+    
+    def _queue_history(self) -> Dict[str, dict]:
+        """Copy of the per-link queue statistics"""
+        return {
+            link_id: dict(stats)
+            for link_id, stats in self.congestion_controller.get_queue_history().items()
+        }
+    
+    def _summary(self) -> dict:
+        """Figures for the summary sheet"""
+        return {
+            "latency_stats": dict(self.latency_engine.get_summary_statistics()),
+            "congestion_stats": dict(self.congestion_controller.get_statistics()),
+            "node_count": len(self.network_manager.nodes),
+            "link_count": len(self.network_manager.links),
+        }
+    
+    def _topology(self) -> dict:
+        """Serialized nodes and links"""
+        return {
+            "nodes": [node.to_dict() for node in self.network_manager.nodes.values()],
+            "links": [link.to_dict() for link in self.network_manager.links.values()],
+        }
+    
+    def take_snapshot(self) -> dict:
+        """
+        Copy everything export_all() writes
+        
+        Call this on the thread that owns the simulation (the Tk thread);
+        the result can then be exported from any thread.
+        
+        Returns:
+            Dictionary with the export timestamp, metrics rows, queue
+            history, summary figures and topology
+        """
+        return {
+            "timestamp": self._now(),
+            "metrics": self._metrics_rows(),
+            "queue_history": self._queue_history(),
+            "summary": self._summary(),
+            "topology": self._topology(),
+        }
+    
+    def export_metrics_to_csv(self, filename: str = None,
+                              snapshot: Optional[dict] = None) -> bool:
         """
         Export packet metrics to CSV
         
         Args:
             filename: Output filename (auto-generated if None)
+            snapshot: take_snapshot() result (live state is read if None)
         
         Returns:
             True if successful, False otherwise
         """
         if not filename:
-            filename = f"metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            filename = self._default_filename("metrics", "csv")
         
         try:
-            metrics_dict = self.latency_engine.get_all_metrics()
-            
-            if not metrics_dict:
+            rows = snapshot["metrics"] if snapshot else self._metrics_rows()
+            if not rows:
                 return False
             
-            with open(filename, 'w', newline='') as f:
+            with open(filename, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 
                 # Write header
@@ -57,24 +186,8 @@ class DataExportEngine:
                     "Delivery Time (ms)"
                 ])
                 
-                # Write packet data
-                for metrics in sorted(metrics_dict.values(), 
-                                     key=lambda x: x.packet_id):
-                    writer.writerow([
-                        metrics.packet_id,
-                        metrics.source_node_id,
-                        metrics.destination_node_id,
-                        " → ".join(metrics.path_nodes),
-                        metrics.packet_size,
-                        metrics.hop_count,
-                        f"{metrics.total_latency:.2f}",
-                        f"{metrics.actual_latency:.2f}",
-                        f"{metrics.bottleneck_bandwidth:.1f}",
-                        f"{metrics.throughput:.2f}",
-                        metrics.state,
-                        f"{metrics.creation_time:.2f}",
-                        f"{metrics.delivery_time:.2f}"
-                    ])
+                # Write packet data (insertion order is packet ID order)
+                writer.writerows(map(self._metrics_row_builder(), rows))
             
             return True
         
@@ -82,23 +195,157 @@ class DataExportEngine:
             print(f"Error exporting metrics: {e}")
             return False
     
-    def export_congestion_to_csv(self, filename: str = None) -> bool:
+    @staticmethod
+    def _metrics_row_builder():
+        """
+        Make a row builder for the packet metrics CSV
+        
+        Theoretical latency and bottleneck bandwidth are the same for every
+        packet on a path, so their formatted strings are memoized for the
+        duration of one export instead of being re-formatted per row.
+        
+        Returns:
+            Function mapping a metrics row (see _metrics_rows) to its CSV row
+        """
+        latency_strs: Dict[float, str] = {}
+        bandwidth_strs: Dict[float, str] = {}
+        
+        def metrics_row(values: tuple) -> list:
+            (packet_id, source, destination, state, size, hops, total_latency,
+             actual_latency, bandwidth, throughput, creation_time,
+             delivery_time, path_str) = values
+            
+            latency_str = latency_strs.get(total_latency)
+            if latency_str is None:
+                latency_str = latency_strs[total_latency] = f"{total_latency:.2f}"
+            
+            bandwidth_str = bandwidth_strs.get(bandwidth)
+            if bandwidth_str is None:
+                bandwidth_str = bandwidth_strs[bandwidth] = f"{bandwidth:.1f}"
+            
+            return [
+                format_packet_id(packet_id),
+                source,
+                destination,
+                path_str,
+                size,
+                hops,
+                latency_str,
+                f"{actual_latency:.2f}",
+                bandwidth_str,
+                f"{throughput:.2f}",
+                state,
+                f"{creation_time:.2f}",
+                f"{delivery_time:.2f}"
+            ]
+        
+        return metrics_row
+    
+    def _metrics_table(self, pa, snapshot: Optional[dict] = None):
+        """
+        Build a columnar table of packet metrics
+        
+        Args:
+            pa: pyarrow module
+            snapshot: take_snapshot() result (live state is read if None)
+        
+        Returns:
+            pyarrow.Table in packet ID order, or None if there are no metrics
+        """
+        rows = snapshot["metrics"] if snapshot else self._metrics_rows()
+        if not rows:
+            return None
+        
+        # Transpose rows into columns instead of building a dict per packet
+        columns = {
+            name: list(column)
+            for (name, _), column in zip(METRICS_COLUMNS, zip(*rows))
+        }
+        return pa.Table.from_pydict(columns)
+    
+    def export_metrics_to_parquet(self, filename: str = None,
+                                  snapshot: Optional[dict] = None) -> bool:
+        """
+        Export packet metrics to Parquet (requires pyarrow)
+        
+        Args:
+            filename: Output filename (auto-generated if None)
+            snapshot: take_snapshot() result (live state is read if None)
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if not filename:
+            filename = self._default_filename("metrics", "parquet")
+        
+        pa = _import_pyarrow()
+        if pa is None:
+            print("Error exporting metrics to Parquet: pyarrow is not installed")
+            return False
+        
+        try:
+            table = self._metrics_table(pa, snapshot)
+            if table is None:
+                return False
+            
+            pa.parquet.write_table(table, filename, compression='zstd')
+            return True
+        
+        except Exception as e:
+            print(f"Error exporting metrics to Parquet: {e}")
+            return False
+    
+    def export_metrics_to_feather(self, filename: str = None,
+                                  snapshot: Optional[dict] = None) -> bool:
+        """
+        Export packet metrics to Feather (requires pyarrow)
+        
+        Args:
+            filename: Output filename (auto-generated if None)
+            snapshot: take_snapshot() result (live state is read if None)
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if not filename:
+            filename = self._default_filename("metrics", "feather")
+        
+        pa = _import_pyarrow()
+        if pa is None:
+            print("Error exporting metrics to Feather: pyarrow is not installed")
+            return False
+        
+        try:
+            table = self._metrics_table(pa, snapshot)
+            if table is None:
+                return False
+            
+            pa.feather.write_feather(table, filename, compression='zstd')
+            return True
+        
+        except Exception as e:
+            print(f"Error exporting metrics to Feather: {e}")
+            return False
+    
+    def export_congestion_to_csv(self, filename: str = None,
+                                 snapshot: Optional[dict] = None) -> bool:
         """
         Export congestion and queue statistics to CSV
         
         Args:
             filename: Output filename
+            snapshot: take_snapshot() result (live state is read if None)
         
         Returns:
             True if successful, False otherwise
         """
         if not filename:
-            filename = f"congestion_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            filename = self._default_filename("congestion", "csv")
         
         try:
-            queue_stats = self.congestion_controller.get_queue_history()
+            queue_stats = snapshot["queue_history"] if snapshot else self._queue_history()
             
-            with open(filename, 'w', newline='') as f:
+            with open(filename, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 
                 # Write header
@@ -109,8 +356,8 @@ class DataExportEngine:
                 ])
                 
                 # Write link queue data
-                for link_id, stats in queue_stats.items():
-                    writer.writerow([
+                writer.writerows(
+                    (
                         link_id,
                         stats['capacity'],
                         stats['current_size'],
@@ -119,7 +366,9 @@ class DataExportEngine:
                         stats['packets_dequeued'],
                         stats['packets_dropped'],
                         f"{stats['avg_delay_ms']:.2f}"
-                    ])
+                    )
+                    for link_id, stats in queue_stats.items()
+                )
             
             return True
         
@@ -127,66 +376,72 @@ class DataExportEngine:
             print(f"Error exporting congestion data: {e}")
             return False
     
-    def export_summary_to_csv(self, filename: str = None) -> bool:
+    def export_summary_to_csv(self, filename: str = None,
+                              snapshot: Optional[dict] = None) -> bool:
         """
         Export overall simulation summary to CSV
         
         Args:
             filename: Output filename
+            snapshot: take_snapshot() result (live state is read if None)
         
         Returns:
             True if successful, False otherwise
         """
         if not filename:
-            filename = f"summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            filename = self._default_filename("summary", "csv")
         
         try:
-            latency_stats = self.latency_engine.get_summary_statistics()
-            congestion_stats = self.congestion_controller.get_statistics()
+            summary = snapshot["summary"] if snapshot else self._summary()
+            latency_stats = summary["latency_stats"]
+            congestion_stats = summary["congestion_stats"]
             
-            with open(filename, 'w', newline='') as f:
+            with open(filename, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 
-                # Write simulation summary
-                writer.writerow(["SIMULATION SUMMARY"])
-                writer.writerow([])
-                
-                writer.writerow(["Metric", "Value"])
-                writer.writerow([])
-                
-                # Packet statistics
-                writer.writerow(["PACKET STATISTICS"])
-                writer.writerow(["Total Sent", latency_stats['total_sent']])
-                writer.writerow(["Total Delivered", latency_stats['total_delivered']])
-                writer.writerow(["Total Dropped", latency_stats['total_dropped']])
-                writer.writerow(["Delivery Rate (%)", f"{latency_stats['delivery_rate']:.1f}"])
-                writer.writerow(["Drop Rate (%)", f"{latency_stats['drop_rate']:.1f}"])
-                writer.writerow([])
-                
-                # Latency statistics
-                writer.writerow(["LATENCY STATISTICS (ms)"])
-                writer.writerow(["Average", f"{latency_stats['avg_latency_ms']:.2f}"])
-                writer.writerow(["Minimum", f"{latency_stats['min_latency_ms']:.2f}"])
-                writer.writerow(["Maximum", f"{latency_stats['max_latency_ms']:.2f}"])
-                writer.writerow([])
-                
-                # Throughput statistics
-                writer.writerow(["THROUGHPUT STATISTICS (Mbps)"])
-                writer.writerow(["Average", f"{latency_stats['avg_throughput_mbps']:.2f}"])
-                writer.writerow([])
-                
-                # Congestion statistics
-                writer.writerow(["CONGESTION STATISTICS"])
-                writer.writerow(["Total Packets Enqueued", congestion_stats['total_enqueued']])
-                writer.writerow(["Total Packets Dropped", congestion_stats['total_dropped']])
-                writer.writerow(["Congestion Events", congestion_stats['congestion_events']])
-                writer.writerow(["Avg Queue Depth", f"{congestion_stats['avg_queue_depth']:.1f}"])
-                writer.writerow([])
-                
-                # Network topology
-                writer.writerow(["TOPOLOGY"])
-                writer.writerow(["Total Nodes", len(self.network_manager.nodes)])
-                writer.writerow(["Total Links", len(self.network_manager.links)])
+                # One writerows call for the whole sheet
+                writer.writerows((
+                    # Write simulation summary
+                    ["SIMULATION SUMMARY"],
+                    [],
+                    
+                    ["Metric", "Value"],
+                    [],
+                    
+                    # Packet statistics
+                    ["PACKET STATISTICS"],
+                    ["Total Sent", latency_stats['total_sent']],
+                    ["Total Delivered", latency_stats['total_delivered']],
+                    ["Total Dropped", latency_stats['total_dropped']],
+                    ["Delivery Rate (%)", f"{latency_stats['delivery_rate']:.1f}"],
+                    ["Drop Rate (%)", f"{latency_stats['drop_rate']:.1f}"],
+                    [],
+                    
+                    # Latency statistics
+                    ["LATENCY STATISTICS (ms)"],
+                    ["Average", f"{latency_stats['avg_latency_ms']:.2f}"],
+                    ["Minimum", f"{latency_stats['min_latency_ms']:.2f}"],
+                    ["Maximum", f"{latency_stats['max_latency_ms']:.2f}"],
+                    [],
+                    
+                    # Throughput statistics
+                    ["THROUGHPUT STATISTICS (Mbps)"],
+                    ["Average", f"{latency_stats['avg_throughput_mbps']:.2f}"],
+                    [],
+                    
+                    # Congestion statistics
+                    ["CONGESTION STATISTICS"],
+                    ["Total Packets Enqueued", congestion_stats['total_enqueued']],
+                    ["Total Packets Dropped", congestion_stats['total_dropped']],
+                    ["Congestion Events", congestion_stats['congestion_events']],
+                    ["Avg Queue Depth", f"{congestion_stats['avg_queue_depth']:.1f}"],
+                    [],
+                    
+                    # Network topology
+                    ["TOPOLOGY"],
+                    ["Total Nodes", summary["node_count"]],
+                    ["Total Links", summary["link_count"]],
+                ))
             
             return True
         
@@ -194,28 +449,32 @@ class DataExportEngine:
             print(f"Error exporting summary: {e}")
             return False
     
-    def export_topology_to_json(self, filename: str = None) -> bool:
+    def export_topology_to_json(self, filename: str = None,
+                                snapshot: Optional[dict] = None) -> bool:
         """
         Export network topology to JSON
         
         Args:
             filename: Output filename
+            snapshot: take_snapshot() result (live state is read if None)
         
         Returns:
             True if successful, False otherwise
         """
         if not filename:
-            filename = f"topology_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            filename = self._default_filename("topology", "json")
         
         try:
-            topology = {
-                "timestamp": datetime.now().isoformat(),
-                "nodes": [node.to_dict() for node in self.network_manager.nodes.values()],
-                "links": [link.to_dict() for link in self.network_manager.links.values()],
-            }
+            nodes_and_links = snapshot["topology"] if snapshot else self._topology()
+            timestamp = snapshot["timestamp"] if snapshot else self._now()
+            topology = {"timestamp": timestamp.isoformat(), **nodes_and_links}
             
-            with open(filename, 'w') as f:
-                json.dump(topology, f, indent=2)
+            if orjson is not None:
+                with open(filename, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                    f.write(orjson.dumps(topology, option=orjson.OPT_INDENT_2, default=str))
+            else:
+                with open(filename, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+                    json.dump(topology, f, indent=2)
             
             return True
         
@@ -223,27 +482,48 @@ class DataExportEngine:
             print(f"Error exporting topology: {e}")
             return False
     
-    def export_all(self, base_filename: str = None) -> Dict[str, bool]:
+    def export_all(self, base_filename: str = None,
+                   snapshot: Optional[dict] = None) -> Dict[str, bool]:
         """
         Export all data to multiple formats
         
+        Every file is written from one snapshot, so they agree with each
+        other and share one timestamp. To export off the UI thread, take
+        the snapshot on the UI thread and pass it in.
+        
         Args:
             base_filename: Base name for files (timestamp added)
+            snapshot: take_snapshot() result (taken here if None)
         
         Returns:
             Dictionary of filename -> success status
         """
+        if snapshot is None:
+            snapshot = self.take_snapshot()
+        
         if not base_filename:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = snapshot["timestamp"].strftime('%Y%m%d_%H%M%S')
             base_filename = f"simulation_{timestamp}"
         
-        results = {}
-        results['metrics'] = self.export_metrics_to_csv(f"{base_filename}_metrics.csv")
-        results['congestion'] = self.export_congestion_to_csv(f"{base_filename}_congestion.csv")
-        results['summary'] = self.export_summary_to_csv(f"{base_filename}_summary.csv")
-        results['topology'] = self.export_topology_to_json(f"{base_filename}_topology.json")
+        jobs = {
+            'metrics': (self.export_metrics_to_csv, f"{base_filename}_metrics.csv"),
+            'congestion': (self.export_congestion_to_csv, f"{base_filename}_congestion.csv"),
+            'summary': (self.export_summary_to_csv, f"{base_filename}_summary.csv"),
+            'topology': (self.export_topology_to_json, f"{base_filename}_topology.json"),
+        }
         
-        return results
+        # Columnar formats only when the optional pyarrow dependency is present
+        if _import_pyarrow() is not None:
+            jobs['parquet'] = (self.export_metrics_to_parquet, f"{base_filename}_metrics.parquet")
+            jobs['feather'] = (self.export_metrics_to_feather, f"{base_filename}_metrics.feather")
+        
+        # Files are independent; overlap their writes
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            futures = {
+                name: pool.submit(export_fn, filename, snapshot)
+                for name, (export_fn, filename) in jobs.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
 
 
 # ============================================================================
@@ -284,101 +564,107 @@ class SimulationReportGenerator:
             filename = f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
         
         try:
-            with open(filename, 'w') as f:
-                # Header
-                f.write("=" * 70 + "\n")
-                f.write("CLOUD NETWORK SIMULATOR - SIMULATION REPORT\n")
-                f.write("=" * 70 + "\n\n")
-                
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Simulation Time: {self.animator_worker.sim_time:.2f} ms\n\n")
-                
-                # Topology
-                f.write("NETWORK TOPOLOGY\n")
-                f.write("-" * 70 + "\n")
-                f.write(f"Nodes: {len(self.network_manager.nodes)}\n")
-                f.write(f"Links: {len(self.network_manager.links)}\n\n")
-                
-                # Node details
-                f.write("Nodes:\n")
-                for node_id, node in sorted(self.network_manager.nodes.items()):
-                    f.write(f"  {node_id}: {node.label} at ({node.x:.0f}, {node.y:.0f})\n")
-                f.write("\n")
-                
-                # Link details
-                f.write("Links:\n")
-                for link_id, link in sorted(self.network_manager.links.items()):
-                    f.write(
-                        f"  {link_id}: {link.node_a.label} ↔ {link.node_b.label}\n"
-                        f"    Latency: {link.latency}ms | Bandwidth: {link.bandwidth}Mbps | Queue: {link.queue_size}\n"
-                    )
-                f.write("\n")
-                
-                # Latency Statistics
-                latency_stats = self.latency_engine.get_summary_statistics()
-                f.write("PACKET & LATENCY STATISTICS\n")
-                f.write("-" * 70 + "\n")
-                f.write(f"Total Packets Sent: {latency_stats['total_sent']}\n")
-                f.write(f"Total Packets Delivered: {latency_stats['total_delivered']}\n")
-                f.write(f"Total Packets Dropped: {latency_stats['total_dropped']}\n")
-                f.write(f"Delivery Rate: {latency_stats['delivery_rate']:.1f}%\n")
-                f.write(f"Drop Rate: {latency_stats['drop_rate']:.1f}%\n\n")
-                
-                f.write("Latency Metrics (ms):\n")
-                f.write(f"  Average: {latency_stats['avg_latency_ms']:.2f}\n")
-                f.write(f"  Minimum: {latency_stats['min_latency_ms']:.2f}\n")
-                f.write(f"  Maximum: {latency_stats['max_latency_ms']:.2f}\n\n")
-                
-                f.write("Throughput:\n")
-                f.write(f"  Average: {latency_stats['avg_throughput_mbps']:.2f} Mbps\n\n")
-                
-                # Congestion Statistics
-                congestion_stats = self.congestion_controller.get_statistics()
-                f.write("CONGESTION CONTROL STATISTICS\n")
-                f.write("-" * 70 + "\n")
-                f.write(f"Total Packets Enqueued: {congestion_stats['total_enqueued']}\n")
-                f.write(f"Total Packets Dropped: {congestion_stats['total_dropped']}\n")
-                f.write(f"Congestion Events: {congestion_stats['congestion_events']}\n")
-                f.write(f"Average Queue Depth: {congestion_stats['avg_queue_depth']:.1f} packets\n\n")
-                
-                # Per-link queue statistics
-                queue_stats = self.congestion_controller.get_queue_history()
-                if queue_stats:
-                    f.write("Per-Link Queue Statistics:\n")
-                    for link_id, stats in queue_stats.items():
-                        f.write(
-                            f"  {link_id}:\n"
-                            f"    Capacity: {stats['capacity']} packets\n"
-                            f"    Current Size: {stats['current_size']} packets\n"
-                            f"    Utilization: {stats['utilization']*100:.1f}%\n"
-                            f"    Packets Enqueued: {stats['packets_enqueued']}\n"
-                            f"    Packets Dequeued: {stats['packets_dequeued']}\n"
-                            f"    Packets Dropped: {stats['packets_dropped']}\n"
-                            f"    Avg Delay: {stats['avg_delay_ms']:.2f} ms\n\n"
-                        )
+            parts: List[str] = []
+            append = parts.append
+            
+            # Header
+            append("=" * 70 + "\n")
+            append("CLOUD NETWORK SIMULATOR - SIMULATION REPORT\n")
+            append("=" * 70 + "\n\n")
+            
+            append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            append(f"Simulation Time: {self.animator_worker.sim_time:.2f} ms\n\n")
+            
+            # Topology
+            append("NETWORK TOPOLOGY\n")
+            append("-" * 70 + "\n")
+            append(f"Nodes: {len(self.network_manager.nodes)}\n")
+            append(f"Links: {len(self.network_manager.links)}\n\n")
+            
+            # Node details
+            append("Nodes:\n")
+            parts.extend(
+                f"  {node_id}: {node.label} at ({node.x:.0f}, {node.y:.0f})\n"
+                for node_id, node in sorted(self.network_manager.nodes.items())
+            )
+            append("\n")
+            
+            # Link details
+            append("Links:\n")
+            parts.extend(
+                f"  {link_id}: {link.node_a.label} ↔ {link.node_b.label}\n"
+                f"    Latency: {link.latency}ms | Bandwidth: {link.bandwidth}Mbps | Queue: {link.queue_size}\n"
+                for link_id, link in sorted(self.network_manager.links.items())
+            )
+            append("\n")
+            
+            # Latency Statistics
+            latency_stats = self.latency_engine.get_summary_statistics()
+            append("PACKET & LATENCY STATISTICS\n")
+            append("-" * 70 + "\n")
+            append(f"Total Packets Sent: {latency_stats['total_sent']}\n")
+            append(f"Total Packets Delivered: {latency_stats['total_delivered']}\n")
+            append(f"Total Packets Dropped: {latency_stats['total_dropped']}\n")
+            append(f"Delivery Rate: {latency_stats['delivery_rate']:.1f}%\n")
+            append(f"Drop Rate: {latency_stats['drop_rate']:.1f}%\n\n")
+            
+            append("Latency Metrics (ms):\n")
+            append(f"  Average: {latency_stats['avg_latency_ms']:.2f}\n")
+            append(f"  Minimum: {latency_stats['min_latency_ms']:.2f}\n")
+            append(f"  Maximum: {latency_stats['max_latency_ms']:.2f}\n\n")
+            
+            append("Throughput:\n")
+            append(f"  Average: {latency_stats['avg_throughput_mbps']:.2f} Mbps\n\n")
+            
+            # Congestion Statistics
+            congestion_stats = self.congestion_controller.get_statistics()
+            append("CONGESTION CONTROL STATISTICS\n")
+            append("-" * 70 + "\n")
+            append(f"Total Packets Enqueued: {congestion_stats['total_enqueued']}\n")
+            append(f"Total Packets Dropped: {congestion_stats['total_dropped']}\n")
+            append(f"Congestion Events: {congestion_stats['congestion_events']}\n")
+            append(f"Average Queue Depth: {congestion_stats['avg_queue_depth']:.1f} packets\n\n")
+            
+            # Per-link queue statistics
+            queue_stats = self.congestion_controller.get_queue_history()
+            if queue_stats:
+                append("Per-Link Queue Statistics:\n")
+                parts.extend(
+                    f"  {link_id}:\n"
+                    f"    Capacity: {stats['capacity']} packets\n"
+                    f"    Current Size: {stats['current_size']} packets\n"
+                    f"    Utilization: {stats['utilization']*100:.1f}%\n"
+                    f"    Packets Enqueued: {stats['packets_enqueued']}\n"
+                    f"    Packets Dequeued: {stats['packets_dequeued']}\n"
+                    f"    Packets Dropped: {stats['packets_dropped']}\n"
+                    f"    Avg Delay: {stats['avg_delay_ms']:.2f} ms\n\n"
+                    for link_id, stats in queue_stats.items()
+                )
 
+            
+            # Top packets by latency
+            if self.latency_engine.metrics_count():
+                append("PACKET ANALYSIS\n")
+                append("-" * 70 + "\n")
                 
-                # Top packets by latency
-                all_metrics = self.latency_engine.get_all_metrics()
-                if all_metrics:
-                    f.write("PACKET ANALYSIS\n")
-                    f.write("-" * 70 + "\n")
-                    
-                    delivered = [m for m in all_metrics.values() if m.state == "delivered"]
-                    if delivered:
-                        f.write(f"Sample Packets (First 10 delivered):\n")
-                        for pkt in sorted(delivered, key=lambda x: x.packet_id)[:10]:
-                            f.write(
-                                f"  {pkt.packet_id}: {pkt.source_node_id}→{pkt.destination_node_id}\n"
-                                f"    Path: {' → '.join(pkt.path_nodes)}\n"
-                                f"    Latency: {pkt.actual_latency:.2f}ms\n"
-                                f"    Throughput: {pkt.throughput:.2f}Mbps\n\n"
-                            )
-                
-                # Footer
-                f.write("=" * 70 + "\n")
-                f.write("END OF REPORT\n")
-                f.write("=" * 70 + "\n")
+                sample = list(islice(self.latency_engine.iter_delivered(), 10))
+                if sample:
+                    append(f"Sample Packets (First 10 delivered):\n")
+                    parts.extend(
+                        f"  {format_packet_id(pkt.packet_id)}: {pkt.source_node_id}→{pkt.destination_node_id}\n"
+                        f"    Path: {pkt.path_str}\n"
+                        f"    Latency: {pkt.actual_latency:.2f}ms\n"
+                        f"    Throughput: {pkt.throughput:.2f}Mbps\n\n"
+                        for pkt in sample
+                    )
+            
+            # Footer
+            append("=" * 70 + "\n")
+            append("END OF REPORT\n")
+            append("=" * 70 + "\n")
+            
+            with open(filename, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write("".join(parts))
             
             return True
         
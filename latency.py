@@ -1,13 +1,21 @@
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from itertools import islice
+from typing import List, Dict, Optional, Tuple, Deque
 import time
-from packet import Packet
+from packet import Packet, PacketState, format_packet_id, scheduled_hop, PACKET_HISTORY_SIZE
+
+# bytes / ms -> Mbps: (bytes * 8 bits) / (ms / 1000) / 1e6
+BYTES_PER_MS_TO_MBPS = 8e-3
+
+# Upper bound on recycled Packet/PacketMetrics objects kept for reuse
+OBJECT_POOL_SIZE = 1024
 
 # ============================================================================
 # 1. LINK LATENCY & BANDWIDTH TRACKER
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LinkMetrics:
     """Metrics for a single link"""
     
@@ -54,11 +62,11 @@ class LinkMetrics:
 # 2. PACKET DELIVERY METRICS
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PacketMetrics:
     """Metrics for a single packet's journey"""
     
-    packet_id: str
+    packet_id: int
     source_node_id: str
     destination_node_id: str
     path_nodes: List[str]      # Full path
@@ -77,42 +85,89 @@ class PacketMetrics:
     actual_latency: float = 0.0  # Actual delivery time - sent time
     bottleneck_bandwidth: float = 0.0  # Minimum bandwidth on path
     throughput: float = 0.0      # Calculated throughput (Mbps)
+    delay_factor: float = 0.0    # actual_latency / total_latency (0 until delivered)
     
     # Per-link info
     link_ids: List[str] = field(default_factory=list)
-    
-    def calculate_metrics(self, network_manager) -> None:
+    path_str: str = ""           # Display form of path_nodes, joined once
+    
+    def reset(self, packet_id: int, source_node_id: str, destination_node_id: str,
+              path_nodes: List[str], packet_size: int, creation_time: float) -> None:
+        """Reinitialize recycled metrics in place (see LatencyThroughputEngine pool)"""
+        self.packet_id = packet_id
+        self.source_node_id = source_node_id
+        self.destination_node_id = destination_node_id
+        self.path_nodes = path_nodes
+        self.packet_size = packet_size
+        self.state = "queued"
+        self.creation_time = creation_time
+        self.sent_time = creation_time
+        self.delivery_time = 0.0
+        self.path_latencies = []
+        self.hop_count = 0
+        self.total_latency = 0.0
+        self.actual_latency = 0.0
+        self.bottleneck_bandwidth = 0.0
+        self.throughput = 0.0
+        self.delay_factor = 0.0
+        self.link_ids = []
+        self.path_str = ""
+    
+    def calculate_metrics(self, network_manager, path_info: Optional[tuple] = None) -> None:
         """Calculate all metrics from network state"""
-        self.hop_count = len(self.path_nodes) - 1
-        
-        # Get theoretical latency and bandwidth
-        total_lat = 0.0
-        min_bw = float('inf')
+        self.calc_theoretical(network_manager, path_info)
+        self.calc_actual()
+    
+    def calc_theoretical(self, network_manager, path_info: Optional[tuple] = None) -> None:
+        """
+        Calculate path metrics (hops, theoretical latency, bottleneck bandwidth)
         
-        for i in range(len(self.path_nodes) - 1):
-            node_a_id = self.path_nodes[i]
-            node_b_id = self.path_nodes[i + 1]
+        Args:
+            network_manager: Reference to NetworkManager
+            path_info: Precomputed (total_latency, bottleneck_bw, link_ids,
+                path_latencies) for path_nodes; skips walking the links
+        """
+        self.hop_count = len(self.path_nodes) - 1
+        self.path_str = " → ".join(self.path_nodes)
+        
+        if path_info is not None:
+            total_lat, min_bw, link_ids, path_latencies = path_info
+            self.link_ids = list(link_ids)
+            self.path_latencies = list(path_latencies)
+        else:
+            # Get theoretical latency and bandwidth
+            total_lat = 0.0
+            min_bw = float('inf')
+            self.link_ids = []
+            self.path_latencies = []
             
-            link = network_manager.get_link_by_nodes(node_a_id, node_b_id)
-            if link:
-                total_lat += link.latency
-                min_bw = min(min_bw, link.bandwidth)
-                self.path_latencies.append(link.latency)
-                self.link_ids.append(link.id)
+            for i in range(len(self.path_nodes) - 1):
+                node_a_id = self.path_nodes[i]
+                node_b_id = self.path_nodes[i + 1]
+                
+                link = network_manager.get_link_by_nodes(node_a_id, node_b_id)
+                if link:
+                    total_lat += link.latency
+                    min_bw = min(min_bw, link.bandwidth)
+                    self.path_latencies.append(link.latency)
+                    self.link_ids.append(link.id)
         
         self.total_latency = total_lat
         if min_bw != float('inf'):
             self.bottleneck_bandwidth = min_bw
-        
+    
+    def calc_actual(self) -> None:
+        """Calculate delivery metrics (actual latency, throughput)"""
         # Actual latency is when packet was delivered
         if self.delivery_time > 0 and self.sent_time > 0:
             self.actual_latency = self.delivery_time - self.sent_time
         
         # Throughput = packet size / actual latency
         if self.actual_latency > 0:
-            # Convert: (bytes * 8 bits/byte) / (time in ms, convert to seconds)
-            throughput_mbps = (self.packet_size * 8) / (self.actual_latency / 1000.0) / 1_000_000
-            self.throughput = throughput_mbps
+            self.throughput = self.packet_size * BYTES_PER_MS_TO_MBPS / self.actual_latency
+        
+        if self.total_latency > 0:
+            self.delay_factor = self.actual_latency / self.total_latency
     
     def to_dict(self) -> dict:
         """Serialize to dictionary"""
@@ -153,11 +208,28 @@ class LatencyThroughputEngine:
         self.animator_worker = animator_worker
         
         self.link_metrics: Dict[str, LinkMetrics] = {}
-        self.packet_metrics: Dict[str, PacketMetrics] = {}
+        self.packet_metrics: Dict[int, PacketMetrics] = {}  # Inserted in packet ID order
         
         self.total_packets_sent = 0
         self.total_packets_delivered = 0
         self.total_packets_dropped = 0
+        
+        # Metrics by outcome, in the order the outcome was recorded
+        self._delivered: List[PacketMetrics] = []
+        self._dropped: List[PacketMetrics] = []
+        
+        # Metrics objects recycled by clear_all()
+        self._metrics_pool: List[PacketMetrics] = []
+        
+        # Running totals over delivered packets
+        self._sum_latency = 0.0
+        self._sum_throughput = 0.0
+        self._min_latency = float('inf')
+        self._max_latency = 0.0
+        
+        # Resolved link info per path, valid for one topology version
+        self._path_cache: Dict[Tuple[str, ...], tuple] = {}
+        self._path_cache_version = -1
     
     def create_link_metrics(self, link_id: str, source_id: str, dest_id: str,
                           latency: float, bandwidth: float) -> LinkMetrics:
@@ -184,7 +256,11 @@ class LatencyThroughputEngine:
         self.link_metrics[link_id] = metrics
         return metrics
     
-    def create_packet_metrics(self, packet_id: str, source_id: str, dest_id: str,
+    def remove_link_metrics(self, link_id: str) -> None:
+        """Stop tracking a removed link"""
+        self.link_metrics.pop(link_id, None)
+    
+    def create_packet_metrics(self, packet_id: int, source_id: str, dest_id: str,
                             path: List[str], size: int, creation_time: float) -> PacketMetrics:
         """
         Create metrics tracker for a packet
@@ -200,98 +276,155 @@ class LatencyThroughputEngine:
         Returns:
             PacketMetrics object
         """
-        metrics = PacketMetrics(
-            packet_id=packet_id,
-            source_node_id=source_id,
-            destination_node_id=dest_id,
-            path_nodes=path,
-            packet_size=size,
-            creation_time=creation_time,
-            sent_time=creation_time,
-        )
+        if self._metrics_pool:
+            metrics = self._metrics_pool.pop()
+            metrics.reset(packet_id, source_id, dest_id, path, size, creation_time)
+        else:
+            metrics = PacketMetrics(
+                packet_id=packet_id,
+                source_node_id=source_id,
+                destination_node_id=dest_id,
+                path_nodes=path,
+                packet_size=size,
+                creation_time=creation_time,
+                sent_time=creation_time,
+            )
         
         # Calculate theoretical metrics
-        metrics.calculate_metrics(self.network_manager)
+        metrics.calc_theoretical(self.network_manager, self._resolve_path(path))
         
         self.packet_metrics[packet_id] = metrics
         self.total_packets_sent += 1
         return metrics
     
-    def record_packet_sent(self, packet_id: str, sent_time: float) -> None:
+    def _resolve_path(self, path_nodes: List[str]) -> tuple:
+        """
+        Resolve the links along a path (cached per distinct path)
+        
+        Args:
+            path_nodes: Path (list of node IDs)
+        
+        Returns:
+            Tuple (total_latency, bottleneck_bw, link_ids, path_latencies)
+        """
+        version = self.network_manager.topology_version
+        if version != self._path_cache_version:
+            self._path_cache.clear()
+            self._path_cache_version = version
+        
+        key = tuple(path_nodes)
+        info = self._path_cache.get(key)
+        if info is None:
+            total_lat = 0.0
+            min_bw = float('inf')
+            link_ids = []
+            path_latencies = []
+            
+            get_link = self.network_manager.get_link_by_nodes
+            for node_a_id, node_b_id in zip(key, key[1:]):
+                link = get_link(node_a_id, node_b_id)
+                if link:
+                    total_lat += link.latency
+                    min_bw = min(min_bw, link.bandwidth)
+                    path_latencies.append(link.latency)
+                    link_ids.append(link.id)
+            
+            info = (total_lat, min_bw, tuple(link_ids), tuple(path_latencies))
+            self._path_cache[key] = info
+        return info
+    
+    def record_packet_sent(self, packet_id: int, sent_time: float) -> None:
         """Record when packet started moving"""
         if packet_id in self.packet_metrics:
             metrics = self.packet_metrics[packet_id]
             metrics.sent_time = sent_time
             metrics.state = "in_transit"
     
-    def record_packet_delivery(self, packet_id: str, delivery_time: float) -> None:
+    def record_packet_delivery(self, packet_id: int, delivery_time: float) -> None:
         """Record packet delivery"""
         if packet_id in self.packet_metrics:
             metrics = self.packet_metrics[packet_id]
             metrics.delivery_time = delivery_time
             metrics.state = "delivered"
-            metrics.calculate_metrics(self.network_manager)
+            metrics.calc_actual()
             self.total_packets_delivered += 1
+            self._delivered.append(metrics)
+            
+            latency = metrics.actual_latency
+            self._sum_latency += latency
+            self._sum_throughput += metrics.throughput
+            if latency < self._min_latency:
+                self._min_latency = latency
+            if latency > self._max_latency:
+                self._max_latency = latency
             
             # Update link metrics
             self._update_link_metrics_for_packet(metrics)
     
-    def record_packet_drop(self, packet_id: str) -> None:
+    def record_packet_drop(self, packet_id: int) -> None:
         """Record packet drop"""
         if packet_id in self.packet_metrics:
             metrics = self.packet_metrics[packet_id]
             metrics.state = "dropped"
             self.total_packets_dropped += 1
+            self._dropped.append(metrics)
     
     def _update_link_metrics_for_packet(self, packet_metrics: PacketMetrics) -> None:
         """Update link metrics when packet is delivered"""
+        size = packet_metrics.packet_size
+        
+        # Transit time for this packet
+        # Rough estimate: divide actual latency by hop count
+        actual_latency = packet_metrics.actual_latency
+        per_link_time = actual_latency / packet_metrics.hop_count if actual_latency > 0 else 0.0
+        
+        get_link_metric = self.link_metrics.get
         for link_id in packet_metrics.link_ids:
-            if link_id in self.link_metrics:
-                link_metric = self.link_metrics[link_id]
+            link_metric = get_link_metric(link_id)
+            if link_metric is not None:
                 link_metric.packets_sent += 1
                 link_metric.packets_received += 1
-                link_metric.total_bytes_transferred += packet_metrics.packet_size
-                
-                # Transit time for this packet
-                if packet_metrics.actual_latency > 0:
-                    # Rough estimate: divide actual latency by hop count
-                    per_link_time = packet_metrics.actual_latency / packet_metrics.hop_count
-                    link_metric.total_transit_time += per_link_time
+                link_metric.total_bytes_transferred += size
+                link_metric.total_transit_time += per_link_time
     
-    def get_packet_metrics(self, packet_id: str) -> Optional[PacketMetrics]:
+    def get_packet_metrics(self, packet_id: int) -> Optional[PacketMetrics]:
         """Get metrics for specific packet"""
         return self.packet_metrics.get(packet_id)
     
-    def get_all_metrics(self) -> Dict[str, PacketMetrics]:
+    def get_all_metrics(self) -> Dict[int, PacketMetrics]:
         """Get all packet metrics"""
         return self.packet_metrics.copy()
     
+    def iter_metrics(self):
+        """Iterate packet metrics in packet ID order (read-only, no copy)"""
+        return self.packet_metrics.values()
+    
+    def iter_delivered(self):
+        """Iterate delivered packet metrics in delivery order (read-only, no copy)"""
+        return iter(self._delivered)
+    
+    def iter_dropped(self):
+        """Iterate dropped packet metrics in drop order (read-only, no copy)"""
+        return iter(self._dropped)
+    
+    def metrics_count(self) -> int:
+        """Number of packets with metrics"""
+        return len(self.packet_metrics)
+    
     def get_summary_statistics(self) -> dict:
-        """Get overall statistics"""
+        """Get overall statistics from the running counters (O(1))"""
         delivered = self.total_packets_delivered
         dropped = self.total_packets_dropped
         total = delivered + dropped
         
         avg_latency = 0.0
         avg_throughput = 0.0
-        max_latency = 0.0
-        min_latency = float('inf')
+        max_latency = self._max_latency
+        min_latency = self._min_latency
         
         if delivered > 0:
-            latencies = []
-            throughputs = []
-            
-            for metrics in self.packet_metrics.values():
-                if metrics.state == "delivered":
-                    latencies.append(metrics.actual_latency)
-                    throughputs.append(metrics.throughput)
-                    max_latency = max(max_latency, metrics.actual_latency)
-                    min_latency = min(min_latency, metrics.actual_latency)
-            
-            if latencies:
-                avg_latency = sum(latencies) / len(latencies)
-            if throughputs:
-                avg_throughput = sum(throughputs) / len(throughputs)
+            avg_latency = self._sum_latency / delivered
+            avg_throughput = self._sum_throughput / delivered
         
         if min_latency == float('inf'):
             min_latency = 0.0
@@ -315,10 +448,21 @@ class LatencyThroughputEngine:
     def clear_all(self) -> None:
         """Clear all metrics"""
         self.link_metrics.clear()
+        
+        # Recycle metrics objects for the next run
+        room = OBJECT_POOL_SIZE - len(self._metrics_pool)
+        if room > 0:
+            self._metrics_pool.extend(islice(self.packet_metrics.values(), room))
         self.packet_metrics.clear()
+        self._delivered.clear()
+        self._dropped.clear()
         self.total_packets_sent = 0
         self.total_packets_delivered = 0
         self.total_packets_dropped = 0
+        self._sum_latency = 0.0
+        self._sum_throughput = 0.0
+        self._min_latency = float('inf')
+        self._max_latency = 0.0
 
 
 # ============================================================================
@@ -347,11 +491,17 @@ class EnhancedPacketManager:
         self.animator_worker = animator_worker
         self.latency_engine = latency_engine
         
-        self.all_packets: List = []
-        self.active_packets: Dict[str, 'Packet'] = {}
-        self.delivered_packets: List = []
-        self.dropped_packets: List = []
+        # Active packets by packet.slot_index; freed slots hold None
+        self.active_slots: List[Optional[Packet]] = []
+        self._free_slots: List[int] = []
+        
+        # Most recent finished packets; older ones are recycled
+        self.delivered_packets: Deque[Packet] = deque(maxlen=PACKET_HISTORY_SIZE)
+        self.dropped_packets: Deque[Packet] = deque(maxlen=PACKET_HISTORY_SIZE)
         self.packet_counter = 0
+        
+        # Released packets, reused by create_packet()
+        self._packet_pool: List[Packet] = []
     
     def create_packet(self, source_id: str, dest_id: str, size: int = 1024):
         """
@@ -374,7 +524,7 @@ class EnhancedPacketManager:
             return None
         
         self.packet_counter += 1
-        packet_id = f"PKT{self.packet_counter:04d}"
+        packet_id = self.packet_counter
         current_time = self.animator_worker.sim_time
         
         # Get path
@@ -383,24 +533,24 @@ class EnhancedPacketManager:
         
         path_nodes = self.path_manager.get_current_path_nodes()
         
-        # Import Packet class from packet module
-        from packet import Packet, PacketState
-        
-        packet = Packet(
-            id=packet_id,
-            source_node_id=source_id,
-            destination_node_id=dest_id,
-            creation_time=current_time,
-            sent_time=current_time,
-            size=size,
-            path=path_nodes,
-            state=PacketState.QUEUED
-        )
-        
-        packet.current_node_id = source_id
-        
-        self.all_packets.append(packet)
-        self.active_packets[packet_id] = packet
+        if self._packet_pool:
+            packet = self._packet_pool.pop()
+            packet.reset(packet_id, source_id, dest_id, current_time, size, path_nodes)
+        else:
+            packet = Packet(
+                id=packet_id,
+                source_node_id=source_id,
+                destination_node_id=dest_id,
+                creation_time=current_time,
+                sent_time=current_time,
+                size=size,
+                path=path_nodes,
+                state=PacketState.QUEUED
+            )
+            packet.current_node_id = source_id
+        
+        packet.hop_schedule = self.path_manager.get_current_hop_schedule()
+        self._activate(packet)
         
         # Create metrics for this packet
         self.latency_engine.create_packet_metrics(
@@ -425,19 +575,13 @@ class EnhancedPacketManager:
             return False
         
         # Get first link
-        node_a_id = packet.path[0]
-        node_b_id = packet.path[1]
-        
-        link = self.network_manager.get_link_by_nodes(node_a_id, node_b_id)
-        if not link:
+        hop = scheduled_hop(packet, 0, self.network_manager)
+        if hop is None:
             packet.mark_dropped()
             self.latency_engine.record_packet_drop(packet.id)
             return False
+        link, node_a, node_b = hop
         
-        node_a = self.network_manager.nodes[node_a_id]
-        node_b = self.network_manager.nodes[node_b_id]
-        
-        from packet import PacketState
         packet.state = PacketState.IN_TRANSIT
         packet.current_link_index = 0
         packet.link_latency = link.latency
@@ -466,55 +610,151 @@ class EnhancedPacketManager:
             True if packet reached destination, False otherwise
         """
         current_time = self.animator_worker.sim_time
-        from packet import PacketState
         
         if packet.move_to_next_link(current_time):
             # Reached destination
             packet.mark_delivered(current_time)
             self.latency_engine.record_packet_delivery(packet.id, current_time)
-            self.delivered_packets.append(packet)
-            if packet.id in self.active_packets:
-                del self.active_packets[packet.id]
+            if self._deactivate(packet):
+                self._record_finished(self.delivered_packets, packet)
             return True
         
         # Start animation on next link
-        if packet.path_index + 1 < len(packet.path):
-            node_a_id = packet.path[packet.path_index]
-            node_b_id = packet.path[packet.path_index + 1]
+        # move_to_next_link() returned False, so there is a next hop
+        hop = scheduled_hop(packet, packet.path_index, self.network_manager)
+        if hop is not None:
+            link, node_a, node_b = hop
             
-            link = self.network_manager.get_link_by_nodes(node_a_id, node_b_id)
-            if link:
-                node_a = self.network_manager.nodes[node_a_id]
-                node_b = self.network_manager.nodes[node_b_id]
-                
-                packet.link_latency = link.latency
-                
-                self.animator_worker.add_packet(
-                    packet,
-                    (node_a.x, node_a.y),
-                    (node_b.x, node_b.y),
-                    link.latency
-                )
+            packet.link_latency = link.latency
+            
+            self.animator_worker.add_packet(
+                packet,
+                (node_a.x, node_a.y),
+                (node_b.x, node_b.y),
+                link.latency
+            )
         
         return False
     
+    def advance_batch(self, packets: List) -> int:
+        """
+        Advance several packets that finished their link in the same frame
+        
+        Same per-packet behaviour as advance_packet(), with lookups bound
+        once and the next-link animations added to the animator in one call.
+        
+        Args:
+            packets: Packets to advance
+        
+        Returns:
+            Number of packets that reached their destination
+        """
+        current_time = self.animator_worker.sim_time
+        record_delivery = self.latency_engine.record_packet_delivery
+        delivered_packets = self.delivered_packets
+        network_manager = self.network_manager
+        items = []
+        delivered = 0
+        
+        for packet in packets:
+            if packet.move_to_next_link(current_time):
+                # Reached destination
+                packet.mark_delivered(current_time)
+                record_delivery(packet.id, current_time)
+                if self._deactivate(packet):
+                    self._record_finished(delivered_packets, packet)
+                delivered += 1
+                continue
+            
+            # Queue animation on next link
+            # move_to_next_link() returned False, so there is a next hop
+            hop = scheduled_hop(packet, packet.path_index, network_manager)
+            if hop is not None:
+                link, node_a, node_b = hop
+                packet.link_latency = link.latency
+                items.append((packet, (node_a.x, node_a.y),
+                              (node_b.x, node_b.y), link.latency))
+        
+        if items:
+            self.animator_worker.add_packets(items)
+        return delivered
+    
     def drop_packet(self, packet) -> None:
         """Mark packet as dropped"""
         packet.mark_dropped()
         self.latency_engine.record_packet_drop(packet.id)
-        self.dropped_packets.append(packet)
-        if packet.id in self.active_packets:
-            del self.active_packets[packet.id]
+        if self._deactivate(packet):
+            self._record_finished(self.dropped_packets, packet)
         self.animator_worker.remove_packet(packet.id)
     
+    def _activate(self, packet) -> None:
+        """Place packet in a free active slot"""
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self.active_slots[slot] = packet
+        else:
+            slot = len(self.active_slots)
+            self.active_slots.append(packet)
+        packet.slot_index = slot
+    
+    def _deactivate(self, packet) -> bool:
+        """
+        Free packet's active slot
+        
+        Returns:
+            True if the packet was active, False if it was already finished
+        """
+        slot = packet.slot_index
+        packet.slot_index = -1
+        if slot >= 0 and self.active_slots[slot] is packet:
+            self.active_slots[slot] = None
+            self._free_slots.append(slot)
+            return True
+        return False
+    
+    def _record_finished(self, history: Deque, packet) -> None:
+        """Append to a finished-packet history, recycling the entry it evicts"""
+        if len(history) == history.maxlen:
+            self.release(history[0])
+        history.append(packet)
+    
+    def get_active_packets(self) -> List:
+        """Get packets that are still in flight"""
+        return [packet for packet in self.active_slots if packet is not None]
+    
+    def release(self, packet) -> None:
+        """
+        Return a finished packet to the pool for reuse by create_packet()
+        
+        Only call this once nothing else (animator, packet lists, UI)
+        still holds the packet; its fields are overwritten on reuse.
+        
+        Args:
+            packet: Delivered or dropped packet
+        """
+        if len(self._packet_pool) < OBJECT_POOL_SIZE:
+            packet.path = []
+            packet.hop_schedule = []
+            self._packet_pool.append(packet)
+    
     def get_statistics(self) -> dict:
         """Get packet statistics"""
         return self.latency_engine.get_summary_statistics()
     
     def clear_all(self) -> None:
         """Clear all packets and metrics"""
-        self.all_packets.clear()
-        self.active_packets.clear()
+        # In-flight packets leave the animator before they can be reused
+        remove_from_animator = self.animator_worker.remove_packet
+        for packet in self.active_slots:
+            if packet is not None:
+                remove_from_animator(packet.id)
+        
+        for packets in (self.active_slots, self.delivered_packets, self.dropped_packets):
+            for packet in packets:
+                if packet is not None:
+                    self.release(packet)
+        self.active_slots.clear()
+        self._free_slots.clear()
         self.delivered_packets.clear()
         self.dropped_packets.clear()
         self.packet_counter = 0
@@ -530,6 +770,53 @@ class EnhancedMetricsDisplay:
     Enhanced display for latency/throughput metrics
     """
     
+    BORDER = "═══════════════════════════════════════════════════════════"
+    SUMMARY_TEMPLATE = (
+        f"{BORDER}\n"
+        "📊 NETWORK PERFORMANCE METRICS\n"
+        f"{BORDER}\n"
+        "\n"
+        "📈 PACKET STATISTICS\n"
+        "  Sent:        {total_sent} packets\n"
+        "  Delivered:   {total_delivered} packets\n"
+        "  Dropped:     {total_dropped} packets\n"
+        "  Success Rate: {delivery_rate:.1f}%\n"
+        "\n"
+        "⏱️  LATENCY METRICS\n"
+        "  Average:     {avg_latency_ms:.2f} ms\n"
+        "  Minimum:     {min_latency_ms:.2f} ms\n"
+        "  Maximum:     {max_latency_ms:.2f} ms\n"
+        "\n"
+        "🚀 THROUGHPUT METRICS\n"
+        "  Average:     {avg_throughput_mbps:.2f} Mbps\n"
+        "\n"
+        f"{BORDER}"
+    )
+    
+    # Fields read from PacketMetrics ({m.*}); {packet} is the formatted ID
+    DETAIL_TEMPLATE = (
+        f"{BORDER}\n"
+        "📦 PACKET DETAILS: {packet}\n"
+        f"{BORDER}\n"
+        "\n"
+        "Source → Destination:  {m.source_node_id} → {m.destination_node_id}\n"
+        "Path:                  {m.path_str}\n"
+        "Hops:                  {m.hop_count}\n"
+        "Size:                  {m.packet_size} bytes\n"
+        "State:                 {m.state}\n"
+        "\n"
+        "⏱️  TIMING\n"
+        "  Theoretical Latency: {m.total_latency:.2f} ms\n"
+        "  Actual Latency:      {m.actual_latency:.2f} ms\n"
+        "  Delay Factor:        {m.delay_factor:.2f}x\n"
+        "\n"
+        "💾 BANDWIDTH\n"
+        "  Bottleneck:          {m.bottleneck_bandwidth:.1f} Mbps\n"
+        "  Achieved Throughput: {m.throughput:.2f} Mbps\n"
+        "\n"
+        f"{BORDER}"
+    )
+    
     def __init__(self, label_widget, latency_engine: LatencyThroughputEngine):
         """
         Initialize metrics display
@@ -541,65 +828,34 @@ class EnhancedMetricsDisplay:
         self.label = label_widget
         self.latency_engine = latency_engine
         self.current_packet_metrics = None
+        self._last_key = None  # What the label currently shows
     
     def update_display(self) -> None:
-        """Refresh metrics display with current statistics"""
+        """Refresh metrics display with current statistics (skipped if unchanged)"""
         stats = self.latency_engine.get_summary_statistics()
         
-        display_text = (
-            f"═══════════════════════════════════════════════════════════\n"
-            f"📊 NETWORK PERFORMANCE METRICS\n"
-            f"═══════════════════════════════════════════════════════════\n"
-            f"\n"
-            f"📈 PACKET STATISTICS\n"
-            f"  Sent:        {stats['total_sent']} packets\n"
-            f"  Delivered:   {stats['total_delivered']} packets\n"
-            f"  Dropped:     {stats['total_dropped']} packets\n"
-            f"  Success Rate: {stats['delivery_rate']:.1f}%\n"
-            f"\n"
-            f"⏱️  LATENCY METRICS\n"
-            f"  Average:     {stats['avg_latency_ms']:.2f} ms\n"
-            f"  Minimum:     {stats['min_latency_ms']:.2f} ms\n"
-            f"  Maximum:     {stats['max_latency_ms']:.2f} ms\n"
-            f"\n"
-            f"🚀 THROUGHPUT METRICS\n"
-            f"  Average:     {stats['avg_throughput_mbps']:.2f} Mbps\n"
-            f"\n"
-            f"═══════════════════════════════════════════════════════════"
-        )
+        key = ("summary", *stats.values())
+        if key == self._last_key:
+            return
+        self._last_key = key
         
-        self.label.config(text=display_text)
+        self.label.config(text=self.SUMMARY_TEMPLATE.format_map(stats))
     
-    def update_packet_detail(self, packet_id: str) -> None:
-        """Update display with specific packet metrics"""
+    def update_packet_detail(self, packet_id: int) -> None:
+        """Update display with specific packet metrics (skipped if unchanged)"""
         metrics = self.latency_engine.get_packet_metrics(packet_id)
         
         if not metrics:
+            self._last_key = None
             self.label.config(text="Packet not found")
             return
         
-        display_text = (
-            f"═══════════════════════════════════════════════════════════\n"
-            f"📦 PACKET DETAILS: {packet_id}\n"
-            f"═══════════════════════════════════════════════════════════\n"
-            f"\n"
-            f"Source → Destination:  {metrics.source_node_id} → {metrics.destination_node_id}\n"
-            f"Path:                  {' → '.join(metrics.path_nodes)}\n"
-            f"Hops:                  {metrics.hop_count}\n"
-            f"Size:                  {metrics.packet_size} bytes\n"
-            f"State:                 {metrics.state}\n"
-            f"\n"
-            f"⏱️  TIMING\n"
-            f"  Theoretical Latency: {metrics.total_latency:.2f} ms\n"
-            f"  Actual Latency:      {metrics.actual_latency:.2f} ms\n"
-            f"  Delay Factor:        {metrics.actual_latency/metrics.total_latency:.2f}x\n"
-            f"\n"
-            f"💾 BANDWIDTH\n"
-            f"  Bottleneck:          {metrics.bottleneck_bandwidth:.1f} Mbps\n"
-            f"  Achieved Throughput: {metrics.throughput:.2f} Mbps\n"
-            f"\n"
-            f"═══════════════════════════════════════════════════════════"
-        )
+        key = ("packet", packet_id, metrics.creation_time, metrics.state)
+        if key == self._last_key:
+            return
+        self._last_key = key
+        
+        display_text = self.DETAIL_TEMPLATE.format(packet=format_packet_id(packet_id), m=metrics)
         
         self.label.config(text=display_text)
 
@@ -6,17 +6,22 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+import tkinter.font as tkfont
 import networkx as nx
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from enum import Enum
 import math
 import json
+import time
+from bisect import bisect_left
+from heapq import heappush, heappop
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from routing.router import DijkstraRouter, PathManager, PathInfo, MetricsDisplay
 from packet import (
         Packet, PacketState, PacketAnimator, 
-        AnimatorWorker, PacketManager
+        AnimatorWorker, PacketManager, format_packet_id
     )
 from latency import (
     LatencyThroughputEngine, EnhancedPacketManager, 
@@ -28,6 +33,11 @@ from congestion import (
 )
 from export import DataExportEngine, SimulationReportGenerator
 
+try:
+    import orjson  # Optional: much faster JSON encoder
+except ImportError:
+    orjson = None
+
 # ============================================================================
 # 1. CONFIGURATION
 # ============================================================================
@@ -47,6 +57,7 @@ class Config:
     NODE_COLOR_DEST = "lightyellow"
     NODE_COLOR_SELECTED = "cyan"
     NODE_TEXT_COLOR = "black"
+    NODE_GRID_CELL = 2 * NODE_RADIUS  # Hit-testing grid cell size (px)
     
     # Link settings
     LINK_COLOR_DEFAULT = "black"
@@ -67,16 +78,24 @@ class Config:
     # UI Layout
     CONTROL_PANEL_WIDTH = 280
     METRICS_PANEL_HEIGHT = 150
+    NODE_SELECTOR_ROWS = 100  # Max matches shown in a node dropdown
+    STATS_REFRESH_INTERVAL = 0.25  # Min seconds between stats label refreshes while animating
     WINDOW_WIDTH = 1400
     WINDOW_HEIGHT = 900
     WINDOW_TITLE = "Cloud Network Simulator"
+    
+    # Files
+    QUICK_SAVE_FILE = "topology.json"  # Overwritten by "Quick Save"
+    
+    # Activity log
+    LOG_MAX_LINES = 200  # Older lines are trimmed from the panel's log
 
 
 # ============================================================================
 # 2. DATA MODELS
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Node:
     """Represents a network node (router, host, etc.)"""
     
@@ -89,15 +108,29 @@ class Node:
     is_source: bool = False
     is_destination: bool = False
     connected_links: List['Link'] = field(default_factory=list)
+    display: str = field(init=False, repr=False, compare=False)  # "id: label" for dropdowns
+    
+    def __post_init__(self):
+        self.display = f"{self.id}: {self.label}"
+    
+    def __repr__(self) -> str:
+        return f"Node({self.id})"
+    
+    def set_label(self, label: str) -> None:
+        """Rename the node (keeps the cached display string in sync)"""
+        self.label = label
+        self.display = f"{self.id}: {label}"
     
     def get_position(self) -> Tuple[float, float]:
         """Return node position"""
         return (self.x, self.y)
     
     def set_position(self, x: float, y: float) -> None:
-        """Update node position"""
+        """Update node position (invalidates cached link geometry)"""
         self.x = x
         self.y = y
+        for link in self.connected_links:
+            link._invalidate_geometry()
     
     def add_link(self, link: 'Link') -> None:
         """Add a connected link"""
@@ -131,7 +164,7 @@ class Node:
         }
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Link:
     """Represents a network link (connection between nodes)"""
     
@@ -145,24 +178,40 @@ class Link:
     packets_dropped: int = 0
     is_bidirectional: bool = True
     color: str = Config.LINK_COLOR_DEFAULT
+    idx: int = -1  # congestion controller slot (-1 = no queue)
+    
+    # Geometry cache, cleared by Node.set_position on either endpoint
+    _midpoint: Optional[Tuple[float, float]] = field(default=None, init=False, repr=False, compare=False)
+    _length: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __repr__(self) -> str:
+        return f"Link({self.id})"
     
     def __post_init__(self):
         """Register link with nodes"""
         self.node_a.add_link(self)
         self.node_b.add_link(self)
     
+    def _invalidate_geometry(self) -> None:
+        """Drop cached length/midpoint after an endpoint moved"""
+        self._midpoint = None
+        self._length = None
+    
     def get_length(self) -> float:
         """Calculate Euclidean distance between nodes"""
-        dx = self.node_b.x - self.node_a.x
-        dy = self.node_b.y - self.node_a.y
-        return math.sqrt(dx**2 + dy**2)
+        if self._length is None:
+            self._length = math.hypot(self.node_b.x - self.node_a.x,
+                                      self.node_b.y - self.node_a.y)
+        return self._length
     
     def get_midpoint(self) -> Tuple[float, float]:
         """Get midpoint of link for label placement"""
-        return (
-            (self.node_a.x + self.node_b.x) / 2,
-            (self.node_a.y + self.node_b.y) / 2
-        )
+        if self._midpoint is None:
+            self._midpoint = (
+                (self.node_a.x + self.node_b.x) * 0.5,
+                (self.node_a.y + self.node_b.y) * 0.5
+            )
+        return self._midpoint
     
     def update_queue_color(self) -> None:
         """Update link color based on queue utilization"""
@@ -207,11 +256,19 @@ class NetworkManager:
     def __init__(self):
         self.nodes: Dict[str, Node] = {}
         self.links: Dict[str, Link] = {}
+        self.link_index: Dict[Tuple[str, str], Link] = {}  # (a, b) and (b, a) -> Link
+        self.adj: Dict[str, Dict[str, Tuple[float, str]]] = {}  # node -> neighbor -> (latency, link_id)
+        self._grid: Dict[Tuple[int, int], List[Node]] = {}  # grid cell -> nodes whose center is in it
         self.graph = nx.Graph()
         self.node_counter = 0
         self.link_counter = 0
         self.selected_source: Optional[Node] = None
         self.selected_destination: Optional[Node] = None
+        self.topology_version = 0  # Bumped whenever nodes/links are added or removed
+        self.link_added_callbacks: List[Callable[[Link], None]] = []  # Called with each new link
+        self.link_removed_callbacks: List[Callable[[Link], None]] = []  # Called with each removed link
+        self.total_latency = 0.0  # Sum of link latencies, kept up to date
+        self._bandwidth_heap: List[Tuple[float, str]] = []  # (bandwidth, link_id); may hold removed links
     
     def add_node(self, x: float, y: float, label: str = None) -> Node:
         """Add a new node to the network"""
@@ -220,8 +277,8 @@ class NetworkManager:
             raise ValueError("Node position out of canvas bounds")
         
         # Check for duplicate position
-        for node in self.nodes.values():
-            dist = math.sqrt((node.x - x)**2 + (node.y - y)**2)
+        for node in self._nodes_near(x, y):
+            dist = math.hypot(node.x - x, node.y - y)
             if dist < Config.NODE_RADIUS * 2:
                 raise ValueError("Node too close to existing node")
         
@@ -237,7 +294,10 @@ class NetworkManager:
         )
         
         self.nodes[node_id] = node
+        self._grid.setdefault(self._grid_cell(x, y), []).append(node)
+        self.adj[node_id] = {}
         self.graph.add_node(node_id, label=node_label)
+        self.topology_version += 1
         
         return node
     
@@ -255,7 +315,10 @@ class NetworkManager:
         
         # Remove from graph and storage
         self.graph.remove_node(node_id)
+        self._grid_remove(node)
+        del self.adj[node_id]
         del self.nodes[node_id]
+        self.topology_version += 1
         
         return True
     
@@ -272,10 +335,8 @@ class NetworkManager:
             raise ValueError("Cannot create self-loop")
         
         # Check for duplicate link
-        for link in self.links.values():
-            if (link.node_a.id == node_a_id and link.node_b.id == node_b_id) or \
-               (link.node_a.id == node_b_id and link.node_b.id == node_a_id):
-                raise ValueError("Link already exists between these nodes")
+        if (node_a_id, node_b_id) in self.link_index:
+            raise ValueError("Link already exists between these nodes")
         
         # Validate parameters
         if not (Config.MIN_LATENCY <= latency <= Config.MAX_LATENCY):
@@ -301,10 +362,20 @@ class NetworkManager:
         )
         
         self.links[link_id] = link
+        self.total_latency += latency
+        heappush(self._bandwidth_heap, (bandwidth, link_id))
+        self.link_index[(node_a_id, node_b_id)] = link
+        self.link_index[(node_b_id, node_a_id)] = link
+        self.adj[node_a_id][node_b_id] = (latency, link_id)
+        self.adj[node_b_id][node_a_id] = (latency, link_id)
         self.graph.add_edge(node_a_id, node_b_id, 
                            weight=latency, 
                            bandwidth=bandwidth,
                            link_id=link_id)
+        self.topology_version += 1
+        
+        for callback in self.link_added_callbacks:
+            callback(link)
         
         return link
     
@@ -319,50 +390,131 @@ class NetworkManager:
         link.node_a.remove_link(link)
         link.node_b.remove_link(link)
         
-        # Remove from graph
+        # Remove from graph and index
         self.graph.remove_edge(link.node_a.id, link.node_b.id)
+        del self.link_index[(link.node_a.id, link.node_b.id)]
+        del self.link_index[(link.node_b.id, link.node_a.id)]
+        del self.adj[link.node_a.id][link.node_b.id]
+        del self.adj[link.node_b.id][link.node_a.id]
         
         del self.links[link_id]
+        # Reset rather than subtract down to zero, so float error can't linger
+        self.total_latency = self.total_latency - link.latency if self.links else 0.0
+        self.topology_version += 1
+        
+        for callback in self.link_removed_callbacks:
+            callback(link)
+        
         return True
     
+    def move_node(self, node: Node, x: float, y: float) -> None:
+        """Move a node, keeping the hit-testing grid in sync"""
+        if self._grid_cell(node.x, node.y) != self._grid_cell(x, y):
+            self._grid_remove(node)
+            self._grid.setdefault(self._grid_cell(x, y), []).append(node)
+        node.set_position(x, y)
+    
+    @staticmethod
+    def _grid_cell(x: float, y: float) -> Tuple[int, int]:
+        """Grid cell containing a canvas position"""
+        return (int(x // Config.NODE_GRID_CELL), int(y // Config.NODE_GRID_CELL))
+    
+    def _grid_remove(self, node: Node) -> None:
+        """Remove a node from the grid cell of its current position"""
+        cell = self._grid_cell(node.x, node.y)
+        bucket = self._grid.get(cell)
+        if bucket is not None:
+            bucket.remove(node)
+            if not bucket:
+                del self._grid[cell]
+    
+    def _nodes_near(self, x: float, y: float):
+        """Nodes in the 3x3 block of grid cells around a position"""
+        cx, cy = self._grid_cell(x, y)
+        grid = self._grid
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                bucket = grid.get((gx, gy))
+                if bucket:
+                    yield from bucket
+    
     def get_node_by_pos(self, x: float, y: float, tolerance: int = 25) -> Optional[Node]:
-        """Get node at canvas position (within tolerance radius)"""
-        for node in self.nodes.values():
-            dist = math.sqrt((node.x - x)**2 + (node.y - y)**2)
-            if dist <= tolerance:
-                return node
-        return None
+        """Get the closest node at canvas position (within tolerance radius)"""
+        # The 3x3 grid block covers one cell in every direction
+        candidates = self._nodes_near(x, y) if tolerance <= Config.NODE_GRID_CELL \
+            else self.nodes.values()
+        
+        best = None
+        best_dist = tolerance
+        for node in candidates:
+            dist = math.hypot(node.x - x, node.y - y)
+            if dist <= best_dist:
+                best = node
+                best_dist = dist
+        return best
     
     def get_link_by_nodes(self, node_a_id: str, node_b_id: str) -> Optional[Link]:
-        """Get link between two nodes"""
-        for link in self.links.values():
-            if (link.node_a.id == node_a_id and link.node_b.id == node_b_id) or \
-               (link.node_a.id == node_b_id and link.node_b.id == node_a_id):
-                return link
-        return None
+        """Get link between two nodes (either direction)"""
+        return self.link_index.get((node_a_id, node_b_id))
+    
+    def neighbors(self, node_id: str) -> Dict[str, Tuple[float, str]]:
+        """Get neighbors of a node as {neighbor_id: (latency, link_id)}"""
+        return self.adj.get(node_id, {})
+    
+    def edge_weight(self, node_a_id: str, node_b_id: str) -> Optional[float]:
+        """Get latency of the link between two nodes, or None if not linked"""
+        edge = self.adj.get(node_a_id, {}).get(node_b_id)
+        return edge[0] if edge else None
+    
+    def get_min_bandwidth(self) -> float:
+        """
+        Smallest link bandwidth (0 if there are no links)
+        
+        Heap entries of removed links are discarded lazily, here.
+        """
+        heap = self._bandwidth_heap
+        links = self.links
+        while heap:
+            bandwidth, link_id = heap[0]
+            link = links.get(link_id)
+            if link is not None and link.bandwidth == bandwidth:
+                return bandwidth
+            heappop(heap)
+        return 0.0
     
     def update_networkx_graph(self) -> None:
-        """Rebuild NetworkX graph from current topology"""
-        self.graph = nx.Graph()
-        
-        for node_id, node in self.nodes.items():
-            self.graph.add_node(node_id, label=node.label)
-        
-        for link in self.links.values():
-            self.graph.add_edge(link.node_a.id, link.node_b.id,
-                               weight=link.latency,
-                               bandwidth=link.bandwidth,
-                               link_id=link.id)
+        """
+        Check the NetworkX graph and adjacency against the topology
+        
+        add_node/remove_node/add_link/remove_link keep both up to date
+        incrementally, so nothing is rebuilt; the check is skipped under -O.
+        """
+        if __debug__:
+            assert self.graph.nodes.keys() == self.nodes.keys()
+            assert self.adj.keys() == self.nodes.keys()
+            assert self.graph.number_of_edges() == len(self.links)
+            assert sum(map(len, self.adj.values())) == 2 * len(self.links)
     
     def clear_all(self) -> None:
         """Clear entire network"""
+        removed_links = list(self.links.values())
         self.nodes.clear()
         self.links.clear()
+        self.link_index.clear()
+        self.adj.clear()
+        self._grid.clear()
         self.graph.clear()
+        self.total_latency = 0.0
+        self._bandwidth_heap.clear()
         self.node_counter = 0
         self.link_counter = 0
         self.selected_source = None
         self.selected_destination = None
+        self.topology_version += 1
+        
+        for link in removed_links:
+            for callback in self.link_removed_callbacks:
+                callback(link)
     
     def to_dict(self) -> dict:
         """Serialize network to dictionary"""
@@ -386,8 +538,13 @@ class CanvasRenderer:
         self.node_graphics: Dict[str, int] = {}  # node_id -> canvas oval id
         self.link_graphics: Dict[str, int] = {}  # link_id -> canvas line id
         self.link_labels: Dict[str, int] = {}    # link_id -> canvas text id
+        self.link_colors: Dict[str, str] = {}    # link_id -> fill currently drawn
         self.highlighted_links: List[int] = []
+        self.packet_items: Dict[int, Tuple[int, int]] = {}  # packet_id -> (oval id, text id)
         self.dragged_node: Optional[Node] = None
+        self._drag_in_progress = False  # Link labels are placed on release
+        self._synced_version = -1  # topology_version the canvas items reflect
+        self._canvas_path = str(canvas)  # Tcl command name, for batched scripts
     
     def draw_node(self, node: Node) -> int:
         """Draw a node on canvas"""
@@ -400,7 +557,7 @@ class CanvasRenderer:
             fill=node.color,
             outline="black",
             width=2,
-            tags=f"node_{node.id}"
+            tags=(f"node_{node.id}", "node")
         )
         
         # Draw label
@@ -409,7 +566,7 @@ class CanvasRenderer:
             text=node.label,
             font=("Arial", 9, "bold"),
             fill=Config.NODE_TEXT_COLOR,
-            tags=f"node_label_{node.id}"
+            tags=(f"node_label_{node.id}", "node")
         )
         
         self.node_graphics[node.id] = oval_id
@@ -425,7 +582,7 @@ class CanvasRenderer:
             x1, y1, x2, y2,
             fill=link.color,
             width=Config.LINK_WIDTH_DEFAULT,
-            tags=f"link_{link.id}"
+            tags=(f"link_{link.id}", "link")
         )
         
         # Draw label at midpoint
@@ -437,36 +594,59 @@ class CanvasRenderer:
             font=("Arial", 8),
             fill="darkblue",
             background="lightyellow",
-            tags=f"link_label_{link.id}"
+            tags=(f"link_label_{link.id}", "link")
         )
         
         self.link_graphics[link.id] = line_id
         self.link_labels[link.id] = text_id
+        self.link_colors[link.id] = link.color
         return line_id
     
     def update_node_position(self, node_id: str, x: float, y: float) -> None:
-        """Update node position and redraw connected links"""
+        """
+        Update node position and redraw connected links
+        
+        While a drag is in progress only the link lines follow the node;
+        link labels are repositioned once by end_drag().
+        """
         if node_id not in self.node_graphics:
             return
         
         node = self.network_manager.nodes[node_id]
-        r = node.radius
+        dx = x - node.x
+        dy = y - node.y
         
-        # Update node position
-        oval_id = self.node_graphics[node_id]
-        self.canvas.coords(oval_id, x - r, y - r, x + r, y + r)
-        
-        # Update label position
-        self.canvas.coords(f"node_label_{node_id}", x, y)
+        # Shift oval and label relative to where they are
+        self.canvas.move(f"node_{node_id}", dx, dy)
+        self.canvas.move(f"node_label_{node_id}", dx, dy)
         
         # Update node object
-        node.set_position(x, y)
+        self.network_manager.move_node(node, x, y)
         
         # Redraw connected links
+        with_labels = not self._drag_in_progress
+        for link in node.connected_links:
+            self._redraw_link(link, with_labels)
+    
+    def begin_drag(self, node: Node) -> None:
+        """Start dragging a node"""
+        self.dragged_node = node
+        self._drag_in_progress = True
+    
+    def end_drag(self) -> None:
+        """Finish a drag and place the labels of the moved node's links"""
+        node = self.dragged_node
+        self.dragged_node = None
+        self._drag_in_progress = False
+        if node is None:
+            return
+        
         for link in node.connected_links:
-            self._redraw_link(link)
+            text_id = self.link_labels.get(link.id)
+            if text_id is not None:
+                self.canvas.coords(text_id, *link.get_midpoint())
     
-    def _redraw_link(self, link: Link) -> None:
+    def _redraw_link(self, link: Link, with_label: bool = True) -> None:
         """Redraw a link (used when nodes move)"""
         if link.id not in self.link_graphics:
             return
@@ -479,9 +659,10 @@ class CanvasRenderer:
         self.canvas.coords(line_id, x1, y1, x2, y2)
         
         # Update label
-        mx, my = link.get_midpoint()
-        text_id = self.link_labels[link.id]
-        self.canvas.coords(text_id, mx, my)
+        if with_label:
+            mx, my = link.get_midpoint()
+            text_id = self.link_labels[link.id]
+            self.canvas.coords(text_id, mx, my)
     
     def highlight_link(self, link: Link) -> int:
         """Highlight a link with thicker yellow line"""
@@ -500,18 +681,62 @@ class CanvasRenderer:
         self.canvas.tag_lower(line_id)
         return line_id
     
+    def highlight_links(self, links: List[Link]) -> List[int]:
+        """
+        Highlight several links (e.g. a whole path) at once
+        
+        Same result as calling highlight_link() for each, but the
+        highlights are lowered beneath the regular links in a single call.
+        
+        Returns:
+            Canvas item IDs of the highlight lines
+        """
+        create_line = self.canvas.create_line
+        line_ids = [
+            create_line(
+                link.node_a.x, link.node_a.y, link.node_b.x, link.node_b.y,
+                fill="yellow",
+                width=Config.LINK_WIDTH_HIGHLIGHTED,
+                tags="highlighted_link"
+            )
+            for link in links
+        ]
+        
+        if line_ids:
+            self.highlighted_links.extend(line_ids)
+            # Move to back so regular links appear on top
+            self.canvas.tag_lower("highlighted_link")
+        return line_ids
+    
+    def visible_region(self) -> Tuple[float, float, float, float]:
+        """Canvas coordinates (x1, y1, x2, y2) currently shown in the widget"""
+        x1 = self.canvas.canvasx(0)
+        y1 = self.canvas.canvasy(0)
+        return (x1, y1,
+                x1 + self.canvas.winfo_width(),
+                y1 + self.canvas.winfo_height())
+    
+    @staticmethod
+    def is_viewport_visible(x1: float, y1: float, x2: float, y2: float,
+                            region: Tuple[float, float, float, float]) -> bool:
+        """Check whether a bounding box overlaps the visible region"""
+        rx1, ry1, rx2, ry2 = region
+        return x1 <= rx2 and x2 >= rx1 and y1 <= ry2 and y2 >= ry1
+    
     def clear_highlights(self) -> None:
         """Clear all highlighted links"""
-        for line_id in self.highlighted_links:
-            self.canvas.delete(line_id)
+        self.canvas.delete("highlighted_link")
         self.highlighted_links.clear()
     
     def redraw_all(self) -> None:
-        """Redraw entire canvas"""
+        """Redraw entire canvas (also drops path highlights)"""
         self.canvas.delete("all")
         self.node_graphics.clear()
         self.link_graphics.clear()
         self.link_labels.clear()
+        self.link_colors.clear()
+        self.highlighted_links.clear()
+        self.packet_items.clear()
         
         # Draw all links first (so they appear behind nodes)
         for link in self.network_manager.links.values():
@@ -520,12 +745,230 @@ class CanvasRenderer:
         # Draw all nodes on top
         for node in self.network_manager.nodes.values():
             self.draw_node(node)
+        self._synced_version = self.network_manager.topology_version
+    
+    def refresh_all(self) -> None:
+        """
+        Bring the canvas in line with the topology without recreating items
+        
+        Only items for added or removed nodes/links are created or deleted
+        (and only after the topology version changed); existing links just
+        get their fill updated when their color changed.
+        """
+        links = self.network_manager.links
+        
+        if self.network_manager.topology_version != self._synced_version:
+            self._sync_items()
+        else:
+            # Recolor links whose congestion color changed
+            for link_id, link in links.items():
+                if self.link_colors[link_id] != link.color:
+                    self.canvas.itemconfigure(self.link_graphics[link_id], fill=link.color)
+                    self.link_colors[link_id] = link.color
+    
+    def draw_packets(self, positions: List[Tuple[int, float, float]]) -> None:
+        """
+        Place packet markers, reusing each packet's canvas items across frames
+        
+        Packets seen before are just moved, with all their coords commands
+        sent to Tcl as one script; items are only created for new packets
+        and deleted for ones that are gone or outside the visible region.
+        
+        Args:
+            positions: (packet_id, x, y) for every animating packet
+        """
+        canvas = self.canvas
+        items = self.packet_items
+        region = self.visible_region()
+        is_visible = self.is_viewport_visible
+        path = self._canvas_path
+        moves = []
+        shown = set()
+        
+        for pkt_id, x, y in positions:
+            if not is_visible(x - 20, y - 17, x + 20, y + 5, region):
+                continue
+            shown.add(pkt_id)
+            pair = items.get(pkt_id)
+            if pair is None:
+                items[pkt_id] = (
+                    canvas.create_oval(
+                        x - 5, y - 5, x + 5, y + 5,
+                        fill="red", outline="darkred", width=2,
+                        tags="packet"
+                    ),
+                    # Packet ID label
+                    canvas.create_text(
+                        x, y - 10,
+                        text=format_packet_id(pkt_id),
+                        font=("Arial", 7),
+                        fill="red",
+                        tags="packet"
+                    ),
+                )
+            else:
+                oval_id, text_id = pair
+                moves.append(
+                    f"{path} coords {oval_id} {x - 5:.1f} {y - 5:.1f} {x + 5:.1f} {y + 5:.1f}\n"
+                    f"{path} coords {text_id} {x:.1f} {y - 10:.1f}"
+                )
+        
+        # One Tcl round-trip for every move this frame
+        if moves:
+            canvas.tk.eval("\n".join(moves))
+        
+        # Drop items of finished, removed or off-screen packets
+        for pkt_id in items.keys() - shown:
+            canvas.delete(*items.pop(pkt_id))
+    
+    def _sync_items(self) -> None:
+        """Create/delete items for added/removed nodes and links, recolor the rest"""
+        nodes = self.network_manager.nodes
+        links = self.network_manager.links
+        
+        # Remove items of deleted links and nodes
+        for link_id in self.link_graphics.keys() - links.keys():
+            self.canvas.delete(f"link_{link_id}", f"link_label_{link_id}")
+            del self.link_graphics[link_id]
+            del self.link_labels[link_id]
+            del self.link_colors[link_id]
+        for node_id in self.node_graphics.keys() - nodes.keys():
+            self.canvas.delete(f"node_{node_id}", f"node_label_{node_id}")
+            del self.node_graphics[node_id]
+        
+        # Draw new items, recolor existing links
+        for link_id, link in links.items():
+            if link_id not in self.link_graphics:
+                self.draw_link(link)
+            elif self.link_colors[link_id] != link.color:
+                self.canvas.itemconfigure(self.link_graphics[link_id], fill=link.color)
+                self.link_colors[link_id] = link.color
+        for node_id, node in nodes.items():
+            if node_id not in self.node_graphics:
+                self.draw_node(node)
+        
+        # Keep nodes above links, packets above both
+        self.canvas.tag_raise("node")
+        self.canvas.tag_raise("packet")
+        self._synced_version = self.network_manager.topology_version
 
 
 # ============================================================================
 # 5. CONTROL PANEL
 # ============================================================================
 
+class NodeSelector:
+    """
+    Searchable node dropdown
+    
+    An entry with a popup listbox that only ever holds the first
+    Config.NODE_SELECTOR_ROWS node IDs matching the typed prefix, so
+    opening it costs the same regardless of topology size.
+    """
+    
+    def __init__(self, parent: tk.Widget, textvariable: tk.StringVar,
+                 width: int = 24):
+        self.var = textvariable
+        self.entry = tk.Entry(parent, textvariable=textvariable, width=width)
+        self._ids: List[str] = []
+        self._display: List[str] = []
+        self._popup: Optional[tk.Toplevel] = None
+        self._listbox: Optional[tk.Listbox] = None
+        
+        self.entry.bind("<KeyRelease>", self._on_key)
+        self.entry.bind("<Button-1>", lambda e: self._show())
+        self.entry.bind("<Down>", self._on_down)
+        self.entry.bind("<Escape>", lambda e: self._hide())
+        self.entry.bind("<FocusOut>", self._on_focus_out)
+    
+    def pack(self, **kwargs) -> None:
+        self.entry.pack(**kwargs)
+    
+    def set_values(self, ids: List[str], display: List[str]) -> None:
+        """
+        Set the selectable nodes
+        
+        Args:
+            ids: Node IDs in sorted order
+            display: "id: label" strings parallel to ids
+        """
+        self._ids = ids
+        self._display = display
+        if self._popup is not None:
+            self._refill()
+    
+    def _matches(self) -> List[str]:
+        """First NODE_SELECTOR_ROWS display strings whose ID has the typed prefix"""
+        prefix = self.var.get().split(":")[0].strip()
+        ids = self._ids
+        start = bisect_left(ids, prefix)
+        matches = []
+        for i in range(start, min(len(ids), start + Config.NODE_SELECTOR_ROWS)):
+            if not ids[i].startswith(prefix):
+                break
+            matches.append(self._display[i])
+        return matches
+    
+    def _refill(self) -> None:
+        self._listbox.delete(0, tk.END)
+        matches = self._matches()
+        if matches:
+            self._listbox.insert(tk.END, *matches)
+    
+    def _show(self) -> None:
+        if self._popup is None:
+            popup = tk.Toplevel(self.entry)
+            popup.wm_overrideredirect(True)
+            listbox = tk.Listbox(popup, width=self.entry.cget("width"),
+                                 height=10, exportselection=False)
+            listbox.pack(fill="both", expand=True)
+            listbox.bind("<ButtonRelease-1>", self._on_select)
+            listbox.bind("<Return>", self._on_select)
+            listbox.bind("<Escape>", lambda e: self._hide())
+            self._popup = popup
+            self._listbox = listbox
+        
+        x = self.entry.winfo_rootx()
+        y = self.entry.winfo_rooty() + self.entry.winfo_height()
+        self._popup.wm_geometry(f"+{x}+{y}")
+        self._refill()
+    
+    def _hide(self) -> None:
+        if self._popup is not None:
+            self._popup.destroy()
+            self._popup = None
+            self._listbox = None
+    
+    def _on_key(self, event) -> None:
+        if event.keysym in ("Escape", "Down", "Return", "Tab"):
+            return
+        self._show()
+    
+    def _on_down(self, event) -> None:
+        self._show()
+        if self._listbox.size():
+            self._listbox.focus_set()
+            self._listbox.selection_set(0)
+            self._listbox.activate(0)
+    
+    def _on_focus_out(self, event) -> None:
+        # Let clicks on the listbox land before tearing it down
+        self.entry.after(150, self._hide_unless_focused)
+    
+    def _hide_unless_focused(self) -> None:
+        if self._listbox is not None and self.entry.focus_get() is self._listbox:
+            return
+        self._hide()
+    
+    def _on_select(self, event) -> None:
+        selection = self._listbox.curselection()
+        if selection:
+            self.var.set(self._listbox.get(selection[0]))
+            self.entry.icursor(tk.END)
+        self._hide()
+        self.entry.focus_set()
+
+
 class ControlPanel:
     """UI control panel for network operations"""
     
@@ -535,196 +978,360 @@ class ControlPanel:
         self.network_manager = network_manager
         self.canvas_renderer = canvas_renderer
         self.update_callback = update_callback
+        # Owning MainWindow (registered on the manager before the panel is
+        # built); None when the panel is used standalone
+        self._main_window = getattr(network_manager, 'main_window', None)
+        
+        # Sorted node ids and their "id: label" display strings, kept in
+        # step so single add/remove events don't re-sort the whole list
+        self._sorted_node_ids: List[str] = []
+        self._node_display: List[str] = []
+        self._node_values: Tuple[str, ...] = ()
+        
+        # Node IDs parsed from the "id: label" selections, kept current by
+        # variable traces so callbacks don't re-split the strings
+        self._src_id: Optional[str] = None
+        self._dst_id: Optional[str] = None
+        
+        # Status bar text (shown by the main window); updates are coalesced
+        self.status_var = tk.StringVar(value="Ready")
+        self._pending_status: Optional[str] = None
+        self._log_queue: List[str] = []  # Lines waiting for the next idle flush
+        
+        # Exports run here so the UI keeps handling events meanwhile
+        self._export_pool = ThreadPoolExecutor(max_workers=1)
+        self._export_future: Optional[Future] = None
+        # Topology saves likewise, one at a time in request order
+        self._save_pool = ThreadPoolExecutor(max_workers=1)
+        
+        # Notebook tabs are populated lazily, on first selection
+        self._tab_builders: Dict[str, Tuple[Callable, ttk.Frame]] = {}
+        self._built_tabs: Set[str] = set()
+        self.btn_send_one: Optional[tk.Button] = None
+        self.btn_send_burst: Optional[tk.Button] = None
         
         self._create_widgets()
     
+    def _make_button(self, parent: tk.Widget, text: str, command,
+                     bg: Optional[str] = None, bold: bool = False) -> tk.Button:
+        """
+        Create and pack a standard panel button
+        
+        Args:
+            parent: Container to pack into
+            text: Button caption
+            command: Click callback
+            bg: Background color (system default if None)
+            bold: Use the bold panel font
+        
+        Returns:
+            The packed button
+        """
+        options = self._button_bold if bold else self._button_plain
+        if bg:
+            options = {**options, "bg": bg}
+        button = tk.Button(parent, text=text, command=command, **options)
+        button.pack(pady=5, padx=10)
+        return button
+    
     def _create_widgets(self) -> None:
-        """Create all control panel widgets"""
+        """Create the always-visible widgets; tab contents are built on first view"""
+        
+        # Shared fonts, so Tk doesn't parse a font tuple per widget
+        self._font_title = tkfont.Font(family="Arial", size=12, weight="bold")
+        self._font_heading = tkfont.Font(family="Arial", size=10, weight="bold")
+        self._font_bold = tkfont.Font(family="Arial", size=9, weight="bold")
+        self._font_small = tkfont.Font(family="Arial", size=9)
+        self._button_plain = {"width": 25}
+        self._button_bold = {"width": 25, "font": self._font_bold}
+        
+        # Build everything into an unmapped container and map it once at
+        # the end, so geometry is computed in a single pass
+        panel = tk.Frame(self.frame, bg=self.frame.cget("bg"))
         
         # Title
-        title = tk.Label(self.frame, text="🔧 Topology Editor", 
-                        font=("Arial", 12, "bold"))
+        title = tk.Label(panel, text="🔧 Topology Editor", 
+                        font=self._font_title)
         title.pack(pady=10)
         
         # Separator
-        ttk.Separator(self.frame, orient="horizontal").pack(fill="x", pady=5)
+        ttk.Separator(panel, orient="horizontal").pack(fill="x", pady=5)
         
+        # ========== ENDPOINTS (shared by every tab) ==========
+        # Source node
+        tk.Label(panel, text="Source Node:", font=self._font_small).pack(anchor="w", padx=10)
+        self.source_var = tk.StringVar()
+        self.source_select = NodeSelector(panel, self.source_var, width=27)
+        self.source_select.pack(padx=10, pady=(0, 5))
+        
+        # Destination node
+        tk.Label(panel, text="Dest Node:", font=self._font_small).pack(anchor="w", padx=10)
+        self.dest_var = tk.StringVar()
+        self.dest_select = NodeSelector(panel, self.dest_var, width=27)
+        self.dest_select.pack(padx=10, pady=(0, 5))
+        
+        self.source_var.trace_add("write", self._on_source_changed)
+        self.dest_var.trace_add("write", self._on_dest_changed)
+        
+        # ========== SECTIONS ==========
+        self.notebook = ttk.Notebook(panel)
+        self.notebook.pack(fill="both", expand=True, padx=5, pady=5)
+        
+        for name, builder in (("Topology", self._build_topology_tab),
+                              ("Routing", self._build_routing_tab),
+                              ("Packets", self._build_packets_tab),
+                              ("Export", self._build_export_tab)):
+            tab = ttk.Frame(self.notebook)
+            self.notebook.add(tab, text=name)
+            self._tab_builders[str(tab)] = (builder, tab)
+        
+        # Only the first tab is populated now; the rest on first selection
+        self._build_tab(self.notebook.select())
+        self.notebook.bind("<<NotebookTabChanged>>",
+                           lambda e: self._build_tab(self.notebook.select()))
+        
+        # ========== DETAILS (last path / packet) ==========
+        self.details_tree = ttk.Treeview(panel, columns=("field", "value"),
+                                         show="headings", height=6)
+        self.details_tree.heading("field", text="Field")
+        self.details_tree.heading("value", text="Value")
+        self.details_tree.column("field", width=90, stretch=False)
+        self.details_tree.column("value", width=150)
+        self.details_tree.pack(padx=10, pady=(0, 5))
+        
+        # ========== ACTIVITY LOG ==========
+        tk.Label(panel, text="Activity Log", font=self._font_small).pack(anchor="w", padx=10)
+        self.log_text = tk.Text(panel, height=4, width=30, state="disabled",
+                                font=self._font_small, wrap="none")
+        self.log_text.pack(padx=10, pady=(0, 10))
+        
+        panel.pack(fill="both", expand=True)
+        self.frame.update_idletasks()
+    
+    def _build_tab(self, tab_name: str) -> None:
+        """Populate a notebook tab the first time it is shown"""
+        if tab_name in self._built_tabs:
+            return
+        self._built_tabs.add(tab_name)
+        builder, tab = self._tab_builders[tab_name]
+        builder(tab)
+    
+    def _build_topology_tab(self, panel: ttk.Frame) -> None:
+        """Node, link and file operations"""
         # ========== NODE OPERATIONS ==========
-        tk.Label(self.frame, text="Node Operations", 
-                font=("Arial", 10, "bold")).pack(anchor="w", padx=10, pady=(10, 5))
+        tk.Label(panel, text="Node Operations", 
+                font=self._font_heading).pack(anchor="w", padx=10, pady=(10, 5))
         
-        btn_add_node = tk.Button(self.frame, text="➕ Add Node (Click Canvas)",
-                                command=self._on_add_node, 
-                                bg="#90EE90", width=25)
-        btn_add_node.pack(pady=5, padx=10)
+        self._make_button(panel, "➕ Add Node (Click Canvas)", self._on_add_node, "#90EE90")
         
         # Node label input
-        tk.Label(self.frame, text="Node Label:", font=("Arial", 9)).pack(anchor="w", padx=10)
+        tk.Label(panel, text="Node Label:", font=self._font_small).pack(anchor="w", padx=10)
         self.node_label_var = tk.StringVar(value="")
-        entry = tk.Entry(self.frame, textvariable=self.node_label_var, width=27)
+        entry = tk.Entry(panel, textvariable=self.node_label_var, width=27)
         entry.pack(padx=10, pady=(0, 5))
         
-        btn_del_node = tk.Button(self.frame, text="🗑️ Delete Node",
-                                command=self._on_delete_node,
-                                bg="#FFB6C6", width=25)
-        btn_del_node.pack(pady=5, padx=10)
+        self._make_button(panel, "🗑️ Delete Node", self._on_delete_node, "#FFB6C6")
         
         # Separator
-        ttk.Separator(self.frame, orient="horizontal").pack(fill="x", pady=5)
+        ttk.Separator(panel, orient="horizontal").pack(fill="x", pady=5)
         
         # ========== LINK OPERATIONS ==========
-        tk.Label(self.frame, text="Link Operations", 
-                font=("Arial", 10, "bold")).pack(anchor="w", padx=10, pady=(10, 5))
-        
-        # Source node
-        tk.Label(self.frame, text="Source Node:", font=("Arial", 9)).pack(anchor="w", padx=10)
-        self.source_var = tk.StringVar()
-        self.source_combo = ttk.Combobox(self.frame, textvariable=self.source_var,
-                                         state="readonly", width=24)
-        self.source_combo.pack(padx=10, pady=(0, 5))
-        
-        # Destination node
-        tk.Label(self.frame, text="Dest Node:", font=("Arial", 9)).pack(anchor="w", padx=10)
-        self.dest_var = tk.StringVar()
-        self.dest_combo = ttk.Combobox(self.frame, textvariable=self.dest_var,
-                                       state="readonly", width=24)
-        self.dest_combo.pack(padx=10, pady=(0, 5))
+        tk.Label(panel, text="Link Operations", 
+                font=self._font_heading).pack(anchor="w", padx=10, pady=(10, 5))
         
         # Latency
-        tk.Label(self.frame, text="Latency (ms):", font=("Arial", 9)).pack(anchor="w", padx=10)
+        tk.Label(panel, text="Latency (ms):", font=self._font_small).pack(anchor="w", padx=10)
         self.latency_var = tk.DoubleVar(value=5.0)
-        tk.Spinbox(self.frame, from_=Config.MIN_LATENCY, to=Config.MAX_LATENCY,
+        tk.Spinbox(panel, from_=Config.MIN_LATENCY, to=Config.MAX_LATENCY,
                   textvariable=self.latency_var, width=25).pack(padx=10, pady=(0, 5))
         
         # Bandwidth
-        tk.Label(self.frame, text="Bandwidth (Mbps):", font=("Arial", 9)).pack(anchor="w", padx=10)
+        tk.Label(panel, text="Bandwidth (Mbps):", font=self._font_small).pack(anchor="w", padx=10)
         self.bandwidth_var = tk.DoubleVar(value=100.0)
-        tk.Spinbox(self.frame, from_=Config.MIN_BANDWIDTH, to=Config.MAX_BANDWIDTH,
+        tk.Spinbox(panel, from_=Config.MIN_BANDWIDTH, to=Config.MAX_BANDWIDTH,
                   textvariable=self.bandwidth_var, width=25).pack(padx=10, pady=(0, 5))
         
         # Queue size
-        tk.Label(self.frame, text="Queue Size (packets):", font=("Arial", 9)).pack(anchor="w", padx=10)
+        tk.Label(panel, text="Queue Size (packets):", font=self._font_small).pack(anchor="w", padx=10)
         self.queue_var = tk.IntVar(value=50)
-        tk.Spinbox(self.frame, from_=Config.MIN_QUEUE_SIZE, to=Config.MAX_QUEUE_SIZE,
+        tk.Spinbox(panel, from_=Config.MIN_QUEUE_SIZE, to=Config.MAX_QUEUE_SIZE,
                   textvariable=self.queue_var, width=25).pack(padx=10, pady=(0, 5))
         
-        btn_add_link = tk.Button(self.frame, text="➕ Add Link",
-                                command=self._on_add_link,
-                                bg="#87CEEB", width=25)
-        btn_add_link.pack(pady=5, padx=10)
+        self._make_button(panel, "➕ Add Link", self._on_add_link, "#87CEEB")
+        self._make_button(panel, "🗑️ Delete Link", self._on_delete_link, "#FFB6C6")
         
-        btn_del_link = tk.Button(self.frame, text="🗑️ Delete Link",
-                                command=self._on_delete_link,
-                                bg="#FFB6C6", width=25)
-        btn_del_link.pack(pady=5, padx=10)
+        # ========== UTILITIES ==========
+        ttk.Separator(panel, orient="horizontal").pack(fill="x", pady=5)
         
-        # Separator
-        ttk.Separator(self.frame, orient="horizontal").pack(fill="x", pady=5)
+        self._make_button(panel, "🔄 Clear All", self._on_clear_all, "#FFD700")
+        self._make_button(panel, "💾 Save Topology", self._on_save)
+        self._make_button(panel, "⚡ Quick Save", self._on_quick_save)
+        self._make_button(panel, "📂 Load Topology", self._on_load)
+    
+    def _build_routing_tab(self, panel: ttk.Frame) -> None:
+        """Path computation (NEW IN STAGE 2)"""
+        tk.Label(panel, text="Routing", 
+                font=self._font_heading).pack(anchor="w", padx=10, pady=(10, 5))
         
-        # ========== ROUTING OPERATIONS (NEW IN STAGE 2) ==========
-        ttk.Separator(self.frame, orient="horizontal").pack(fill="x", pady=5)
-
-        tk.Label(self.frame, text="Routing", 
-                font=("Arial", 10, "bold")).pack(anchor="w", padx=10, pady=(10, 5))
-
-        btn_compute = tk.Button(self.frame, text="🗺️ Compute Path (Dijkstra)",
-                                command=self._on_compute_path,
-                                bg="#FFD700", width=25, font=("Arial", 9, "bold"))
-        btn_compute.pack(pady=5, padx=10)
-
-        btn_clear_path = tk.Button(self.frame, text="❌ Clear Path",
-                                command=self._on_clear_path,
-                                bg="#FFB6C6", width=25)
-        btn_clear_path.pack(pady=5, padx=10)
-
-        # ========== PACKET OPERATIONS (NEW IN STAGE 3) ==========
-        ttk.Separator(self.frame, orient="horizontal").pack(fill="x", pady=5)
-
-        tk.Label(self.frame, text="Packet Sending", 
-                font=("Arial", 10, "bold")).pack(anchor="w", padx=10, pady=(10, 5))
-
-        tk.Label(self.frame, text="Packet Size (bytes):", font=("Arial", 9)).pack(anchor="w", padx=10)
+        self._make_button(panel, "🗺️ Compute Path (Dijkstra)", self._on_compute_path, "#FFD700", bold=True)
+        self._make_button(panel, "❌ Clear Path", self._on_clear_path, "#FFB6C6")
+    
+    def _build_packets_tab(self, panel: ttk.Frame) -> None:
+        """Packet sending and simulation control (NEW IN STAGE 3)"""
+        tk.Label(panel, text="Packet Sending", 
+                font=self._font_heading).pack(anchor="w", padx=10, pady=(10, 5))
+        
+        tk.Label(panel, text="Packet Size (bytes):", font=self._font_small).pack(anchor="w", padx=10)
         self.packet_size_var = tk.IntVar(value=1024)
-        tk.Spinbox(self.frame, from_=64, to=65535,
+        tk.Spinbox(panel, from_=64, to=65535,
                 textvariable=self.packet_size_var, width=25).pack(padx=10, pady=(0, 5))
-
-        btn_send_one = tk.Button(self.frame, text="📤 Send 1 Packet",
-                                command=self._on_send_packet,
-                                bg="#90EE90", width=25)
-        btn_send_one.pack(pady=5, padx=10)
-
-        btn_send_burst = tk.Button(self.frame, text="📤 Send 10 Packets",
-                                command=self._on_send_burst,
-                                bg="#90EE90", width=25)
-        btn_send_burst.pack(pady=5, padx=10)
-
-        btn_start_sim = tk.Button(self.frame, text="▶️ Start Simulation",
-                                command=self._on_start_simulation,
-                                bg="#87CEEB", width=25, font=("Arial", 9, "bold"))
-        btn_start_sim.pack(pady=5, padx=10)
-
-        btn_pause_sim = tk.Button(self.frame, text="⏸️ Pause Simulation",
-                                command=self._on_pause_simulation,
-                                bg="#FFD700", width=25)
-        btn_pause_sim.pack(pady=5, padx=10)
-
-        # ========== UTILITIES ==========
-        tk.Label(self.frame, text="Utilities", 
-                font=("Arial", 10, "bold")).pack(anchor="w", padx=10, pady=(10, 5))
         
-        btn_view_metrics = tk.Button(self.frame, text="📊 View Packet Metrics",
-                                    command=self._on_view_packet_metrics,
-                                    bg="#E6E6FA", width=25)
-        btn_view_metrics.pack(pady=5, padx=10)
-
-        # ========== DATA EXPORT (NEW IN STAGE 6) ==========
-        ttk.Separator(self.frame, orient="horizontal").pack(fill="x", pady=5)
-
-        tk.Label(self.frame, text="Data Export", 
-                font=("Arial", 10, "bold")).pack(anchor="w", padx=10, pady=(10, 5))
-
-        btn_export_all = tk.Button(self.frame, text="💾 Export All Data",
-                                command=self._on_export_all,
-                                bg="#DDA0DD", width=25, font=("Arial", 9, "bold"))
-        btn_export_all.pack(pady=5, padx=10)
-
-        btn_export_metrics = tk.Button(self.frame, text="📊 Export Metrics (CSV)",
-                                    command=self._on_export_metrics,
-                                    bg="#98FB98", width=25)
-        btn_export_metrics.pack(pady=5, padx=10)
-
-        btn_export_congestion = tk.Button(self.frame, text="🔴 Export Congestion (CSV)",
-                                        command=self._on_export_congestion,
-                                        bg="#FFB6C1", width=25)
-        btn_export_congestion.pack(pady=5, padx=10)
-
-        btn_export_report = tk.Button(self.frame, text="📄 Export Report (TXT)",
-                                    command=self._on_export_report,
-                                    bg="#F0E68C", width=25)
-        btn_export_report.pack(pady=5, padx=10)
-
+        self.btn_send_one = self._make_button(panel, "📤 Send 1 Packet", self._on_send_packet, "#90EE90")
+        self.btn_send_burst = self._make_button(panel, "📤 Send 10 Packets", self._on_send_burst, "#90EE90")
+        self._make_button(panel, "▶️ Start Simulation", self._on_start_simulation, "#87CEEB", bold=True)
+        self._make_button(panel, "⏸️ Pause Simulation", self._on_pause_simulation, "#FFD700")
+        self._update_send_buttons()
+        
         # ========== UTILITIES ==========
-        ttk.Separator(self.frame, orient="horizontal").pack(fill="x", pady=5)
-
-        btn_clear = tk.Button(self.frame, text="🔄 Clear All",
-                             command=self._on_clear_all,
-                             bg="#FFD700", width=25)
-        btn_clear.pack(pady=5, padx=10)
-        
-        btn_save = tk.Button(self.frame, text="💾 Save Topology",
-                            command=self._on_save, width=25)
-        btn_save.pack(pady=5, padx=10)
-        
-        btn_load = tk.Button(self.frame, text="📂 Load Topology",
-                            command=self._on_load, width=25)
-        btn_load.pack(pady=5, padx=10)
-    
-    def update_node_list(self) -> None:
-        """Update node dropdown lists"""
-        node_list = [f"{nid}: {self.network_manager.nodes[nid].label}" 
-                     for nid in sorted(self.network_manager.nodes.keys())]
-        self.source_combo["values"] = node_list
-        self.dest_combo["values"] = node_list
+        tk.Label(panel, text="Utilities", 
+                font=self._font_heading).pack(anchor="w", padx=10, pady=(10, 5))
+        
+        self._make_button(panel, "📊 View Packet Metrics", self._on_view_packet_metrics, "#E6E6FA")
+    
+    def _build_export_tab(self, panel: ttk.Frame) -> None:
+        """Data export (NEW IN STAGE 6)"""
+        tk.Label(panel, text="Data Export", 
+                font=self._font_heading).pack(anchor="w", padx=10, pady=(10, 5))
+        
+        self.btn_export_all = self._make_button(panel, "💾 Export All Data", self._on_export_all, "#DDA0DD", bold=True)
+        # Shown only while an export is running
+        self.export_progress = ttk.Progressbar(panel, mode="indeterminate", length=180)
+        self._make_button(panel, "📊 Export Metrics (CSV)", self._on_export_metrics, "#98FB98")
+        self._make_button(panel, "🔴 Export Congestion (CSV)", self._on_export_congestion, "#FFB6C1")
+        self._make_button(panel, "📄 Export Report (TXT)", self._on_export_report, "#F0E68C")
+    
+    @staticmethod
+    def _parse_node_id(selection: str) -> Optional[str]:
+        """Node ID from an "id: label" selection, or None if empty"""
+        return selection.split(":", 1)[0].strip() or None
+    
+    def _on_source_changed(self, *args) -> None:
+        self._src_id = self._parse_node_id(self.source_var.get())
+        self._update_send_buttons()
+    
+    def _on_dest_changed(self, *args) -> None:
+        self._dst_id = self._parse_node_id(self.dest_var.get())
+        self._update_send_buttons()
+    
+    def _update_send_buttons(self) -> None:
+        """Enable the send buttons only once both endpoints are chosen"""
+        if self.btn_send_one is None:
+            return  # Packets tab not built yet
+        state = "normal" if self._src_id and self._dst_id else "disabled"
+        self.btn_send_one.config(state=state)
+        self.btn_send_burst.config(state=state)
+    
+    def set_status(self, text: str) -> None:
+        """
+        Show a non-modal status message
+        
+        Repeated calls before Tk goes idle only redraw the label once.
+        
+        Args:
+            text: Message to display
+        """
+        if self._pending_status is None:
+            self.frame.after_idle(self._flush_status)
+        self._pending_status = text
+    
+    def _flush_status(self) -> None:
+        self.status_var.set(self._pending_status)
+        self._pending_status = None
+    
+    def show_details(self, rows: List[Tuple[str, str]]) -> None:
+        """
+        Show key/value rows in the details table
+        
+        Existing rows are updated in place; only the surplus is inserted
+        or deleted.
+        
+        Args:
+            rows: (field, value) pairs in display order
+        """
+        tree = self.details_tree
+        iids = tree.get_children()
+        for i, row in enumerate(rows):
+            if i < len(iids):
+                tree.item(iids[i], values=row)
+            else:
+                tree.insert("", tk.END, values=row)
+        if len(iids) > len(rows):
+            tree.delete(*iids[len(rows):])
+    
+    def log(self, message: str) -> None:
+        """
+        Append a line to the activity log
+        
+        Lines logged before Tk goes idle are inserted together in one call.
+        
+        Args:
+            message: Line to append
+        """
+        if not self._log_queue:
+            self.frame.after_idle(self._flush_log)
+        self._log_queue.append(message)
+    
+    def _flush_log(self) -> None:
+        """Insert the queued log lines, trimming the log to Config.LOG_MAX_LINES"""
+        batch = "\n".join(self._log_queue) + "\n"
+        self._log_queue.clear()
+        
+        text = self.log_text
+        text.config(state="normal")
+        text.insert(tk.END, batch)
+        # Keep the widget bounded ("end-1c" excludes Tk's trailing newline)
+        excess = int(text.index("end-1c").split(".")[0]) - 1 - Config.LOG_MAX_LINES
+        if excess > 0:
+            text.delete("1.0", f"{excess + 1}.0")
+        text.config(state="disabled")
+        text.see(tk.END)
+    
+    def update_node_list(self, added: Optional[str] = None,
+                         removed: Optional[str] = None) -> None:
+        """
+        Update node dropdown lists
+        
+        Args:
+            added: ID of a node that was just created
+            removed: ID of a node that was just deleted
+        
+        With neither given the lists are rebuilt from the network manager.
+        """
+        nodes = self.network_manager.nodes
+        ids = self._sorted_node_ids
+        display = self._node_display
+        
+        if added is None and removed is None:
+            ids[:] = sorted(nodes)
+            display[:] = [nodes[nid].display for nid in ids]
+        else:
+            if removed is not None:
+                i = bisect_left(ids, removed)
+                if i < len(ids) and ids[i] == removed:
+                    del ids[i]
+                    del display[i]
+            if added is not None and added in nodes:
+                i = bisect_left(ids, added)
+                if i == len(ids) or ids[i] != added:
+                    ids.insert(i, added)
+                    display.insert(i, nodes[added].display)
+        
+        values = tuple(display)
+        if values == self._node_values:
+            return
+        self._node_values = values
+        self.source_select.set_values(ids, display)
+        self.dest_select.set_values(ids, display)
     
     def _on_add_node(self) -> None:
         """Trigger add node mode"""
@@ -733,29 +1340,26 @@ class ControlPanel:
     
     def _on_delete_node(self) -> None:
         """Delete selected node"""
-        if not self.source_var.get():
+        node_id = self._src_id
+        if not node_id:
             messagebox.showwarning("Warning", "Please select a node to delete")
             return
         
-        node_id = self.source_var.get().split(":")[0]
         if self.network_manager.remove_node(node_id):
-            self.update_node_list()
+            self.update_node_list(removed=node_id)
             self.canvas_renderer.redraw_all()
             self.update_callback()
-            messagebox.showinfo("Success", f"Node {node_id} deleted")
+            self.set_status(f"✓ Node {node_id} deleted")
     
     def _on_add_link(self) -> None:
         """Add link between selected nodes"""
-        src = self.source_var.get()
-        dst = self.dest_var.get()
+        src_id = self._src_id
+        dst_id = self._dst_id
         
-        if not src or not dst:
+        if not src_id or not dst_id:
             messagebox.showwarning("Warning", "Please select both source and destination")
             return
         
-        src_id = src.split(":")[0]
-        dst_id = dst.split(":")[0]
-        
         try:
             self.network_manager.add_link(
                 src_id, dst_id,
@@ -765,55 +1369,84 @@ class ControlPanel:
             )
             self.canvas_renderer.redraw_all()
             self.update_callback()
-            messagebox.showinfo("Success", f"Link created: {src_id} ↔ {dst_id}")
+            self.set_status(f"✓ Link created: {src_id} ↔ {dst_id}")
         except ValueError as e:
             messagebox.showerror("Error", str(e))
     
     def _on_delete_link(self) -> None:
         """Delete selected link"""
-        src = self.source_var.get()
-        dst = self.dest_var.get()
+        src_id = self._src_id
+        dst_id = self._dst_id
         
-        if not src or not dst:
+        if not src_id or not dst_id:
             messagebox.showwarning("Warning", "Please select both endpoints")
             return
         
-        src_id = src.split(":")[0]
-        dst_id = dst.split(":")[0]
-        
         link = self.network_manager.get_link_by_nodes(src_id, dst_id)
         if link:
             self.network_manager.remove_link(link.id)
             self.canvas_renderer.redraw_all()
             self.update_callback()
-            messagebox.showinfo("Success", f"Link deleted")
+            self.set_status(f"✓ Link deleted: {src_id} ↔ {dst_id}")
         else:
             messagebox.showwarning("Warning", "Link not found")
     
     def _on_clear_all(self) -> None:
         """Clear entire network"""
+        if not self.network_manager.nodes:
+            return  # Nothing to clear; don't ask
+        
         # ← UPDATE THIS (add confirmation about exporting)
         if messagebox.askyesno("Confirm Clear", 
             "Clear entire network? (You can export data first)"):
+            # Packets, metrics and queues belong to the old network too
+            self.network_manager.packet_manager.clear_all()
             self.network_manager.clear_all()
             self.canvas_renderer.redraw_all()
             self.update_node_list()
             self.update_callback()
-            messagebox.showinfo("Success", "Network cleared")
+            self._request_stats_refresh()
+            self.set_status("✓ Network cleared")
     
-    def _on_save(self) -> None:
-        """Save topology to JSON"""
+    def _on_save(self, filename: Optional[str] = None) -> None:
+        """Save topology to JSON (timestamped file name unless one is given)"""
         if not self.network_manager.nodes:
             messagebox.showwarning("Warning", "Network is empty")
             return
         
-        filename = f"topology_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        try:
+        if filename is None:
+            filename = time.strftime("topology_%Y%m%d_%H%M%S.json")
+        # Snapshot on the UI thread; serialization and disk I/O happen off it
+        snapshot = self.network_manager.to_dict()
+        future = self._save_pool.submit(self._write_topology, snapshot, filename)
+        self.frame.after(100, self._poll_save_future, future, filename)
+    
+    def _on_quick_save(self) -> None:
+        """Save topology to a fixed file, overwriting the previous quick save"""
+        self._on_save(Config.QUICK_SAVE_FILE)
+    
+    @staticmethod
+    def _write_topology(snapshot: dict, filename: str) -> None:
+        """Write a topology snapshot to disk (runs on a worker thread, no Tk calls)"""
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(snapshot))
+        else:
             with open(filename, 'w') as f:
-                json.dump(self.network_manager.to_dict(), f, indent=2)
-            messagebox.showinfo("Success", f"Topology saved to {filename}")
+                json.dump(snapshot, f)
+    
+    def _poll_save_future(self, future: Future, filename: str) -> None:
+        """Check a running save without blocking; report the result once it's done"""
+        if not future.done():
+            self.frame.after(100, self._poll_save_future, future, filename)
+            return
+        
+        try:
+            future.result()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save: {e}")
+            return
+        messagebox.showinfo("Success", f"Topology saved to {filename}")
     
     def _on_load(self) -> None:
         """Load topology from JSON (simplified)"""
@@ -821,17 +1454,14 @@ class ControlPanel:
 
     def _on_compute_path(self) -> None:
         """Compute shortest path using Dijkstra"""
-        src = self.source_var.get()
-        dst = self.dest_var.get()
+        src_id = self._src_id
+        dst_id = self._dst_id
         
-        if not src or not dst:
+        if not src_id or not dst_id:
             messagebox.showwarning("Warning", 
                 "Please select both source and destination nodes")
             return
         
-        src_id = src.split(":")[0]
-        dst_id = dst.split(":")[0]
-        
         if src_id == dst_id:
             messagebox.showwarning("Warning", "Source and destination must differ")
             return
@@ -850,24 +1480,22 @@ class ControlPanel:
         path_nodes = self.network_manager.path_manager.get_current_path_nodes()
         
         # Highlight path on canvas
+        get_link = self.network_manager.get_link_by_nodes
+        links = [get_link(a, b) for a, b in zip(path_nodes, path_nodes[1:])]
         self.canvas_renderer.clear_highlights()
-        for i in range(len(path_nodes) - 1):
-            link = self.network_manager.get_link_by_nodes(
-                path_nodes[i], path_nodes[i + 1]
-            )
-            if link:
-                self.canvas_renderer.highlight_link(link)
+        self.canvas_renderer.highlight_links([link for link in links if link])
         
         # Update metrics display
-        if hasattr(self.network_manager, 'main_window'):
-            self.network_manager.main_window.update_metrics_display(path_info)
-        
-        # Show success message
-        messagebox.showinfo("Path Found", 
-            f"Path: {' → '.join(path_nodes)}\n"
-            f"Hops: {path_info.hop_count}\n"
-            f"Total Latency: {path_info.total_latency:.2f} ms\n"
-            f"Throughput: {path_info.throughput:.1f} Mbps")
+        if self._main_window is not None:
+            self._main_window.update_metrics_display(path_info)
+        
+        self.show_details([
+            ("Path", path_info.path_str),
+            ("Hops", str(path_info.hop_count)),
+            ("Total Latency", f"{path_info.total_latency:.2f} ms"),
+            ("Throughput", f"{path_info.throughput:.1f} Mbps"),
+        ])
+        self.set_status(f"✓ Path found: {src_id} → {dst_id}")
 
     def _on_clear_path(self) -> None:
         """Clear current path"""
@@ -877,16 +1505,13 @@ class ControlPanel:
 
     def _on_send_packet(self) -> None:
         """Send a single packet"""
-        src = self.source_var.get()
-        dst = self.dest_var.get()
+        src_id = self._src_id
+        dst_id = self._dst_id
         
-        if not src or not dst:
+        if not src_id or not dst_id:
             messagebox.showwarning("Warning", "Select source and destination")
             return
         
-        src_id = src.split(":")[0]
-        dst_id = dst.split(":")[0]
-        
         packet = self.network_manager.packet_manager.create_packet(
             src_id, dst_id, 
             self.packet_size_var.get()
@@ -894,45 +1519,46 @@ class ControlPanel:
         
         if packet:
             self.network_manager.packet_manager.start_packet_animation(packet)
-            messagebox.showinfo("Success", f"Packet {packet.id} sent!")
+            self._request_stats_refresh()
+            self.log(f"✓ Packet {format_packet_id(packet.id)} sent: {src_id} → {dst_id}")
         else:
             messagebox.showerror("Error", "Failed to create packet")
 
     def _on_send_burst(self) -> None:
         """Send 10 packets in rapid succession"""
-        src = self.source_var.get()
-        dst = self.dest_var.get()
+        src_id = self._src_id
+        dst_id = self._dst_id
         
-        if not src or not dst:
+        if not src_id or not dst_id:
             messagebox.showwarning("Warning", "Select source and destination")
             return
         
-        src_id = src.split(":")[0]
-        dst_id = dst.split(":")[0]
-        
-        count = 0
-        for i in range(10):
-            packet = self.network_manager.packet_manager.create_packet(
-                src_id, dst_id,
-                self.packet_size_var.get()
-            )
-            if packet:
-                self.network_manager.packet_manager.start_packet_animation(packet)
-                count += 1
+        packet_manager = self.network_manager.packet_manager
+        packets = packet_manager.create_packets_batch(
+            src_id, dst_id,
+            [self.packet_size_var.get()] * 10
+        )
+        count = packet_manager.start_packet_animations(packets)
+        self._request_stats_refresh()
         
-        messagebox.showinfo("Success", f"{count} packets sent!")
+        self.log(f"✓ {count} of {len(packets)} packets sent: {src_id} → {dst_id}")
+
+    def _request_stats_refresh(self) -> None:
+        """Show new send/drop counts even if no animation frame follows"""
+        if self._main_window is not None:
+            self._main_window.request_stats_refresh()
 
     def _on_start_simulation(self) -> None:
         """Start/resume animation"""
-        if hasattr(self.network_manager, 'packet_manager'):
-            self.network_manager.animator_worker.resume()
-            messagebox.showinfo("Info", "Simulation started")
+        if self._main_window is not None:
+            self._main_window.animator_worker.resume()
+            self.set_status("▶ Simulation started")
 
     def _on_pause_simulation(self) -> None:
         """Pause animation"""
-        if hasattr(self.network_manager, 'packet_manager'):
-            self.network_manager.animator_worker.pause()
-            messagebox.showinfo("Info", "Simulation paused")
+        if self._main_window is not None:
+            self._main_window.animator_worker.pause()
+            self.set_status("⏸ Simulation paused")
 
     def _on_view_packet_metrics(self) -> None:
         """View metrics for latest delivered packet"""
@@ -942,32 +1568,68 @@ class ControlPanel:
         
         latest = self.network_manager.packet_manager.delivered_packets[-1]
         
-        if hasattr(self.network_manager, 'main_window'):
-            metrics = self.network_manager.main_window.latency_engine.get_packet_metrics(
-                latest.id
-            )
+        main_window = self._main_window
+        if main_window is not None:
+            metrics = main_window.latency_engine.get_packet_metrics(latest.id)
             if metrics:
-                self.network_manager.main_window.metrics_display.update_packet_detail(latest.id)
-                messagebox.showinfo("Packet Metrics",
-                    f"Packet: {latest.id}\n"
-                    f"Path: {' → '.join(metrics.path_nodes)}\n"
-                    f"Actual Latency: {metrics.actual_latency:.2f}ms\n"
-                    f"Theoretical Latency: {metrics.total_latency:.2f}ms\n"
-                    f"Throughput: {metrics.throughput:.2f}Mbps\n"
-                    f"Bottleneck BW: {metrics.bottleneck_bandwidth:.1f}Mbps")
+                main_window.metrics_display.update_packet_detail(latest.id)
+                self.show_details([
+                    ("Packet", format_packet_id(latest.id)),
+                    ("Path", metrics.path_str),
+                    ("Actual Latency", f"{metrics.actual_latency:.2f} ms"),
+                    ("Theoretical Latency", f"{metrics.total_latency:.2f} ms"),
+                    ("Throughput", f"{metrics.throughput:.2f} Mbps"),
+                    ("Bottleneck BW", f"{metrics.bottleneck_bandwidth:.1f} Mbps"),
+                ])
                 
     def _on_export_all(self) -> None:
-        """Export all data"""
-        results = self.network_manager.export_engine.export_all()
+        """Export all data (in the background)"""
+        if self._export_future is not None:
+            return
+        
+        self.btn_export_all.config(state="disabled")
+        self.export_progress.pack(after=self.btn_export_all, padx=10, pady=(0, 5))
+        self.export_progress.start()
+        self.set_status("Exporting...")
+        
+        # Snapshot on the UI thread; the simulation keeps changing while
+        # the files are written
+        export_engine = self.network_manager.export_engine
+        snapshot = export_engine.take_snapshot()
+        self._export_future = self._export_pool.submit(
+            export_engine.export_all, None, snapshot
+        )
+        self.frame.after(100, self._poll_export_future)
+    
+    def shutdown(self) -> None:
+        """Stop accepting background work (an export or save in progress still finishes)"""
+        self._export_pool.shutdown(wait=False, cancel_futures=True)
+        self._save_pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _poll_export_future(self) -> None:
+        """Check the running export without blocking; finish up once it's done"""
+        future = self._export_future
+        if not future.done():
+            self.frame.after(100, self._poll_export_future)
+            return
+        
+        self._export_future = None
+        self.export_progress.stop()
+        self.export_progress.pack_forget()
+        self.btn_export_all.config(state="normal")
+        
+        try:
+            results = future.result()
+        except Exception as e:
+            self.set_status(f"✗ Export failed: {e}")
+            return
         
         success_count = sum(1 for v in results.values() if v)
-        messagebox.showinfo("Export Complete",
-            f"Files exported:\n"
-            f"✓ Metrics: {results['metrics']}\n"
-            f"✓ Congestion: {results['congestion']}\n"
-            f"✓ Summary: {results['summary']}\n"
-            f"✓ Topology: {results['topology']}\n\n"
-            f"Check your CloudNetworkSimulator folder!")
+        failed = [name for name, ok in results.items() if not ok]
+        status = f"✓ Exported {success_count}/{len(results)} files"
+        if failed:
+            status += f" (failed: {', '.join(failed)})"
+        self.set_status(status)
 
     def _on_export_metrics(self) -> None:
         """Export metrics CSV"""
@@ -1016,13 +1678,18 @@ class MainWindow(tk.Tk):
         self.path_manager = PathManager(self.network_manager)
         self.network_manager.main_window = self
         
+        self._last_stats_update = 0.0  # time.monotonic() of the last stats refresh
+        self._stats_refresh_id = None  # Pending trailing stats refresh (after() id)
+        self._stats_text = ""          # Text currently in stats_detailed_label
+        
         # ← ADD THESE 3 BLOCKS (Stage 3)
-        # Initialize animation worker (background thread for smooth animation)
+        # Initialize animation worker (frames run from the Tk event loop)
         self.animator_worker = AnimatorWorker(
+            self,
             update_callback=self._on_animation_update,
             frame_rate=30  # 30 FPS
         )
-        self.animator_worker.start()  # Start background thread
+        self.animator_worker.start()  # Schedule the first frame
         
         # Initialize latency/throughput engine (NEW IN STAGE 4)
         self.latency_engine = LatencyThroughputEngine(
@@ -1061,11 +1728,15 @@ class MainWindow(tk.Tk):
         )
         self.network_manager.packet_manager = self.packet_manager
         
+        # Per-link metrics and queues are created as links are added
+        self.network_manager.link_added_callbacks.append(self._on_link_added)
+        self.network_manager.link_removed_callbacks.append(self._on_link_removed)
+        
         self._create_layout()
         self._bind_events()
         
         # Display status
-        self.status_label.config(text="✓ Ready. Click 'Add Node' button to start.")
+        self.control_panel.set_status("✓ Ready. Click 'Add Node' button to start.")
         
         # ← ADD THIS LINE (cleanup on close)
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -1100,10 +1771,18 @@ class MainWindow(tk.Tk):
         scrollbar = ttk.Scrollbar(left_frame, orient="vertical", command=canvas_scroll.yview)
         scrollable_frame = tk.Frame(canvas_scroll, bg="lightgray")
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas_scroll.configure(scrollregion=canvas_scroll.bbox("all"))
-        )
+        # The frame is the only item, placed at (0, 0), so its size is the
+        # scroll region; only reconfigure when that size actually changes
+        scroll_size = None
+        
+        def _update_scrollregion(event):
+            nonlocal scroll_size
+            size = (event.width, event.height)
+            if size != scroll_size:
+                scroll_size = size
+                canvas_scroll.configure(scrollregion=(0, 0) + size)
+        
+        scrollable_frame.bind("<Configure>", _update_scrollregion)
         
         canvas_scroll.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas_scroll.configure(yscrollcommand=scrollbar.set)
@@ -1194,7 +1873,8 @@ class MainWindow(tk.Tk):
         # Status bar
         status_frame = tk.Frame(self, relief=tk.SUNKEN, bd=1)
         status_frame.pack(side=tk.BOTTOM, fill=tk.X)
-        self.status_label = tk.Label(status_frame, text="Ready", font=("Arial", 9))
+        self.status_label = tk.Label(status_frame, font=("Arial", 9),
+                                     textvariable=self.control_panel.status_var)
         self.status_label.pack(anchor="w", padx=5, pady=2)
     
     def _bind_events(self) -> None:
@@ -1215,8 +1895,8 @@ class MainWindow(tk.Tk):
         # Check if clicked on node (for dragging)
         node = self.network_manager.get_node_by_pos(event.x, event.y)
         if node:
-            self.canvas_renderer.dragged_node = node
-            self.status_label.config(text=f"Dragging {node.label}...")
+            self.canvas_renderer.begin_drag(node)
+            self.control_panel.set_status(f"Dragging {node.label}...")
     
     def _on_canvas_drag(self, event) -> None:
         """Handle canvas drag"""
@@ -1227,14 +1907,17 @@ class MainWindow(tk.Tk):
             x = max(node.radius, min(event.x, Config.CANVAS_WIDTH - node.radius))
             y = max(node.radius, min(event.y, Config.CANVAS_HEIGHT - node.radius))
             
+            old_pos = (node.x, node.y)
             self.canvas_renderer.update_node_position(node.id, x, y)
+            # Packets in flight on the node's links follow it
+            self.animator_worker.move_endpoint(old_pos, (node.x, node.y))
     
     def _on_canvas_release(self, event) -> None:
         """Handle canvas release"""
         if self.canvas_renderer.dragged_node:
             node = self.canvas_renderer.dragged_node
-            self.status_label.config(text=f"✓ {node.label} moved")
-            self.canvas_renderer.dragged_node = None
+            self.control_panel.set_status(f"✓ {node.label} moved")
+            self.canvas_renderer.end_drag()
             self._on_update()
     
     def _create_node_at(self, x: float, y: float) -> None:
@@ -1243,57 +1926,54 @@ class MainWindow(tk.Tk):
             label = self.control_panel.node_label_var.get() or None
             node = self.network_manager.add_node(x, y, label)
             self.canvas_renderer.draw_node(node)
-            self.control_panel.update_node_list()
+            self.control_panel.update_node_list(added=node.id)
             self._on_update()
-            self.status_label.config(text=f"✓ Node {node.id} created")
+            self.control_panel.set_status(f"✓ Node {node.id} created")
         except ValueError as e:
             messagebox.showwarning("Warning", str(e))
-            self.status_label.config(text=f"✗ {str(e)}")
+            self.control_panel.set_status(f"✗ {str(e)}")
     
     def _on_delete_key(self, event) -> None:
         """Delete selected node (Delete key)"""
-        if self.control_panel.source_var.get():
+        # Delete inside a text field edits the text, not the network
+        if isinstance(self.focus_get(), (tk.Entry, ttk.Entry, tk.Text, tk.Spinbox)):
+            return
+        if self.control_panel._src_id:
             self.control_panel._on_delete_node()
     
     def _on_update(self) -> None:
         """Called when topology changes"""
         self.network_manager.update_networkx_graph()
         self._update_statistics()
-
-        # Track link metrics
-        if hasattr(self, 'latency_engine'):
-            for link in self.network_manager.links.values():
-                if link.id not in self.latency_engine.link_metrics:
-                    self.latency_engine.create_link_metrics(
-                        link.id, link.node_a.id, link.node_b.id,
-                        link.latency, link.bandwidth
-                    )
-
-        # Create queues for links
-        if hasattr(self, 'congestion_controller'):
-            for link in self.network_manager.links.values():
-                if link.id not in self.congestion_controller.link_queues:
-                    self.congestion_controller.create_link_queue(
-                        link.id, link.queue_size,
-                        drop_policy=DropPolicy.TAIL_DROP
-                    )
+    
+    def _on_link_added(self, link: Link) -> None:
+        """Track metrics and create a queue for a newly added link"""
+        if link.id not in self.latency_engine.link_metrics:
+            self.latency_engine.create_link_metrics(
+                link.id, link.node_a.id, link.node_b.id,
+                link.latency, link.bandwidth
+            )
+        
+        if link.idx < 0:
+            self.congestion_controller.create_link_queue(
+                link.id, link.queue_size,
+                drop_policy=DropPolicy.TAIL_DROP
+            )
+    
+    def _on_link_removed(self, link: Link) -> None:
+        """Drop a removed link's metrics and queue (its ID may be reused later)"""
+        self.latency_engine.remove_link_metrics(link.id)
+        self.congestion_controller.remove_link_queue(link.id)
+        link.idx = -1
     
     def _update_statistics(self) -> None:
         """Update network statistics display"""
         num_nodes = len(self.network_manager.nodes)
         num_links = len(self.network_manager.links)
         
-        # Calculate total network properties
-        total_latency = 0
-        min_bandwidth = float('inf')
-        
-        if self.network_manager.links:
-            for link in self.network_manager.links.values():
-                total_latency += link.latency
-                min_bandwidth = min(min_bandwidth, link.bandwidth)
-        
-        if min_bandwidth == float('inf'):
-            min_bandwidth = 0
+        # Network totals are maintained incrementally by NetworkManager
+        total_latency = self.network_manager.total_latency
+        min_bandwidth = self.network_manager.get_min_bandwidth()
         
         stats_text = (
             f"Nodes: {num_nodes}  |  Links: {num_links}  |  "
@@ -1305,12 +1985,19 @@ class MainWindow(tk.Tk):
     
     def _on_new(self) -> None:
         """Create new network"""
-        if messagebox.askyesno("New Network", "Clear current network?"):
-            self.network_manager.clear_all()
-            self.canvas_renderer.redraw_all()
-            self.control_panel.update_node_list()
-            self._on_update()
-            self.status_label.config(text="✓ New network created")
+        # Only confirm when there is something to lose
+        if self.network_manager.nodes and \
+           not messagebox.askyesno("New Network", "Clear current network?"):
+            return
+        
+        # Packets, metrics and queues belong to the old network too
+        self.packet_manager.clear_all()
+        self.network_manager.clear_all()
+        self.canvas_renderer.redraw_all()
+        self.control_panel.update_node_list()
+        self._on_update()
+        self.request_stats_refresh()
+        self.control_panel.set_status("✓ New network created")
     
     def _on_about(self) -> None:
         """Show about dialog"""
@@ -1338,56 +2025,57 @@ class MainWindow(tk.Tk):
         if self.metrics_display:
             self.metrics_display.update_path_display(path_info)
 
-    def _on_animation_update(self, active_packets: Dict, 
-                            animators: Dict, sim_time: float) -> None:
-        """Called from animator thread each frame"""
-        packets_to_advance = []
-        
-        for pkt_id, animator in animators.items():
-            # Check if animator finished this link
-            if animator.update(sim_time):
-                packets_to_advance.append(pkt_id)
-        
-        # Advance packets to next link (using main thread)
+    def _on_animation_update(self, packets_to_advance: List[int],
+                             sim_time: float) -> None:
+        """Called by the animator each frame with packets that finished a link"""
+        # Advance packets to next link
         if packets_to_advance:
-            self.after(0, lambda: self._advance_packets(packets_to_advance))
+            self._advance_packets(packets_to_advance)
         
-        # Redraw canvas from main thread
-        self.after(0, self._redraw_canvas_animation)
+        self._redraw_canvas_animation()
 
-    def _advance_packets(self, packet_ids: List[str]) -> None:
+    def _advance_packets(self, packet_ids: List[int]) -> None:
         """Advance finished packets to next link"""
-        for pkt_id in packet_ids:
-            if pkt_id in self.packet_manager.active_packets:
-                packet = self.packet_manager.active_packets[pkt_id]
-                self.packet_manager.advance_packet(packet)
+        packet_manager = self.packet_manager
+        active_packets = packet_manager.active_packets
+        packet_manager.advance_batch(
+            [active_packets[pkt_id] for pkt_id in packet_ids if pkt_id in active_packets]
+        )
 
     def _redraw_canvas_animation(self) -> None:
         """Redraw canvas with animated packet positions"""
-        # Redraw all links to show current congestion colors
-        self.canvas_renderer.redraw_all()
-        # Clear packet drawings (but keep topology)
-        self.canvas.delete("packet")
-        
-        # Draw each active packet at its current position
-        for pkt_id, animator in self.animator_worker.animators.items():
-            pos = animator.get_current_position(self.animator_worker.sim_time)
-            if pos:
-                x, y = pos
-                self.canvas.create_oval(
-                    x - 5, y - 5, x + 5, y + 5,
-                    fill="red", outline="darkred", width=2,
-                    tags="packet"
-                )
-                # Draw packet ID
-                self.canvas.create_text(
-                    x, y - 10,
-                    text=pkt_id,
-                    font=("Arial", 7),
-                    fill="red",
-                    tags="packet"
-                )
+        # Sync links (current congestion colors) and nodes
+        self.canvas_renderer.refresh_all()
+        
+        # Move each active packet to its current position, skipping any
+        # the window is too small to show (timing and metrics are unaffected)
+        self.canvas_renderer.draw_packets(self.animator_worker.get_positions())
+
+        # Text panels don't need frame rate; refresh them a few times a second
+        self.request_stats_refresh()
+
+    def request_stats_refresh(self) -> None:
+        """
+        Refresh the statistics and congestion panels, at most a few times a second
+        
+        A request inside the throttle interval schedules one trailing
+        refresh instead of being skipped, so the final numbers still show
+        once the animator goes idle (or never ran, e.g. a packet dropped
+        at its first link).
+        """
+        if self._stats_refresh_id is not None:
+            return  # Trailing refresh already pending
+        
+        wait = self._last_stats_update + Config.STATS_REFRESH_INTERVAL - time.monotonic()
+        if wait <= 0:
+            self._refresh_stats()
+        else:
+            self._stats_refresh_id = self.after(int(wait * 1000) + 1, self._refresh_stats)
 
+    def _refresh_stats(self) -> None:
+        """Update both text panels now"""
+        self._stats_refresh_id = None
+        self._last_stats_update = time.monotonic()
         self.update_statistics_display()
         # Update congestion display
         self.update_congestion_display()
@@ -1396,6 +2084,11 @@ class MainWindow(tk.Tk):
         """Clean up when window closes"""
         if hasattr(self, 'animator_worker'):
             self.animator_worker.stop()
+        if self._stats_refresh_id is not None:
+            self.after_cancel(self._stats_refresh_id)
+            self._stats_refresh_id = None
+        if hasattr(self, 'control_panel'):
+            self.control_panel.shutdown()
         self.destroy()
 
     def update_statistics_display(self) -> None:
@@ -1413,7 +2106,9 @@ class MainWindow(tk.Tk):
             f"Avg Latency: {stats['avg_latency_ms']:.2f}ms | "
             f"Avg Throughput: {stats['avg_throughput_mbps']:.2f}Mbps"
         )
-        self.stats_detailed_label.config(text=stats_text)
+        if stats_text != self._stats_text:
+            self._stats_text = stats_text
+            self.stats_detailed_label.config(text=stats_text)
 
     def update_congestion_display(self) -> None:
         """Update congestion metrics display"""
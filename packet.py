@@ -1,11 +1,15 @@
 import time
-import threading
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Dict, Callable
+from typing import List, Optional, Tuple, Dict, Callable, Deque
 from collections import deque
+from heapq import heappush, heappop
+from itertools import count
 import math
 
+# Finished packets kept per outcome by the packet managers (totals are counted)
+PACKET_HISTORY_SIZE = 10_000
+
 # ============================================================================
 # 1. PACKET CLASS
 # ============================================================================
@@ -18,13 +22,53 @@ class PacketState(Enum):
     DROPPED = "dropped"         # Lost due to congestion
 
 
-@dataclass
+def format_packet_id(packet_id: int) -> str:
+    """Format an integer packet ID for display (e.g., 1 -> "PKT0001")"""
+    return f"PKT{packet_id:04d}"
+
+
+def scheduled_hop(packet: 'Packet', index: int, network_manager) -> Optional[tuple]:
+    """
+    Look up hop `index` of a packet's schedule, checked against the live topology
+    
+    The schedule is resolved when the packet is created. It is used only
+    while its link and both endpoint nodes are still the live objects
+    (IDs are reused after NetworkManager.clear_all(), so an ID match is
+    not enough); otherwise the hop is resolved again by node pair, as it
+    was before schedules existed.
+    
+    Args:
+        packet: Packet whose hop to look up
+        index: Hop index (0 = first link)
+        network_manager: Reference to NetworkManager
+    
+    Returns:
+        (link, node_a, node_b), or None if no link joins the hop's nodes
+    """
+    nodes = network_manager.nodes
+    hop = packet.hop_schedule[index]
+    if hop is not None:
+        link, node_a, node_b = hop
+        if (network_manager.links.get(link.id) is link
+                and nodes.get(node_a.id) is node_a
+                and nodes.get(node_b.id) is node_b):
+            return hop
+    
+    node_a_id = packet.path[index]
+    node_b_id = packet.path[index + 1]
+    link = network_manager.get_link_by_nodes(node_a_id, node_b_id)
+    if link is None:
+        return None
+    return (link, nodes[node_a_id], nodes[node_b_id])
+
+
+@dataclass(slots=True)
 class Packet:
     """
     Represents a network packet traveling through the network
     """
     
-    id: str                          # Unique identifier (e.g., "PKT001")
+    id: int                          # Unique identifier (see format_packet_id)
     source_node_id: str              # Starting node ID
     destination_node_id: str         # Target node ID
     creation_time: float = 0.0       # When packet was created (ms)
@@ -43,6 +87,12 @@ class Packet:
     link_start_time: float = 0.0    # When entered current link
     link_latency: float = 0.0       # Latency of current link
     
+    # Per-hop (link, node_a, node_b) from PathInfo.hop_schedule (shared)
+    hop_schedule: List[Optional[tuple]] = field(default_factory=list, repr=False, compare=False)
+    
+    # Position in EnhancedPacketManager.active_slots (-1 = not active)
+    slot_index: int = field(default=-1, repr=False, compare=False)
+    
     def __post_init__(self):
         """Initialize packet after creation"""
         if not self.path:
@@ -50,6 +100,36 @@ class Packet:
         else:
             self.current_node_id = self.path[0] if self.path else self.source_node_id
     
+    def reset(self, id: int, source_node_id: str, destination_node_id: str,
+              creation_time: float, size: int, path: List[str]) -> None:
+        """
+        Reinitialize a recycled packet in place (see EnhancedPacketManager pool)
+        
+        Args:
+            id: New packet ID
+            source_node_id: Starting node ID
+            destination_node_id: Target node ID
+            creation_time: Creation (and initial sent) time (ms)
+            size: Bytes
+            path: Full path of node IDs
+        """
+        self.id = id
+        self.source_node_id = source_node_id
+        self.destination_node_id = destination_node_id
+        self.creation_time = creation_time
+        self.sent_time = creation_time
+        self.delivery_time = 0.0
+        self.size = size
+        self.state = PacketState.QUEUED
+        self.path = path
+        self.path_index = 0
+        self.current_node_id = source_node_id
+        self.current_link_index = 0
+        self.link_start_time = 0.0
+        self.link_latency = 0.0
+        self.hop_schedule = []
+        self.slot_index = -1
+    
     def get_next_node(self) -> Optional[str]:
         """
         Look ahead to next node in path
@@ -139,7 +219,7 @@ class Packet:
 # 2. PACKET ANIMATOR
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PacketAnimator:
     """
     Manages animation of a single packet on a link
@@ -152,6 +232,44 @@ class PacketAnimator:
     start_time: float                # When animation started (ms)
     speed_multiplier: float = 1.0    # Animation speed (1.0 = real-time)
     
+    # Derived once so per-frame checks multiply instead of divide
+    end_time: float = field(init=False, repr=False)    # start_time + link traversal span
+    inv_span: float = field(init=False, repr=False)    # 1 / span (0.0 for zero latency)
+    origin_x: float = field(init=False, repr=False)    # Position at progress 0
+    origin_y: float = field(init=False, repr=False)
+    delta_x: float = field(init=False, repr=False)     # Offset to position at progress 1
+    delta_y: float = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        """Precompute traversal end time, inverse span and interpolation terms"""
+        span = self.link_latency * self.speed_multiplier
+        self.end_time = self.start_time + span
+        self.inv_span = 1.0 / span if span else 0.0
+        self.set_endpoints(self.node_a_pos, self.node_b_pos)
+    
+    def set_endpoints(self, node_a_pos: Tuple[float, float],
+                      node_b_pos: Tuple[float, float]) -> None:
+        """
+        Replace the link endpoints (e.g., after a node was dragged),
+        keeping the timing and refreshing the interpolation terms
+        
+        Args:
+            node_a_pos: Start position
+            node_b_pos: End position
+        """
+        self.node_a_pos = node_a_pos
+        self.node_b_pos = node_b_pos
+        
+        x1, y1 = node_a_pos
+        x2, y2 = node_b_pos
+        if self.link_latency == 0:
+            # Already at the far end; with inv_span 0 progress stays 0
+            self.origin_x, self.origin_y = x2, y2
+            self.delta_x = self.delta_y = 0.0
+        else:
+            self.origin_x, self.origin_y = x1, y1
+            self.delta_x, self.delta_y = x2 - x1, y2 - y1
+    
     def update(self, current_time: float) -> bool:
         """
         Update packet position
@@ -162,13 +280,7 @@ class PacketAnimator:
         Returns:
             True if packet finished link, False otherwise
         """
-        elapsed = (current_time - self.start_time) / self.speed_multiplier
-        duration = self.link_latency
-        
-        if elapsed >= duration:
-            return True  # Link traversal complete
-        
-        return False
+        return current_time >= self.end_time  # Link traversal complete
     
     def get_current_position(self, current_time: float) -> Tuple[float, float]:
         """
@@ -180,15 +292,12 @@ class PacketAnimator:
         Returns:
             (x, y) position
         """
-        progress = self.get_progress(current_time)
+        progress = (current_time - self.start_time) * self.inv_span
         progress = min(1.0, max(0.0, progress))  # Clamp 0-1
         
-        x1, y1 = self.node_a_pos
-        x2, y2 = self.node_b_pos
-        
-        # Linear interpolation
-        x = x1 + (x2 - x1) * progress
-        y = y1 + (y2 - y1) * progress
+        # Linear interpolation from the precomputed origin and delta
+        x = self.origin_x + self.delta_x * progress
+        y = self.origin_y + self.delta_y * progress
         
         return (x, y)
     
@@ -202,84 +311,171 @@ class PacketAnimator:
         Returns:
             Progress from 0.0 (start) to 1.0 (end)
         """
-        elapsed = (current_time - self.start_time) / self.speed_multiplier
-        duration = self.link_latency
-        
-        if duration == 0:
+        if self.link_latency == 0:
             return 1.0
         
-        return elapsed / duration
+        return (current_time - self.start_time) * self.inv_span
 
 
 # ============================================================================
-# 3. ANIMATION WORKER (Threading)
+# 3. ANIMATION WORKER (Tk event loop)
 # ============================================================================
 
-class AnimatorWorker(threading.Thread):
+class AnimatorWorker:
     """
-    Background thread for smooth packet animation
-    Prevents UI freezing during animation
+    Drives packet animation from the Tk event loop
+    
+    Each frame is an after() callback on the main thread, so packet
+    state, the update callback and the canvas are only ever touched from
+    one thread: no locking and no cross-thread scheduling is needed.
+    
+    The frame rate adapts to the load: while no packet is animating the
+    callback is skipped and frames are spaced IDLE_WAIT seconds apart
+    (just enough to keep sim_time advancing; add_packet() brings the
+    next frame forward again), and with more than BUSY_PACKETS packets
+    in flight frames run at BUSY_FRAME_RATE.
     """
     
-    def __init__(self, update_callback: Callable, frame_rate: int = 30):
+    IDLE_WAIT = 0.1         # s between idle frames (keeps sim_time advancing)
+    BUSY_PACKETS = 20       # Packets in flight above which BUSY_FRAME_RATE applies
+    BUSY_FRAME_RATE = 60    # FPS under load
+    
+    def __init__(self, root, update_callback: Callable, frame_rate: int = 30):
         """
-        Initialize animator worker thread
+        Initialize animator worker
         
         Args:
-            update_callback: Function called each frame with (packets, animators)
+            root: Tk widget whose after() schedules the frames
+            update_callback: Function called each frame with
+                (finished_packet_ids, sim_time)
             frame_rate: Target FPS (default 30)
         """
-        super().__init__(daemon=True)
-        self.active_packets: Dict[str, Packet] = {}
-        self.animators: Dict[str, PacketAnimator] = {}
+        self.root = root
+        self.active_packets: Dict[int, Packet] = {}
+        self.animators: Dict[int, PacketAnimator] = {}
         self.simulation_running = False
         self.paused = False
         self.update_callback = update_callback
         self.frame_rate = frame_rate
         self.frame_time = 1000.0 / frame_rate  # ms per frame
-        self._lock = threading.Lock()
+        self.busy_frame_time = 1000.0 / max(frame_rate, self.BUSY_FRAME_RATE)
         self.speed_multiplier = 1.0
         self.start_time = None
         self.sim_time = 0.0  # Simulation time (ms)
+        
+        self._tick_id = None          # Pending after() for the next frame
+        self._next_deadline = 0.0     # time.monotonic() of the next frame
+        self._was_busy = False        # Animators existed last frame
+        
+        # Min-heap of (end_time, seq, packet_id, animator); entries whose
+        # animator was replaced or removed are skipped when popped
+        self._expiry: List[tuple] = []
+        self._expiry_seq = count()
     
-    def run(self) -> None:
-        """Main thread loop"""
+    def start(self) -> None:
+        """Start the frame loop"""
         self.simulation_running = True
-        self.start_time = time.time() * 1000  # ms
-        
-        while self.simulation_running:
-            if not self.paused:
-                # Calculate current simulation time
-                self.sim_time = (time.time() * 1000 - self.start_time) * self.speed_multiplier
-                
-                # Update all active animations
-                self._update_all_packets()
-                
-                # Trigger UI update
-                if self.update_callback:
-                    with self._lock:
-                        self.update_callback(
-                            dict(self.active_packets),
-                            dict(self.animators),
-                            self.sim_time
-                        )
-            
-            # Control frame rate
-            time.sleep(self.frame_time / 1000.0)
+        self.start_time = time.monotonic() * 1000  # ms
+        self._next_deadline = time.monotonic()
+        self._schedule_tick(0.0)
+    
+    def tick(self) -> None:
+        """Run one frame and schedule the next"""
+        self._tick_id = None
+        if not self.simulation_running or self.paused:
+            return  # resume() restarts the loop
+        
+        # Advance simulation time and retire finished animations
+        now = self._clock()
+        finished = self._update_all_packets(now)
+        
+        # Trigger UI update; one extra frame after going idle lets the
+        # UI clear the last packet
+        if self.update_callback and (self.animators or finished or self._was_busy):
+            self.update_callback(finished, now)
+        
+        # The callback may have put packets on their next link
+        busy = self._was_busy = bool(self.animators)
+        if not busy:
+            self._next_deadline = time.monotonic()
+            self._schedule_tick(self.IDLE_WAIT)
+            return
+        
+        # Control frame rate: wait until the next frame boundary. After an
+        # overrun, restart the schedule rather than bursting to catch up
+        if len(self.animators) > self.BUSY_PACKETS:
+            frame_time = self.busy_frame_time
+        else:
+            frame_time = self.frame_time
+        self._next_deadline += frame_time / 1000.0
+        delay = self._next_deadline - time.monotonic()
+        if delay < 0:
+            self._next_deadline = time.monotonic()
+            delay = 0.0
+        self._schedule_tick(delay)
+    
+    def _schedule_tick(self, delay: float) -> None:
+        """Schedule the next frame delay seconds from now"""
+        self._tick_id = self.root.after(int(delay * 1000), self.tick)
+    
+    def _cancel_tick(self) -> None:
+        """Cancel the pending frame, if any"""
+        if self._tick_id is not None:
+            self.root.after_cancel(self._tick_id)
+            self._tick_id = None
+    
+    def _clock(self) -> float:
+        """Current simulation time (ms) derived from the wall clock"""
+        return (time.monotonic() * 1000 - self.start_time) * self.speed_multiplier
+    
+    def _update_all_packets(self, now: float) -> List[int]:
+        """
+        Advance simulation time and retire animations whose link
+        traversal is complete
+        
+        Only expired entries are touched (popped off the expiry heap), so
+        a frame costs O(finished * log n) rather than a scan of every packet.
+        
+        Args:
+            now: New simulation time (ms)
+        
+        Returns:
+            IDs of packets that finished their current link this frame
+        """
+        self.sim_time = now
+        expiry = self._expiry
+        animators = self.animators
+        finished_packets = []
+        
+        while expiry and expiry[0][0] <= now:
+            _, _, pkt_id, animator = heappop(expiry)
+            if animators.get(pkt_id) is animator:
+                del animators[pkt_id]
+                finished_packets.append(pkt_id)
+        
+        return finished_packets
     
-    def _update_all_packets(self) -> None:
-        """Update all active packet animations"""
-        with self._lock:
-            finished_packets = []
-            
-            for pkt_id, animator in list(self.animators.items()):
-                # Check if link traversal complete
-                if animator.update(self.sim_time):
-                    finished_packets.append(pkt_id)
-            
-            # Remove finished animators
-            for pkt_id in finished_packets:
-                del self.animators[pkt_id]
+    def _wake(self) -> None:
+        """
+        Leave the idle state before new animators are stamped
+        
+        sim_time is only refreshed every IDLE_WAIT while idle, so it is
+        brought up to date first to keep new packets from starting in
+        the past, and the next frame is brought forward.
+        """
+        if self.animators or not self.simulation_running or self.paused:
+            return
+        self.sim_time = self._clock()
+        if self._tick_id is not None:
+            self._cancel_tick()
+            self._next_deadline = time.monotonic() + self.frame_time / 1000.0
+            self._schedule_tick(self.frame_time / 1000.0)
+    
+    def _schedule(self, animator: PacketAnimator) -> None:
+        """Register an animator and its expiry"""
+        pkt_id = animator.packet.id
+        self.animators[pkt_id] = animator
+        heappush(self._expiry, (animator.end_time, next(self._expiry_seq), pkt_id, animator))
     
     def add_packet(self, packet: Packet, node_a_pos: Tuple[float, float],
                   node_b_pos: Tuple[float, float], link_latency: float) -> None:
@@ -292,47 +488,124 @@ class AnimatorWorker(threading.Thread):
             node_b_pos: Ending node position
             link_latency: Link latency in ms
         """
-        with self._lock:
+        self._wake()
+        self.active_packets[packet.id] = packet
+        animator = PacketAnimator(
+            packet=packet,
+            node_a_pos=node_a_pos,
+            node_b_pos=node_b_pos,
+            link_latency=link_latency,
+            start_time=self.sim_time,
+            speed_multiplier=self.speed_multiplier
+        )
+        self._schedule(animator)
+    
+    def add_packets(self, items: List[Tuple[Packet, Tuple[float, float],
+                                            Tuple[float, float], float]]) -> None:
+        """
+        Add several packets to the animation queue in one pass
+        
+        Args:
+            items: (packet, node_a_pos, node_b_pos, link_latency) per packet
+        """
+        if not items:
+            return
+        self._wake()
+        start_time = self.sim_time
+        speed = self.speed_multiplier
+        for packet, node_a_pos, node_b_pos, link_latency in items:
             self.active_packets[packet.id] = packet
-            animator = PacketAnimator(
+            self._schedule(PacketAnimator(
                 packet=packet,
                 node_a_pos=node_a_pos,
                 node_b_pos=node_b_pos,
                 link_latency=link_latency,
-                start_time=self.sim_time,
-                speed_multiplier=self.speed_multiplier
-            )
-            self.animators[packet.id] = animator
+                start_time=start_time,
+                speed_multiplier=speed
+            ))
     
-    def remove_packet(self, packet_id: str) -> None:
+    def remove_packet(self, packet_id: int) -> None:
         """Remove packet from animation"""
-        with self._lock:
-            if packet_id in self.active_packets:
-                del self.active_packets[packet_id]
-            if packet_id in self.animators:
-                del self.animators[packet_id]
+        self.active_packets.pop(packet_id, None)
+        self.animators.pop(packet_id, None)
+    
+    def move_endpoint(self, old_pos: Tuple[float, float],
+                      new_pos: Tuple[float, float]) -> int:
+        """
+        Re-anchor animations on links touching a moved node
+        
+        Animators keep their endpoint coordinates, so they are patched
+        here once per move instead of re-reading node positions every
+        frame.
+        
+        Args:
+            old_pos: Node position before the move
+            new_pos: Node position after the move
+        
+        Returns:
+            Number of animators updated
+        """
+        updated = 0
+        for animator in self.animators.values():
+            if animator.node_a_pos == old_pos:
+                animator.set_endpoints(new_pos, animator.node_b_pos)
+            elif animator.node_b_pos == old_pos:
+                animator.set_endpoints(animator.node_a_pos, new_pos)
+            else:
+                continue
+            updated += 1
+        return updated
     
     def pause(self) -> None:
         """Pause animation"""
         self.paused = True
+        self._cancel_tick()
     
     def resume(self) -> None:
         """Resume animation"""
+        if not self.paused:
+            return
         self.paused = False
+        if self.simulation_running and self._tick_id is None:
+            self._next_deadline = time.monotonic()
+            self._schedule_tick(0.0)
     
     def stop(self) -> None:
-        """Stop animation thread"""
+        """Stop the frame loop"""
         self.simulation_running = False
-        self.join(timeout=1.0)
+        self._cancel_tick()
     
-    def get_packet_position(self, packet_id: str) -> Optional[Tuple[float, float]]:
+    def get_packet_position(self, packet_id: int) -> Optional[Tuple[float, float]]:
         """Get current position of packet"""
-        with self._lock:
-            if packet_id in self.animators:
-                animator = self.animators[packet_id]
-                return animator.get_current_position(self.sim_time)
+        animator = self.animators.get(packet_id)
+        if animator is not None:
+            return animator.get_current_position(self.sim_time)
         return None
     
+    def get_positions(self) -> List[Tuple[int, float, float]]:
+        """
+        Get interpolated positions of all animating packets in one pass
+        
+        Returns:
+            List of (packet_id, x, y), same values as get_current_position()
+        """
+        now = self.sim_time
+        positions = []
+        append = positions.append
+        
+        for pkt_id, animator in self.animators.items():
+            progress = (now - animator.start_time) * animator.inv_span
+            if progress < 0.0:
+                progress = 0.0
+            elif progress > 1.0:
+                progress = 1.0
+            
+            append((pkt_id,
+                    animator.origin_x + animator.delta_x * progress,
+                    animator.origin_y + animator.delta_y * progress))
+        
+        return positions
+    
     def set_speed(self, multiplier: float) -> None:
         """Set animation speed multiplier (1.0 = real-time)"""
         self.speed_multiplier = max(0.1, multiplier)
@@ -354,16 +627,23 @@ class PacketManager:
         Args:
             network_manager: Reference to NetworkManager
             path_manager: Reference to PathManager
-            animator_worker: Reference to AnimatorWorker thread
+            animator_worker: Reference to AnimatorWorker
         """
         self.network_manager = network_manager
         self.path_manager = path_manager
         self.animator_worker = animator_worker
-        self.all_packets: List[Packet] = []
-        self.active_packets: Dict[str, Packet] = {}  # Currently moving
-        self.delivered_packets: List[Packet] = []
-        self.dropped_packets: List[Packet] = []
+        self.active_packets: Dict[int, Packet] = {}  # Currently moving
+        # Most recent finished packets; get_statistics() uses the counts
+        self.delivered_packets: Deque[Packet] = deque(maxlen=PACKET_HISTORY_SIZE)
+        self.dropped_packets: Deque[Packet] = deque(maxlen=PACKET_HISTORY_SIZE)
+        self.total_count = 0  # Packets created
+        self.delivered_count = 0
+        self.dropped_count = 0
         self.packet_counter = 0
+        
+        # Percentages of all packets, refreshed by _update_rates() on changes
+        self.delivery_rate = 0
+        self.drop_rate = 0
     
     def create_packet(self, source_id: str, dest_id: str, size: int = 1024) -> Optional[Packet]:
         """
@@ -386,7 +666,7 @@ class PacketManager:
             return None
         
         self.packet_counter += 1
-        packet_id = f"PKT{self.packet_counter:04d}"
+        packet_id = self.packet_counter
         current_time = self.animator_worker.sim_time
         
         # Get path using path manager
@@ -407,12 +687,71 @@ class PacketManager:
         )
         
         packet.current_node_id = source_id
+        packet.hop_schedule = self.path_manager.get_current_hop_schedule()
         
-        self.all_packets.append(packet)
+        self.total_count += 1
         self.active_packets[packet_id] = packet
+        self._update_rates()
         
         return packet
     
+    def create_packets_batch(self, source_id: str, dest_id: str,
+                            sizes: List[int]) -> List[Packet]:
+        """
+        Create several packets between the same pair of nodes
+        
+        Validates the nodes and resolves the path once for the whole batch.
+        
+        Args:
+            source_id: Source node ID
+            dest_id: Destination node ID
+            sizes: Packet size (bytes) for each packet to create
+        
+        Returns:
+            List of created packets (empty if invalid)
+        """
+        # Validate nodes
+        if source_id not in self.network_manager.nodes or \
+           dest_id not in self.network_manager.nodes:
+            return []
+        
+        if source_id == dest_id or not sizes:
+            return []
+        
+        # Get path once for all packets
+        if not self.path_manager.set_path(source_id, dest_id):
+            return []
+        
+        path_nodes = self.path_manager.get_current_path_nodes()
+        hop_schedule = self.path_manager.get_current_hop_schedule()
+        current_time = self.animator_worker.sim_time
+        
+        first_id = self.packet_counter + 1
+        self.packet_counter += len(sizes)
+        
+        packets = [
+            Packet(
+                id=packet_id,
+                source_node_id=source_id,
+                destination_node_id=dest_id,
+                creation_time=current_time,
+                sent_time=current_time,
+                size=size,
+                path=path_nodes,
+                state=PacketState.QUEUED
+            )
+            for packet_id, size in zip(range(first_id, self.packet_counter + 1), sizes)
+        ]
+        
+        active_packets = self.active_packets
+        for packet in packets:
+            packet.hop_schedule = hop_schedule
+            active_packets[packet.id] = packet
+        
+        self.total_count += len(packets)
+        self._update_rates()
+        return packets
+    
     def start_packet_animation(self, packet: Packet) -> bool:
         """
         Start animating a packet on first link
@@ -428,16 +767,12 @@ class PacketManager:
             return False
         
         # Get first link
-        node_a_id = packet.path[0]
-        node_b_id = packet.path[1]
-        
-        link = self.network_manager.get_link_by_nodes(node_a_id, node_b_id)
-        if not link:
+        hop = scheduled_hop(packet, 0, self.network_manager)
+        if hop is None:
             packet.mark_dropped()
             return False
         
-        node_a = self.network_manager.nodes[node_a_id]
-        node_b = self.network_manager.nodes[node_b_id]
+        link, node_a, node_b = hop
         
         packet.state = PacketState.IN_TRANSIT
         packet.current_link_index = 0
@@ -469,60 +804,110 @@ class PacketManager:
             # Reached destination
             packet.mark_delivered(current_time)
             self.delivered_packets.append(packet)
-            if packet.id in self.active_packets:
-                del self.active_packets[packet.id]
+            self.delivered_count += 1
+            self.active_packets.pop(packet.id, None)
+            self._update_rates()
             return True
         
         # Start animation on next link
-        if packet.path_index + 1 < len(packet.path):
-            node_a_id = packet.path[packet.path_index]
-            node_b_id = packet.path[packet.path_index + 1]
+        # move_to_next_link() returned False, so there is a next hop
+        hop = scheduled_hop(packet, packet.path_index, self.network_manager)
+        if hop:
+            link, node_a, node_b = hop
             
-            link = self.network_manager.get_link_by_nodes(node_a_id, node_b_id)
-            if link:
-                node_a = self.network_manager.nodes[node_a_id]
-                node_b = self.network_manager.nodes[node_b_id]
-                
-                packet.link_latency = link.latency
-                
-                self.animator_worker.add_packet(
-                    packet,
-                    (node_a.x, node_a.y),
-                    (node_b.x, node_b.y),
-                    link.latency
-                )
+            packet.link_latency = link.latency
+            
+            self.animator_worker.add_packet(
+                packet,
+                (node_a.x, node_a.y),
+                (node_b.x, node_b.y),
+                link.latency
+            )
         
         return False
     
+    def advance_batch(self, packets: List[Packet]) -> int:
+        """
+        Advance several packets that finished their link in the same frame
+        
+        Same per-packet behaviour as advance_packet(), with lookups bound
+        once and the next-link animations added to the animator in one call.
+        
+        Args:
+            packets: Packets to advance
+        
+        Returns:
+            Number of packets that reached their destination
+        """
+        current_time = self.animator_worker.sim_time
+        delivered_packets = self.delivered_packets
+        active_packets = self.active_packets
+        network_manager = self.network_manager
+        items = []
+        delivered = 0
+        
+        for packet in packets:
+            if packet.move_to_next_link(current_time):
+                # Reached destination
+                packet.mark_delivered(current_time)
+                delivered_packets.append(packet)
+                active_packets.pop(packet.id, None)
+                delivered += 1
+                continue
+            
+            # Queue animation on next link
+            # move_to_next_link() returned False, so there is a next hop
+            hop = scheduled_hop(packet, packet.path_index, network_manager)
+            if hop:
+                link, node_a, node_b = hop
+                packet.link_latency = link.latency
+                items.append((packet, (node_a.x, node_a.y),
+                              (node_b.x, node_b.y), link.latency))
+        
+        if delivered:
+            self.delivered_count += delivered
+            self._update_rates()
+        if items:
+            self.animator_worker.add_packets(items)
+        return delivered
+    
     def drop_packet(self, packet: Packet) -> None:
         """Mark packet as dropped"""
         packet.mark_dropped()
         self.dropped_packets.append(packet)
-        if packet.id in self.active_packets:
-            del self.active_packets[packet.id]
+        self.dropped_count += 1
+        self.active_packets.pop(packet.id, None)
+        self._update_rates()
         self.animator_worker.remove_packet(packet.id)
     
+    def _update_rates(self) -> None:
+        """Recompute delivery/drop rates after a packet is created or finishes"""
+        total = self.total_count
+        if total > 0:
+            self.delivery_rate = self.delivered_count / total * 100
+            self.drop_rate = self.dropped_count / total * 100
+        else:
+            self.delivery_rate = self.drop_rate = 0
+    
     def get_statistics(self) -> dict:
         """Get packet statistics"""
-        total = len(self.all_packets)
-        delivered = len(self.delivered_packets)
-        dropped = len(self.dropped_packets)
-        active = len(self.active_packets)
-        
         return {
-            "total_packets": total,
-            "delivered": delivered,
-            "dropped": dropped,
-            "active": active,
-            "delivery_rate": (delivered / total * 100) if total > 0 else 0,
-            "drop_rate": (dropped / total * 100) if total > 0 else 0,
+            "total_packets": self.total_count,
+            "delivered": self.delivered_count,
+            "dropped": self.dropped_count,
+            "active": len(self.active_packets),
+            "delivery_rate": self.delivery_rate,
+            "drop_rate": self.drop_rate,
         }
     
     def clear_all(self) -> None:
         """Clear all packets"""
-        self.all_packets.clear()
         self.active_packets.clear()
         self.delivered_packets.clear()
         self.dropped_packets.clear()
+        self.total_count = 0
+        self.delivered_count = 0
+        self.dropped_count = 0
         self.packet_counter = 0
+        self._update_rates()
 
@@ -1,5 +1,6 @@
 import networkx as nx
-from typing import List, Dict, Optional, Tuple
+from collections import deque
+from typing import List, Dict, Optional, Tuple, Deque
 from dataclasses import dataclass, field
 
 # ============================================================================
@@ -9,8 +10,19 @@ from dataclasses import dataclass, field
 class DijkstraRouter:
     """
     Computes shortest paths using Dijkstra's algorithm via NetworkX
+    
+    Computed paths are memoized per (start, end, metric), and latency
+    routing keeps one shortest-path tree (predecessor map) per source so
+    a single Dijkstra run answers every destination from that source.
+    Every suffix of a computed path is itself a shortest path to the same
+    destination, so it is memoized too and serves later queries starting
+    from any node along the way. All of this is kept until invalidate()
+    is called, which the owner must do whenever the graph's nodes, edges
+    or weights change.
     """
     
+    PATH_CACHE_SIZE = 4096  # Oldest entries are evicted beyond this
+    
     def __init__(self, graph: nx.Graph):
         """
         Initialize router with a NetworkX graph
@@ -19,6 +31,41 @@ class DijkstraRouter:
             graph: NetworkX Graph object
         """
         self.graph = graph
+        self.graph_version = 0  # Bumped by invalidate()
+        self._path_cache: Dict[Tuple[str, str, str], Optional[Tuple[str, ...]]] = {}
+        self._predecessors: Dict[str, Dict[str, List[str]]] = {}  # source -> tree
+    
+    def invalidate(self) -> None:
+        """Drop memoized paths after the graph changed"""
+        self._path_cache.clear()
+        self._predecessors.clear()
+        self.graph_version += 1
+    
+    def _latency_path(self, start_node_id: str, end_node_id: str) -> List[str]:
+        """
+        Minimum-latency path read off the source's shortest-path tree
+        
+        Raises:
+            nx.NetworkXNoPath: If end_node_id is unreachable
+        """
+        pred = self._predecessors.get(start_node_id)
+        if pred is None:
+            pred, _ = nx.dijkstra_predecessor_and_distance(
+                self.graph, start_node_id, weight='weight'
+            )
+            self._predecessors[start_node_id] = pred
+        
+        if end_node_id not in pred:
+            raise nx.NetworkXNoPath(f"No path to {end_node_id}")
+        
+        # Walk predecessors back to the source (first one on ties)
+        path = [end_node_id]
+        node = end_node_id
+        while node != start_node_id:
+            node = pred[node][0]
+            path.append(node)
+        path.reverse()
+        return path
     
     def compute_shortest_path(self, start_node_id: str, end_node_id: str, 
                             metric: str = "latency") -> Optional[List[str]]:
@@ -48,13 +95,16 @@ class DijkstraRouter:
         if start_node_id == end_node_id:
             raise ValueError("Source and destination must be different")
         
+        key = (start_node_id, end_node_id, metric)
+        cache = self._path_cache
+        if key in cache:
+            path = cache[key]
+            return list(path) if path is not None else None
+        
         try:
             if metric == "latency":
                 # Use edge weights (latency) - Dijkstra finds minimum latency path
-                path = nx.shortest_path(self.graph, 
-                                       source=start_node_id,
-                                       target=end_node_id,
-                                       weight='weight')  # weight = latency
+                path = self._latency_path(start_node_id, end_node_id)
             elif metric == "hops":
                 # Ignore weights - find path with fewest hops
                 path = nx.shortest_path(self.graph,
@@ -62,12 +112,34 @@ class DijkstraRouter:
                                        target=end_node_id)
             else:
                 raise ValueError(f"Unknown metric: {metric}")
-            
-            return path
         
         except nx.NetworkXNoPath:
             # No path exists between nodes
-            return None
+            path = None
+        
+        if path is None:
+            cache[key] = None
+        else:
+            cached = tuple(path)
+            cache[key] = cached
+            # Suffixes from intermediate nodes (keep existing entries)
+            for i in range(1, len(cached) - 1):
+                cache.setdefault((cached[i], end_node_id, metric), cached[i:])
+        
+        while len(cache) > self.PATH_CACHE_SIZE:
+            del cache[next(iter(cache))]  # Evict the oldest entries
+        return path
+    
+    def _path_edges(self, path: List[str]) -> List[Optional[dict]]:
+        """
+        Edge attribute dicts for each hop of a path (None where no edge)
+        
+        Reads the graph's adjacency directly; G.get_edge_data() goes
+        through read-only view wrappers on every call. The dicts are
+        only read, never mutated.
+        """
+        adj = self.graph._adj
+        return [adj.get(node_a, {}).get(node_b) for node_a, node_b in zip(path, path[1:])]
     
     def get_path_cost(self, path: List[str]) -> float:
         """
@@ -86,19 +158,10 @@ class DijkstraRouter:
         if len(path) < 2:
             return 0.0
         
-        total_cost = 0.0
-        
-        # Sum up latencies between consecutive nodes
-        for i in range(len(path) - 1):
-            node_a = path[i]
-            node_b = path[i + 1]
-            
-            # Get edge weight (latency)
-            edge_data = self.graph.get_edge_data(node_a, node_b)
-            if edge_data and 'weight' in edge_data:
-                total_cost += edge_data['weight']
-        
-        return total_cost
+        # Sum up latencies (edge weights) between consecutive nodes
+        edges = self._path_edges(path)
+        return sum((edge_data['weight'] for edge_data in edges
+                    if edge_data and 'weight' in edge_data), 0.0)
     
     def get_bottleneck_bandwidth(self, path: List[str]) -> float:
         """
@@ -118,17 +181,11 @@ class DijkstraRouter:
         if len(path) < 2:
             return 0.0
         
-        min_bandwidth = float('inf')
-        
         # Check bandwidth on all links in path
-        for i in range(len(path) - 1):
-            node_a = path[i]
-            node_b = path[i + 1]
-            
-            edge_data = self.graph.get_edge_data(node_a, node_b)
-            if edge_data and 'bandwidth' in edge_data:
-                bandwidth = edge_data['bandwidth']
-                min_bandwidth = min(min_bandwidth, bandwidth)
+        edges = self._path_edges(path)
+        min_bandwidth = min((edge_data['bandwidth'] for edge_data in edges
+                             if edge_data and 'bandwidth' in edge_data),
+                            default=float('inf'))
         
         if min_bandwidth == float('inf'):
             return 0.0
@@ -153,7 +210,10 @@ class DijkstraRouter:
                 "bottleneck_bandwidth": 50.0,
                 "throughput": 50.0,
                 "links": [Link, Link, Link],  # if network_manager provided
+                "hop_schedule": [(Link, Node, Node), ...],  # likewise
             }
+            hop_schedule has one (link, node_a, node_b) entry per hop,
+            None where no link exists
         """
         if len(path) < 2:
             return {
@@ -162,20 +222,41 @@ class DijkstraRouter:
                 "total_latency": 0.0,
                 "bottleneck_bandwidth": 0.0,
                 "throughput": 0.0,
-                "links": []
+                "links": [],
+                "hop_schedule": []
             }
         
-        total_latency = self.get_path_cost(path)
-        bottleneck_bw = self.get_bottleneck_bandwidth(path)
         hop_count = len(path) - 1  # Number of hops = edges = nodes - 1
         
-        # Gather Link objects if network_manager provided
+        hops = list(zip(path, path[1:]))
+        
+        # One pass over the hops for latency sum and bottleneck bandwidth
+        total_latency = 0.0
+        bottleneck_bw = float('inf')
+        adj = self.graph._adj
+        
+        for node_a, node_b in hops:
+            edge_data = adj.get(node_a, {}).get(node_b)
+            if edge_data:
+                if 'weight' in edge_data:
+                    total_latency += edge_data['weight']
+                bandwidth = edge_data.get('bandwidth')
+                if bandwidth is not None and bandwidth < bottleneck_bw:
+                    bottleneck_bw = bandwidth
+        
+        # Link objects and hop schedule if network_manager provided; the
+        # (a, b) hop tuples are link_index keys, so map() resolves them
         links = []
+        hop_schedule = []
         if network_manager:
-            for i in range(len(path) - 1):
-                link = network_manager.get_link_by_nodes(path[i], path[i + 1])
-                if link:
-                    links.append(link)
+            nodes = network_manager.nodes
+            hop_links = list(map(network_manager.link_index.get, hops))
+            links = [link for link in hop_links if link]
+            hop_schedule = [(link, nodes[node_a], nodes[node_b]) if link else None
+                            for link, (node_a, node_b) in zip(hop_links, hops)]
+        
+        if bottleneck_bw == float('inf'):
+            bottleneck_bw = 0.0
         
         return {
             "path_nodes": path,
@@ -184,6 +265,7 @@ class DijkstraRouter:
             "bottleneck_bandwidth": bottleneck_bw,
             "throughput": bottleneck_bw,  # Throughput = bottleneck bandwidth
             "links": links,
+            "hop_schedule": hop_schedule,
         }
 
 
@@ -191,18 +273,21 @@ class DijkstraRouter:
 # 2. PATH MANAGER
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PathInfo:
     """Data class for storing path information"""
     source_id: str
     destination_id: str
-    path_nodes: List[str]
+    path_nodes: Tuple[str, ...]  # Immutable, shared by every packet on this route
     hop_count: int
     total_latency: float
     bottleneck_bandwidth: float
     throughput: float
     links: List = field(default_factory=list)
+    # Per-hop (link, node_a, node_b), None where no link; shared by packets
+    hop_schedule: List[Optional[tuple]] = field(default_factory=list, repr=False)
     timestamp: float = 0.0
+    path_str: str = ""  # Display form of path_nodes, joined once
     
     def to_dict(self) -> dict:
         """Convert to dictionary"""
@@ -222,17 +307,22 @@ class PathManager:
     Manages path computation and storage
     """
     
-    def __init__(self, network_manager):
+    def __init__(self, network_manager, history_size: int = 256):
         """
         Initialize PathManager
         
         Args:
             network_manager: Reference to NetworkManager instance
+            history_size: Most recent paths kept in the history
         """
         self.network_manager = network_manager
         self.router = DijkstraRouter(network_manager.graph)
         self.current_path: Optional[PathInfo] = None
-        self.path_history: List[PathInfo] = []
+        self.path_history: Deque[PathInfo] = deque(maxlen=history_size)
+        
+        # (source, dest) -> PathInfo (None = no path), valid for one topology version
+        self._path_cache: Dict[Tuple[str, str], Optional[PathInfo]] = {}
+        self._path_cache_version = -1
     
     def set_path(self, source_id: str, dest_id: str) -> bool:
         """
@@ -245,53 +335,74 @@ class PathManager:
         Returns:
             True if path found, False otherwise
         """
-        try:
-            # Update router with latest graph
-            self.router.graph = self.network_manager.graph
-            
-            # Compute shortest path
-            path_nodes = self.router.compute_shortest_path(
-                source_id, dest_id, metric="latency"
-            )
-            
-            if path_nodes is None:
-                self.current_path = None
+        version = self.network_manager.topology_version
+        if version != self._path_cache_version:
+            self._path_cache.clear()
+            self._path_cache_version = version
+            self.router.invalidate()
+        
+        key = (source_id, dest_id)
+        if key in self._path_cache:
+            self.current_path = self._path_cache[key]
+            if self.current_path is None:
                 return False
-            
-            # Get detailed path information
-            path_dict = self.router.get_path_info(
-                path_nodes, 
-                self.network_manager
-            )
-            
-            # Create PathInfo object
-            self.current_path = PathInfo(
-                source_id=source_id,
-                destination_id=dest_id,
-                path_nodes=path_nodes,
-                hop_count=path_dict["hop_count"],
-                total_latency=path_dict["total_latency"],
-                bottleneck_bandwidth=path_dict["bottleneck_bandwidth"],
-                throughput=path_dict["throughput"],
-                links=path_dict["links"]
-            )
-            
-            # Add to history
-            self.path_history.append(self.current_path)
-            
+            # Repeated sends on one route share a single history entry
+            history = self.path_history
+            if not history or history[-1] is not self.current_path:
+                history.append(self.current_path)
             return True
         
-        except (ValueError, nx.NetworkXError) as e:
-            print(f"Path computation error: {e}")
+        # Requests the router would reject; checked up front so the
+        # computation below cannot raise
+        nodes = self.network_manager.nodes
+        if source_id == dest_id or source_id not in nodes or dest_id not in nodes:
+            self.current_path = None
+            return False
+        
+        # Compute shortest path
+        path_nodes = self.router.compute_shortest_path(
+            source_id, dest_id, metric="latency"
+        )
+        
+        if path_nodes is None:
             self.current_path = None
+            self._path_cache[key] = None
             return False
+        
+        path_nodes = tuple(path_nodes)
+        
+        # Get detailed path information
+        path_dict = self.router.get_path_info(
+            path_nodes, 
+            self.network_manager
+        )
+        
+        # Create PathInfo object
+        self.current_path = PathInfo(
+            source_id=source_id,
+            destination_id=dest_id,
+            path_nodes=path_nodes,
+            hop_count=path_dict["hop_count"],
+            total_latency=path_dict["total_latency"],
+            bottleneck_bandwidth=path_dict["bottleneck_bandwidth"],
+            throughput=path_dict["throughput"],
+            links=path_dict["links"],
+            hop_schedule=path_dict["hop_schedule"],
+            path_str=" → ".join(path_nodes)
+        )
+        self._path_cache[key] = self.current_path
+        
+        # Add to history
+        self.path_history.append(self.current_path)
+        
+        return True
     
     def get_current_path(self) -> Optional[PathInfo]:
         """Get current path object"""
         return self.current_path
     
-    def get_current_path_nodes(self) -> Optional[List[str]]:
-        """Get current path as list of node IDs"""
+    def get_current_path_nodes(self) -> Optional[Tuple[str, ...]]:
+        """Get current path as a (shared, read-only) tuple of node IDs"""
         if self.current_path:
             return self.current_path.path_nodes
         return None
@@ -302,6 +413,12 @@ class PathManager:
             return self.current_path.to_dict()
         return None
     
+    def get_current_hop_schedule(self) -> Optional[List[Optional[tuple]]]:
+        """Get the (shared, read-only) hop schedule of the current path"""
+        if self.current_path:
+            return self.current_path.hop_schedule
+        return None
+    
     def get_path_links(self) -> Optional[List]:
         """Get list of Link objects in current path"""
         if self.current_path:
@@ -313,8 +430,8 @@ class PathManager:
         self.current_path = None
     
     def get_history(self) -> List[PathInfo]:
-        """Get all computed paths in history"""
-        return self.path_history
+        """Get the most recent computed paths, oldest first"""
+        return list(self.path_history)
 
 
 # ============================================================================
@@ -335,6 +452,8 @@ class MetricsDisplay:
         """
         self.label = label_widget
         self.current_path_info = None
+        self._rendered = False           # Whether the label shows anything yet
+        self._last_rendered_info = None  # PathInfo the label currently shows
     
     def update_path_display(self, path_info: Optional[PathInfo]) -> None:
         """
@@ -348,20 +467,24 @@ class MetricsDisplay:
     
     def _refresh_display(self) -> None:
         """Refresh the metrics display"""
-        if not self.current_path_info:
-            self.label.config(text="No path selected")
-            return
-        
         info = self.current_path_info
         
-        # Format path nodes nicely
-        path_str = " → ".join(info.path_nodes)
+        # PathInfo objects are shared and never modified, so the same
+        # object means the label already shows the right text
+        if self._rendered and info is self._last_rendered_info:
+            return
+        self._rendered = True
+        self._last_rendered_info = info
+        
+        if not info:
+            self.label.config(text="No path selected")
+            return
         
         display_text = (
             f"═══════════════════════════════════════════\n"
             f"📍 CURRENT PATH\n"
             f"═══════════════════════════════════════════\n"
-            f"Path: {path_str}\n"
+            f"Path: {info.path_str}\n"
             f"Hops: {info.hop_count}\n\n"
             f"═══════════════════════════════════════════\n"
             f"📊 PATH METRICS\n"